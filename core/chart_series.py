@@ -0,0 +1,59 @@
+import calendar
+import datetime
+import math
+from collections import OrderedDict, namedtuple
+from data.month_cache import month_cache, shift_month
+from data.rollup import metric_value
+
+MAX_POINTS = 31
+MAX_CACHED_SERIES = 64
+
+Series = namedtuple("Series", ["values", "slots"])
+
+_series_cache = OrderedDict()
+
+def range_months(year: int, month: int, months: int = 1) -> list:
+    return [shift_month(year, month, delta) for delta in range(1 - months, 1)]
+
+def downsample(values: list, slots: int, max_points: int = MAX_POINTS) -> Series:
+    if slots <= max_points:
+        return Series(tuple(values), slots)
+
+    bucket = math.ceil(slots / max_points)
+    points = []
+    for start in range(0, len(values), bucket):
+        recorded = [value for value in values[start:start + bucket] if value is not None]
+        points.append(sum(recorded) / len(recorded) if recorded else None)
+    return Series(tuple(points), math.ceil(slots / bucket))
+
+def _collect(data_key: str, months: list, month_data: list, today: datetime.date) -> tuple:
+    values = []
+    slots = 0
+    for (year, month), summaries in zip(months, month_data):
+        for day in range(1, calendar.monthrange(year, month)[1] + 1):
+            slots += 1
+            date_obj = datetime.date(year, month, day)
+            if date_obj > today:
+                continue
+            values.append(metric_value(summaries.get(date_obj.isoformat(), {}), data_key))
+    return values, slots
+
+def build_series(data_key: str, year: int, month: int, months: int = 1,
+                 today: datetime.date = None, max_points: int = MAX_POINTS) -> Series:
+    today = today or datetime.date.today()
+    span = range_months(year, month, months)
+    key = (data_key, year, month, months, today, max_points,
+           tuple(month_cache.version(y, m) for y, m in span))
+
+    cached = _series_cache.get(key)
+    if cached is not None:
+        _series_cache.move_to_end(key)
+        return cached
+
+    month_data = [month_cache.get(y, m) for y, m in span]
+    values, slots = _collect(data_key, span, month_data, today)
+    series = downsample(values, slots, max_points)
+    _series_cache[key] = series
+    while len(_series_cache) > MAX_CACHED_SERIES:
+        _series_cache.popitem(last=False)
+    return series
@@ -1,29 +1,367 @@
+import time
+import asyncio
+import weakref
+from collections import deque
+
 _subscribers = {}
+_debug_sources = {}
+
+SLOW_HANDLER_MS = 50.0
+LATENCY_SAMPLES = 256
+
+_instrumentation = {"enabled": True, "slow_ms": SLOW_HANDLER_MS}
+_publish_counts = {}
+_handler_stats = {}
+
+_batching = {"loop": None, "window": 0.0}
+_pending = {}
+_flush_handle = None
+
+_ui_loop = {"loop": None, "drain_scheduled": False}
+_inbox = deque()
 
 USER_DATA_SAVED = "user_data_saved"
 WATER_ADDED = "water_added"
 LANGUAGE_CHANGED = "language_changed"
 SLEEP_ADDED = "sleep_added"
 EXERCISE_ADDED = "exercise_added"
+REMINDER_DUE = "reminder_due"
+BACKGROUND_CHANGED = "background_changed"
+
+class ChangeSet(dict):
+
+    def __init__(self, values=None, snapshot=None):
+        super().__init__(values or {})
+        self.snapshot = snapshot if snapshot is not None else dict(self)
+
+    @property
+    def changed_keys(self) -> frozenset:
+        return frozenset(self)
+
+    def touches(self, keys) -> bool:
+        return not self.keys().isdisjoint(keys)
+
+def _make_ref(callback):
+    if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+        try:
+            return weakref.WeakMethod(callback), weakref.ref(callback.__self__)
+        except TypeError:
+            pass
+    return (lambda: callback), None
+
+def _handler_name(callback) -> str:
+    owner = getattr(callback, "__self__", None)
+    func = getattr(callback, "__func__", callback)
+    name = getattr(func, "__qualname__", None) or repr(func)
+    if owner is not None and "." not in name:
+        name = f"{type(owner).__name__}.{name}"
+    return name
+
+class HandlerStats:
+
+    def __init__(self, event_type: str, name: str):
+        self.event_type = event_type
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_error = None
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, elapsed_ms: float, error=None):
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.samples.append(elapsed_ms)
+        if error is not None:
+            self.errors += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+
+    def percentile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> dict:
+        return {
+            "event": self.event_type,
+            "handler": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "p95_ms": round(self.percentile(0.95), 3),
+            "max_ms": round(self.max_ms, 3),
+            "last_error": self.last_error,
+        }
+
+class Subscription:
 
-def subscribe(event_type: str, callback):
+    def __init__(self, event_type: str, callback, keys=None):
+        self.event_type = event_type
+        self.keys = frozenset(keys) if keys else None
+        self._callback_ref, self._owner_ref = _make_ref(callback)
+        self.name = _handler_name(callback)
+
+    @property
+    def callback(self):
+        return self._callback_ref()
+
+    @property
+    def alive(self) -> bool:
+        return self.callback is not None
+
+    def owned_by(self, owner) -> bool:
+        return self._owner_ref is not None and self._owner_ref() is owner
+
+    def cancel(self):
+        entries = _subscribers.get(self.event_type)
+        if entries and self in entries:
+            entries.remove(self)
+
+class WeakCallbackSet:
+
+    def __init__(self):
+        self._refs = {}
+
+    def _key(self, callback):
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return (id(callback.__self__), callback.__func__)
+        return callback
+
+    def add(self, callback):
+        self._refs[self._key(callback)] = _make_ref(callback)[0]
+
+    def discard(self, callback):
+        self._refs.pop(self._key(callback), None)
+
+    def __iter__(self):
+        for key, ref in list(self._refs.items()):
+            callback = ref()
+            if callback is None:
+                self._refs.pop(key, None)
+            else:
+                yield callback
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+def subscribe(event_type: str, callback, keys=None) -> Subscription:
     if event_type not in _subscribers:
         _subscribers[event_type] = []
-    _subscribers[event_type].append(callback)
+    subscription = Subscription(event_type, callback, keys)
+    _subscribers[event_type].append(subscription)
+    return subscription
 
 def unsubscribe(event_type: str, callback):
     if event_type in _subscribers:
+        _subscribers[event_type] = [
+            entry for entry in _subscribers[event_type]
+            if entry.alive and entry.callback != callback
+        ]
+
+def release(owner):
+    for event_type, entries in _subscribers.items():
+        _subscribers[event_type] = [
+            entry for entry in entries if entry.alive and not entry.owned_by(owner)
+        ]
+
+def set_instrumentation(enabled: bool = True, slow_ms: float = None):
+    _instrumentation["enabled"] = enabled
+    if slow_ms is not None:
+        _instrumentation["slow_ms"] = slow_ms
+
+def reset_stats():
+    _publish_counts.clear()
+    _handler_stats.clear()
+
+def get_stats() -> dict:
+    handlers = sorted(
+        (stats.to_dict() for stats in _handler_stats.values()),
+        key=lambda item: item["total_ms"], reverse=True
+    )
+    return {
+        "publishes": dict(_publish_counts),
+        "handlers": handlers,
+        "slow_ms": _instrumentation["slow_ms"],
+    }
+
+def _run_handler(entry, callback, event_type: str, args: tuple, kwargs: dict):
+    if not _instrumentation["enabled"]:
         try:
-            _subscribers[event_type].remove(callback)
-        except ValueError:
+            callback(*args, **kwargs)
+        except Exception:
             pass
+        return
+
+    error = None
+    started = time.perf_counter()
+    try:
+        callback(*args, **kwargs)
+    except Exception as e:
+        error = e
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    key = (event_type, entry.name)
+    stats = _handler_stats.get(key)
+    if stats is None:
+        stats = _handler_stats[key] = HandlerStats(event_type, entry.name)
+    stats.record(elapsed_ms, error)
+
+    if elapsed_ms >= _instrumentation["slow_ms"]:
+        print(f"Slow event handler: {entry.name} took {elapsed_ms:.1f} ms on {event_type}")
+
+def register_debug_source(name: str, counter):
+    _debug_sources[name] = counter
+
+def debug_report() -> dict:
+    report = {}
+    for event_type, entries in _subscribers.items():
+        _subscribers[event_type] = [entry for entry in entries if entry.alive]
+        report[event_type] = len(_subscribers[event_type])
+    for name, counter in _debug_sources.items():
+        try:
+            report[name] = counter()
+        except Exception:
+            report[name] = None
+    return report
+
+def _is_loop_thread(loop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+def bind_loop(loop=None):
+    _ui_loop["loop"] = loop or asyncio.get_running_loop()
+
+def _bound_loop():
+    loop = _ui_loop["loop"]
+    if loop is None or loop.is_closed():
+        return None
+    return loop
+
+def _drain_inbox():
+    _ui_loop["drain_scheduled"] = False
+    while _inbox:
+        try:
+            kind, target, args, kwargs = _inbox.popleft()
+        except IndexError:
+            break
+        if kind == "event":
+            _publish_in_loop(target, args, kwargs)
+        else:
+            try:
+                target(*args, **kwargs)
+            except Exception as e:
+                print(f"Error in loop callback {_handler_name(target)}: {e}")
+
+def _enqueue(kind: str, target, args: tuple, kwargs: dict) -> bool:
+    loop = _bound_loop()
+    if loop is None:
+        return False
+    _inbox.append((kind, target, args, kwargs))
+    if not _ui_loop["drain_scheduled"]:
+        _ui_loop["drain_scheduled"] = True
+        try:
+            loop.call_soon_threadsafe(_drain_inbox)
+        except RuntimeError:
+            _ui_loop["drain_scheduled"] = False
+            return False
+    return True
+
+def publish_threadsafe(event_type: str, *args, **kwargs):
+    loop = _bound_loop()
+    if loop is None or _is_loop_thread(loop) or not _enqueue("event", event_type, args, kwargs):
+        _publish_in_loop(event_type, args, kwargs)
+
+def call_in_loop(callback, *args, **kwargs) -> bool:
+    loop = _bound_loop()
+    if loop is not None and _is_loop_thread(loop):
+        callback(*args, **kwargs)
+        return True
+    return _enqueue("call", callback, args, kwargs)
+
+def enable_batching(loop=None, window: float = 0.0):
+    _batching["loop"] = loop or asyncio.get_running_loop()
+    _batching["window"] = max(0.0, window)
+
+def disable_batching():
+    flush()
+    _batching["loop"] = None
+
+def _in_batching_loop() -> bool:
+    loop = _batching["loop"]
+    if loop is None or loop.is_closed():
+        return False
+    return _is_loop_thread(loop)
+
+def _merge(payloads: list, args: tuple, kwargs: dict):
+    old_args, old_kwargs = payloads[-1]
+    if args and old_args and isinstance(args[0], ChangeSet) and isinstance(old_args[0], ChangeSet):
+        merged = ChangeSet(old_args[0], snapshot=args[0].snapshot)
+        merged.update(args[0])
+        payloads[-1] = ((merged,) + args[1:], {**old_kwargs, **kwargs})
+    elif args or kwargs or old_args or old_kwargs:
+        payloads.append((args, kwargs))
+
+def _schedule_flush():
+    global _flush_handle
+    if _flush_handle is not None:
+        return
+    loop = _batching["loop"]
+    if _batching["window"] > 0:
+        _flush_handle = loop.call_later(_batching["window"], flush)
+    else:
+        _flush_handle = loop.call_soon(flush)
+
+def _deliver(event_type: str, args: tuple, kwargs: dict):
+    changes = args[0] if args and isinstance(args[0], ChangeSet) else None
+    entries = _subscribers.get(event_type, [])
+    if not all(entry.alive for entry in entries):
+        entries[:] = [entry for entry in entries if entry.alive]
+
+    for entry in list(entries):
+        if entry.keys is not None and changes is not None and not changes.touches(entry.keys):
+            continue
+        callback = entry.callback
+        if callback is None:
+            continue
+        _run_handler(entry, callback, event_type, args, kwargs)
+
+def flush():
+    global _flush_handle, _pending
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+
+    pending, _pending = _pending, {}
+    for event_type, payloads in pending.items():
+        for args, kwargs in payloads:
+            _deliver(event_type, args, kwargs)
 
 def publish(event_type: str, *args, **kwargs):
+    loop = _bound_loop()
+    if loop is not None and not _is_loop_thread(loop) and _enqueue("event", event_type, args, kwargs):
+        return
+
+    _publish_in_loop(event_type, args, kwargs)
+
+def _publish_in_loop(event_type: str, args: tuple, kwargs: dict):
+    if _instrumentation["enabled"]:
+        _publish_counts[event_type] = _publish_counts.get(event_type, 0) + 1
     if event_type not in _subscribers:
         return
 
-    for callback in list(_subscribers[event_type]):
-        try:
-            callback(*args, **kwargs)
-        except Exception:
-            pass
+    if not _in_batching_loop():
+        _deliver(event_type, args, kwargs)
+        return
+
+    if event_type in _pending:
+        _merge(_pending[event_type], args, kwargs)
+    else:
+        _pending[event_type] = [(args, kwargs)]
+    _schedule_flush()
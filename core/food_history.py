@@ -0,0 +1,108 @@
+import time
+from collections import OrderedDict
+from data import database
+
+MAX_ENTRIES = 200
+SHORT_QUERY_LENGTH = 2
+HALF_LIFE_DAYS = 14
+MAX_BOOST = 25
+
+def _food_key(food: dict) -> str:
+    return (food.get("name") or "").strip().lower()
+
+class FoodHistoryIndex:
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(FoodHistoryIndex, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        if hasattr(self, '_initialized'):
+            return
+        self._initialized = True
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._loaded = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            stored = database.get_food_history(self.max_entries)
+        except Exception as e:
+            print(f"Error loading food history: {e}")
+            return
+
+        for entry in reversed(stored):
+            food = entry.get("food")
+            if not isinstance(food, dict):
+                continue
+            key = _food_key(food)
+            if key:
+                self._entries[key] = {
+                    "count": int(entry.get("count", 1)),
+                    "last_used": float(entry.get("last_used", 0)),
+                    "food": food
+                }
+
+    def _save(self, key: str, entry: dict, evicted: str = None):
+        try:
+            database.save_food_history_entry(key, entry["count"], entry["last_used"], entry["food"], evicted)
+        except Exception as e:
+            print(f"Error saving food history: {e}")
+
+    def record(self, food: dict):
+        if not food:
+            return
+        key = _food_key(food)
+        if not key:
+            return
+        self._ensure_loaded()
+
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            entry = {"count": 0, "last_used": 0, "food": food}
+        entry["count"] += 1
+        entry["last_used"] = time.time()
+        entry["food"] = food
+        self._entries[key] = entry
+
+        evicted = None
+        if len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+
+        self._save(key, entry, evicted)
+
+    def _frecency(self, entry: dict, now: float) -> float:
+        age_days = max(0.0, now - entry["last_used"]) / 86400
+        return entry["count"] * 0.5 ** (age_days / HALF_LIFE_DAYS)
+
+    def suggest(self, query: str = "", limit: int = 10) -> list:
+        self._ensure_loaded()
+        query_lower = (query or "").strip().lower()
+        now = time.time()
+
+        matches = []
+        for key, entry in self._entries.items():
+            if query_lower and query_lower not in key:
+                continue
+            rank = self._frecency(entry, now)
+            if query_lower and key.startswith(query_lower):
+                rank *= 2
+            matches.append((rank, entry["food"]))
+
+        matches.sort(key=lambda x: x[0], reverse=True)
+        return [food for rank, food in matches[:limit]]
+
+    def boost(self, name: str) -> int:
+        self._ensure_loaded()
+        entry = self._entries.get((name or "").strip().lower())
+        if entry is None:
+            return 0
+        return min(MAX_BOOST, int(round(5 + 5 * self._frecency(entry, time.time()))))
+
+food_history = FoodHistoryIndex()
@@ -0,0 +1,85 @@
+import threading
+from core.nutrients import NUTRIENT_KEYS, nutrients_to_level1
+from core.food_similarity import get_nutrient_matrix, NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+OVERSHOOT_PENALTY = 0.5
+
+_cache_lock = threading.Lock()
+_cached_scores = None
+
+def goal_vectors(goals: dict) -> tuple:
+    mins, ideals, maxs = [], [], []
+    for key in NUTRIENT_KEYS:
+        goal_range = goals.get(key, {}).get("range", [0, 0, 0])
+        mins.append(float(goal_range[0]))
+        ideals.append(float(goal_range[1]))
+        maxs.append(float(goal_range[2]))
+    return mins, ideals, maxs
+
+def _goals_key(goals: dict) -> tuple:
+    return tuple(tuple(v) for v in goal_vectors(goals))
+
+class ServingScoreMatrix:
+
+    def __init__(self, matrix, goals: dict):
+        self.matrix = matrix
+        self.key = (matrix.version, _goals_key(goals))
+
+        mins, ideals, maxs = goal_vectors(goals)
+        self.mins = np.asarray(mins)
+        self.maxs = np.asarray(maxs)
+        self.scale = np.where(np.asarray(ideals) > 0, np.asarray(ideals), 1.0)
+
+        self.per_serving = matrix.raw * (matrix.serving_grams[:, None] / 100.0)
+        self.normalized = self.per_serving / self.scale
+        self.fills_gap = self.mins > 0
+
+    def recommend(self, totals, k: int = 5) -> list:
+        totals = np.asarray(totals, dtype=np.float64)
+        gap = np.where(self.fills_gap, np.clip(self.scale - totals, 0, None), 0.0) / self.scale
+        if not gap.any():
+            return []
+
+        room = self.maxs - totals
+        within_limits = (self.per_serving <= np.where(room > 0, room, 0.0)).all(axis=1)
+
+        covered = np.minimum(self.normalized, gap).sum(axis=1)
+        overshoot = np.clip(self.normalized - gap, 0, None)[:, self.fills_gap].sum(axis=1)
+        scores = covered - OVERSHOOT_PENALTY * overshoot
+
+        ranked = self.matrix.top_k(scores, k, mask=within_limits & (covered > 0))
+        foods = self.matrix.get_foods([i for i, _ in ranked])
+        results = []
+        for food, (i, score) in zip(foods, ranked):
+            unit, quantity = self.matrix.servings[i]
+            results.append({
+                "food": food,
+                "unit": unit,
+                "quantity": quantity,
+                "grams": float(self.matrix.serving_grams[i]),
+                "nutrients": nutrients_to_level1([round(float(v), 2) for v in self.per_serving[i]]),
+                "score": score
+            })
+        return results
+
+def get_score_matrix(goals: dict):
+    global _cached_scores
+    matrix = get_nutrient_matrix()
+    if matrix is None or not len(matrix):
+        return None
+
+    key = (matrix.version, _goals_key(goals))
+    with _cache_lock:
+        if _cached_scores is None or _cached_scores.key != key:
+            _cached_scores = ServingScoreMatrix(matrix, goals)
+        return _cached_scores
+
+def recommend_foods(totals: dict, goals: dict, k: int = 5) -> list:
+    score_matrix = get_score_matrix(goals)
+    if score_matrix is None:
+        return []
+    totals_vector = [float(totals.get(key, 0) or 0) for key in NUTRIENT_KEYS]
+    return score_matrix.recommend(totals_vector, k=k)
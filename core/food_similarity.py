@@ -0,0 +1,217 @@
+import os
+import json
+import sqlite3
+import threading
+from core.nutrients import NUTRIENT_KEYS, DB_COLUMNS, NUTRIENT_INDEX, food_nutrients, default_serving
+from core.search import get_catalog_files, load_custom_foods, CUSTOM_DATA_FILE, _row_to_food
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_cache_lock = threading.Lock()
+_cached_matrix = None
+
+def catalog_version() -> tuple:
+    paths = list(get_catalog_files())
+    if os.path.exists(CUSTOM_DATA_FILE):
+        paths.append(CUSTOM_DATA_FILE)
+
+    version = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            version.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            continue
+    return tuple(version)
+
+class NutrientMatrix:
+
+    def __init__(self, version: tuple):
+        self.version = version
+        self.names = []
+        self.servings = []
+        self._refs = []
+        rows = []
+        serving_grams = []
+
+        for index, item in enumerate(load_custom_foods()):
+            values = food_nutrients(item)
+            if any(values):
+                self.names.append(item.get("name", ""))
+                self._refs.append((None, index))
+                rows.append(values)
+                unit, quantity, grams = default_serving(item.get("portions"))
+                self.servings.append((unit, quantity))
+                serving_grams.append(grams)
+
+        select_sql = f"SELECT id, name, portions_json, {', '.join(DB_COLUMNS)} FROM foods"
+        for db_file in get_catalog_files():
+            conn = None
+            try:
+                conn = sqlite3.connect(db_file)
+                for row in conn.execute(select_sql):
+                    values = [float(v or 0) for v in row[3:]]
+                    if any(values):
+                        self.names.append(row[1])
+                        self._refs.append((db_file, row[0]))
+                        rows.append(values)
+                        try:
+                            portions = json.loads(row[2]) if row[2] else []
+                        except (json.JSONDecodeError, TypeError):
+                            portions = []
+                        unit, quantity, grams = default_serving(portions)
+                        self.servings.append((unit, quantity))
+                        serving_grams.append(grams)
+            except sqlite3.Error as e:
+                print(f"Error loading nutrient matrix from {db_file}: {e}")
+            finally:
+                if conn:
+                    conn.close()
+
+        self.raw = np.asarray(rows, dtype=np.float64).reshape(-1, len(NUTRIENT_KEYS))
+        self.serving_grams = np.asarray(serving_grams, dtype=np.float64)
+        logged = np.log1p(np.clip(self.raw, 0, None))
+        self.mean = logged.mean(axis=0) if len(rows) else np.zeros(len(NUTRIENT_KEYS))
+        std = logged.std(axis=0) if len(rows) else np.ones(len(NUTRIENT_KEYS))
+        self.std = np.where(std > 1e-9, std, 1.0)
+        self.normalized = (logged - self.mean) / self.std
+        norms = np.linalg.norm(self.normalized, axis=1, keepdims=True)
+        self.unit = self.normalized / np.where(norms > 1e-9, norms, 1.0)
+        self._name_index = {name.lower(): i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def normalize(self, values) -> "np.ndarray":
+        logged = np.log1p(np.clip(np.asarray(values, dtype=np.float64), 0, None))
+        return (logged - self.mean) / self.std
+
+    def index_of(self, name: str):
+        return self._name_index.get((name or "").lower())
+
+    def get_food(self, index: int) -> dict:
+        return self.get_foods([index])[0]
+
+    def get_foods(self, indices) -> list:
+        by_file = {}
+        for index in indices:
+            db_file, ref = self._refs[index]
+            by_file.setdefault(db_file, []).append((index, ref))
+
+        foods = {}
+        for db_file, refs in by_file.items():
+            if db_file is None:
+                custom_foods = load_custom_foods()
+                for index, ref in refs:
+                    foods[index] = custom_foods[ref] if 0 <= ref < len(custom_foods) else {"name": self.names[index]}
+                continue
+
+            placeholders = ", ".join("?" for _ in refs)
+            conn = sqlite3.connect(db_file)
+            conn.row_factory = sqlite3.Row
+            try:
+                rows = conn.execute(
+                    f"SELECT * FROM foods WHERE id IN ({placeholders})", [ref for _, ref in refs]
+                ).fetchall()
+            finally:
+                conn.close()
+            by_id = {row["id"]: row for row in rows}
+            for index, ref in refs:
+                row = by_id.get(ref)
+                foods[index] = _row_to_food(row) if row else {"name": self.names[index]}
+        return [foods[index] for index in indices]
+
+    def scores(self, query, metric: str = "cosine", weights=None) -> "np.ndarray":
+        rows = self.normalized
+        query = np.asarray(query, dtype=np.float64)
+        if weights is not None:
+            rows = rows * weights
+            query = query * weights
+
+        if metric == "euclidean":
+            return -np.sqrt(((rows - query) ** 2).sum(axis=1))
+
+        if weights is None:
+            unit_rows = self.unit
+        else:
+            norms = np.linalg.norm(rows, axis=1)
+            unit_rows = rows / np.where(norms > 1e-9, norms, 1.0)[:, None]
+        query_norm = np.linalg.norm(query)
+        if query_norm <= 1e-9:
+            return np.zeros(len(self))
+        return unit_rows @ (query / query_norm)
+
+    def top_k(self, scores, k: int, mask=None, exclude=None) -> list:
+        scores = np.array(scores, dtype=np.float64)
+        if mask is not None:
+            scores[~mask] = -np.inf
+        if exclude is not None:
+            scores[exclude] = -np.inf
+
+        candidates = np.flatnonzero(np.isfinite(scores))
+        if len(candidates) == 0:
+            return []
+        k = min(k, len(candidates))
+        top = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        top = top[np.argsort(-scores[top])]
+        return [(int(i), float(scores[i])) for i in top]
+
+def get_nutrient_matrix():
+    global _cached_matrix
+    if not NUMPY_AVAILABLE:
+        return None
+
+    version = catalog_version()
+    with _cache_lock:
+        if _cached_matrix is None or _cached_matrix.version != version:
+            _cached_matrix = NutrientMatrix(version)
+        return _cached_matrix
+
+def _query(food: dict, matrix):
+    values = food_nutrients(food)
+    exclude = matrix.index_of(food.get("name"))
+    return values, matrix.normalize(values), exclude
+
+def _collect(matrix, ranked: list, food: dict, k: int) -> list:
+    name = (food.get("name") or "").lower()
+    ranked = [(i, score) for i, score in ranked if matrix.names[i].lower() != name][:k]
+    foods = matrix.get_foods([i for i, _ in ranked])
+    return [{"food": related, "score": score} for related, (_, score) in zip(foods, ranked)]
+
+def find_similar_foods(food: dict, k: int = 5, metric: str = "cosine") -> list:
+    matrix = get_nutrient_matrix()
+    if matrix is None or not len(matrix):
+        return []
+
+    values, query, exclude = _query(food, matrix)
+    if not any(values):
+        return []
+
+    scores = matrix.scores(query, metric=metric)
+    return _collect(matrix, matrix.top_k(scores, k + 2, exclude=exclude), food, k)
+
+def find_alternatives(food: dict, nutrient: str = "sodium", lower: bool = True,
+                      ratio: float = 0.75, k: int = 5, metric: str = "cosine") -> list:
+    matrix = get_nutrient_matrix()
+    if matrix is None or not len(matrix) or nutrient not in NUTRIENT_INDEX:
+        return []
+
+    values, query, exclude = _query(food, matrix)
+    column = NUTRIENT_INDEX[nutrient]
+    current = values[column]
+
+    if lower:
+        if current <= 0:
+            return []
+        mask = matrix.raw[:, column] <= current * ratio
+    else:
+        mask = matrix.raw[:, column] >= current / ratio if current > 0 else matrix.raw[:, column] > 0
+
+    weights = np.ones(len(NUTRIENT_KEYS))
+    weights[column] = 0.0
+    scores = matrix.scores(query, metric=metric, weights=weights)
+    return _collect(matrix, matrix.top_k(scores, k + 2, mask=mask, exclude=exclude), food, k)
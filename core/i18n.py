@@ -2,7 +2,12 @@ import flet as ft
 import json
 import os
 import locale
+import string
+import marshal
+import weakref
 from data.storage import load_user_data
+from core import event_bus
+from core import update_scheduler
 
 def _detect_system_language():
     try:
@@ -16,6 +21,31 @@ def _detect_system_language():
         pass
     return 'en_US'
 
+CACHE_DIR_NAME = ".i18n_cache"
+CACHE_VERSION = 1
+_formatter = string.Formatter()
+
+def _has_fields(template: str) -> bool:
+    try:
+        return any(field is not None for _, field, _, _ in _formatter.parse(template))
+    except ValueError:
+        return False
+
+def _compile_catalog(data: dict) -> tuple:
+    plain = {}
+    templates = {}
+    for key, value in data.items():
+        if not isinstance(value, str):
+            continue
+        if _has_fields(value):
+            templates[key] = value
+        else:
+            try:
+                plain[key] = value.format()
+            except (ValueError, IndexError):
+                plain[key] = value
+    return plain, templates
+
 class I18nManager:
     _instance = None
 
@@ -40,44 +70,159 @@ class I18nManager:
         
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.base_dir = os.path.join(project_root, 'assests', 'i18n')
+        self.cache_dir = os.path.join(project_root, CACHE_DIR_NAME)
         
         self.default_lang = default_lang
         self.fallback_lang = fallback_lang
         self.current_lang = default_lang
-        self.translations = {}
-        self._subscribers = set()
-        self.load_all_languages()
+        self._catalogs = {}
+        self._memo = {}
+        self._available = None
+        self._names = None
+        self._tracked = weakref.WeakKeyDictionary()
+        self._subscribers = event_bus.WeakCallbackSet()
+        event_bus.register_debug_source("i18n", self._subscribers.__len__)
 
-    def load_all_languages(self):
         if not os.path.isdir(self.base_dir):
             print(f"Error: Language directory not found at {self.base_dir}")
-            return
-            
+        self._load_catalog(self.current_lang)
+
+    def available_languages(self) -> list:
+        if self._available is None:
+            try:
+                self._available = sorted(
+                    filename[:-5] for filename in os.listdir(self.base_dir) if filename.endswith(".json")
+                )
+            except OSError as e:
+                print(f"Error listing languages in {self.base_dir}: {e}")
+                self._available = []
+        return list(self._available)
+
+    def language_name(self, lang_code: str) -> str:
+        if self._names is None:
+            self._names = self._read_names_index()
+
+        path = os.path.join(self.base_dir, f"{lang_code}.json")
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return lang_code
+
+        entry = self._names.get(lang_code)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        catalog = self._catalogs.get(lang_code) or self._read_catalog(lang_code)
+        name = catalog[0].get("language_name", lang_code)
+        self._names[lang_code] = (stat.st_mtime_ns, stat.st_size, name)
+        self._write_names_index()
+        return name
+
+    def _names_index_path(self) -> str:
+        return os.path.join(self.cache_dir, "language_names.marshal")
+
+    def _read_names_index(self) -> dict:
+        try:
+            with open(self._names_index_path(), "rb") as f:
+                version, names = marshal.load(f)
+            if version == CACHE_VERSION and isinstance(names, dict):
+                return names
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        return {}
+
+    def _write_names_index(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._names_index_path() + ".tmp"
+            with open(tmp_path, "wb") as f:
+                marshal.dump((CACHE_VERSION, self._names), f)
+            os.replace(tmp_path, self._names_index_path())
+        except OSError as e:
+            print(f"Error writing language name index: {e}")
+
+    def _cache_path(self, lang_code: str) -> str:
+        return os.path.join(self.cache_dir, f"{lang_code}.marshal")
+
+    def _read_catalog(self, lang_code: str) -> tuple:
+        path = os.path.join(self.base_dir, f"{lang_code}.json")
         try:
-            for filename in os.listdir(self.base_dir):
-                if filename.endswith(".json"):
-                    lang_code = filename.split(".")[0]
-                    filepath = os.path.join(self.base_dir, filename)
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        self.translations[lang_code] = json.load(f)
+            stat = os.stat(path)
+        except OSError:
+            return {}, {}
+
+        try:
+            with open(self._cache_path(lang_code), "rb") as f:
+                version, mtime_ns, size, plain, templates = marshal.load(f)
+            if version == CACHE_VERSION and mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+                return plain, templates
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                plain, templates = _compile_catalog(json.load(f))
         except Exception as e:
-            print(f"Error loading languages from {self.base_dir}: {e}")
+            print(f"Error loading language {lang_code}: {e}")
+            return {}, {}
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._cache_path(lang_code) + ".tmp"
+            with open(tmp_path, "wb") as f:
+                marshal.dump((CACHE_VERSION, stat.st_mtime_ns, stat.st_size, plain, templates), f)
+            os.replace(tmp_path, self._cache_path(lang_code))
+        except OSError as e:
+            print(f"Error writing language cache for {lang_code}: {e}")
+        return plain, templates
+
+    def _load_catalog(self, lang_code: str) -> tuple:
+        catalog = self._catalogs.get(lang_code)
+        if catalog is None:
+            catalog = self._read_catalog(lang_code)
+            self._catalogs[lang_code] = catalog
+        return catalog
+
+    def _unload_unused(self):
+        for lang_code in list(self._catalogs):
+            if lang_code not in (self.current_lang, self.fallback_lang):
+                del self._catalogs[lang_code]
 
     def set_language(self, lang_code: str):
-        if lang_code in self.translations and self.current_lang != lang_code:
+        if lang_code in self.available_languages() and self.current_lang != lang_code:
             self.current_lang = lang_code
+            self._load_catalog(lang_code)
+            self._unload_unused()
+            self._memo.clear()
             self._notify_subscribers()
             print(f"Language changed to: {lang_code}")
 
+    def _lookup(self, key: str):
+        for lang_code in (self.current_lang, self.fallback_lang):
+            plain, templates = self._load_catalog(lang_code)
+            if key in plain:
+                return plain[key], False
+            if key in templates:
+                return templates[key], True
+        return None, False
+
     def get(self, key: str, **kwargs) -> str:
-        translation = self.translations.get(self.current_lang, {}).get(key)
-        if translation is None:
-            translation = self.translations.get(self.fallback_lang, {}).get(key)
+        if not kwargs:
+            cached = self._memo.get(key)
+            if cached is None:
+                translation, _ = self._lookup(key)
+                cached = key if translation is None else translation
+                self._memo[key] = cached
+            return cached
+
+        translation, is_template = self._lookup(key)
         if translation is None:
             return key
+        if not is_template:
+            return translation
         try:
             return translation.format(**kwargs)
-        except KeyError:
+        except (KeyError, IndexError, ValueError):
             return translation
 
     def t(self, key: str, **kwargs) -> str:
@@ -89,22 +234,44 @@ class I18nManager:
     def unsubscribe(self, callback):
         self._subscribers.discard(callback)
 
+    def track(self, control, **bindings):
+        self._tracked.setdefault(control, {}).update(bindings)
+        self._apply_bindings(control, bindings)
+        return control
+
+    def _apply_bindings(self, control, bindings: dict):
+        for attr, source in bindings.items():
+            setattr(control, attr, source() if callable(source) else self.t(source))
+
+    def _retranslate_tracked(self) -> list:
+        for control, bindings in list(self._tracked.items()):
+            self._apply_bindings(control, bindings)
+        return list(self._tracked)
+
     def _notify_subscribers(self):
-        for callback in self._subscribers:
+        retranslated = self._retranslate_tracked()
+        for callback in list(self._subscribers):
             try:
                 callback()
             except Exception as e:
                 print(f"Error in subscriber callback: {e}")
+        if retranslated:
+            update_scheduler.request_update(*retranslated)
 
 i18n_manager = I18nManager()
 
 class I18nText(ft.Text):
-    def __init__(self, key: str, **kwargs):
+    def __init__(self, key: str, prefix: str = "", suffix: str = "", **kwargs):
         self.key = key
+        self.prefix = prefix
+        self.suffix = suffix
         self.format_args = {k: v for k, v in kwargs.items() if k not in ft.Text.__dataclass_fields__}
         text_kwargs = {k: v for k, v in kwargs.items() if k not in self.format_args}
 
-        super().__init__(value=i18n_manager.t(self.key, **self.format_args), **text_kwargs)
+        super().__init__(value=self._translate(), **text_kwargs)
+
+    def _translate(self) -> str:
+        return self.prefix + i18n_manager.t(self.key, **self.format_args) + self.suffix
 
     def will_mount(self):
         i18n_manager.subscribe(self.update_ui)
@@ -114,6 +281,5 @@ class I18nText(ft.Text):
         i18n_manager.unsubscribe(self.update_ui)
 
     def update_ui(self):
-        self.value = i18n_manager.t(self.key, **self.format_args)
-        if self.page:
-            self.update()
+        self.value = self._translate()
+        update_scheduler.request_update(self)
@@ -0,0 +1,164 @@
+import sys
+import time
+import threading
+import importlib
+
+DEFAULT_IMPORT_BUDGET_MS = 1500
+DEFAULT_TARGET = "ui.app"
+DEFERRED_MODULES = (
+    "pystray",
+    "PIL",
+    "win11toast",
+    "plyer",
+    "core.system_tray",
+    "core.notification",
+)
+
+_lock = threading.RLock()
+_load_times = {}
+
+def _import(module_name: str):
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    with _lock:
+        module = sys.modules.get(module_name)
+        if module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(module_name)
+            _load_times[module_name] = (time.perf_counter() - started) * 1000
+    return module
+
+class LazyModule:
+
+    def __init__(self, module_name: str):
+        object.__setattr__(self, "_module_name", module_name)
+        object.__setattr__(self, "_module", None)
+
+    def _load(self):
+        module = object.__getattribute__(self, "_module")
+        if module is None:
+            module = _import(object.__getattribute__(self, "_module_name"))
+            object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __setattr__(self, key, value):
+        setattr(self._load(), key, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        name = object.__getattribute__(self, "_module_name")
+        state = "loaded" if object.__getattribute__(self, "_module") is not None else "deferred"
+        return f"<LazyModule {name} ({state})>"
+
+class LazyAttribute:
+
+    def __init__(self, module_name: str, attr: str):
+        self._module_name = module_name
+        self._attr = attr
+        self._target = None
+
+    def resolve(self):
+        if self._target is None:
+            self._target = getattr(_import(self._module_name), self._attr)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, item):
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return getattr(self.resolve(), item)
+
+    def __repr__(self):
+        state = "loaded" if self._target is not None else "deferred"
+        return f"<LazyAttribute {self._module_name}.{self._attr} ({state})>"
+
+def lazy_module(module_name: str) -> LazyModule:
+    return LazyModule(module_name)
+
+def lazy_import(module_name: str, *attrs: str):
+    if len(attrs) == 1:
+        return LazyAttribute(module_name, attrs[0])
+    return tuple(LazyAttribute(module_name, attr) for attr in attrs)
+
+def is_loaded(module_name: str) -> bool:
+    return module_name in sys.modules
+
+def load_times() -> dict:
+    return dict(_load_times)
+
+def parse_importtime(output: str) -> dict:
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, timings = line.split(":", 1)
+            self_us, cumulative_us, name = timings.split("|", 2)
+            modules[name.strip()] = {
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        except ValueError:
+            continue
+    return modules
+
+def measure_import(target: str = DEFAULT_TARGET, python: str = None) -> dict:
+    import os
+    import subprocess
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = project_root + os.pathsep + env.get("PYTHONPATH", "")
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    return parse_importtime(result.stderr)
+
+def check_import_budget(target: str = DEFAULT_TARGET, budget_ms: float = DEFAULT_IMPORT_BUDGET_MS,
+                        deferred=DEFERRED_MODULES, top: int = 10) -> bool:
+    modules = measure_import(target)
+    total = modules.get(target, {}).get("cumulative_ms")
+    if total is None:
+        print(f"No import time recorded for {target}")
+        return False
+
+    ok = True
+    eager = sorted(
+        name for name in modules
+        if any(name == d or name.startswith(d + ".") for d in deferred)
+    )
+    if eager:
+        ok = False
+        print(f"Deferred modules imported eagerly by {target}: {', '.join(eager)}")
+
+    if total > budget_ms:
+        ok = False
+        print(f"Import of {target} took {total:.1f} ms, budget {budget_ms} ms")
+        for name, timing in sorted(modules.items(), key=lambda item: item[1]["self_ms"], reverse=True)[:top]:
+            print(f"    {name}: self {timing['self_ms']:.1f} ms, cumulative {timing['cumulative_ms']:.1f} ms")
+    else:
+        print(f"Import of {target} took {total:.1f} ms, within budget {budget_ms} ms")
+    return ok
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Check cold import time with python -X importtime.")
+    parser.add_argument("target", nargs="?", default=DEFAULT_TARGET)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+    return 0 if check_import_budget(args.target, args.budget_ms, top=args.top) else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
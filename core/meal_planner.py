@@ -0,0 +1,180 @@
+import time
+import random
+from core.nutrients import NUTRIENT_KEYS, nutrients_to_level1
+from core.food_similarity import NUMPY_AVAILABLE
+from core.food_recommender import get_score_matrix
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+PORTION_MULTIPLIERS = (0.5, 1.0, 1.5, 2.0)
+DEFAULT_TIME_BUDGET = 1.0
+DEFAULT_MAX_ITEMS = 6
+IDEAL_WEIGHT = 0.02
+VIOLATION_WEIGHT = 100.0
+
+class MealPlanner:
+
+    def __init__(self, goals: dict, max_items: int = DEFAULT_MAX_ITEMS, seed=None):
+        self.scores = get_score_matrix(goals)
+        self.max_items = max_items
+        self.random = random.Random(seed)
+        self.multipliers = np.asarray(PORTION_MULTIPLIERS)
+
+        if self.scores is not None:
+            self.mins = self.scores.mins
+            self.maxs = self.scores.maxs
+            self.ideals = self.scores.scale
+            self.candidates = self.scores.per_serving[:, None, :] * self.multipliers[None, :, None]
+
+    def penalty(self, totals) -> "np.ndarray":
+        low = np.clip(self.mins - totals, 0, None) / self.ideals
+        high = np.clip(totals - self.maxs, 0, None) / self.ideals
+        off_ideal = (totals - self.ideals) / self.ideals
+        return (VIOLATION_WEIGHT * (low ** 2 + high ** 2) + IDEAL_WEIGHT * off_ideal ** 2).sum(axis=-1)
+
+    def _best_addition(self, base, used: set):
+        penalties = self.penalty(base + self.candidates)
+        if used:
+            penalties[list(used), :] = np.inf
+        flat = int(np.argmin(penalties))
+        food_index, multiplier_index = divmod(flat, len(self.multipliers))
+        return food_index, multiplier_index, float(penalties[food_index, multiplier_index])
+
+    def _totals(self, start, plan: list):
+        totals = np.array(start, dtype=np.float64)
+        for food_index, multiplier_index in plan:
+            totals += self.candidates[food_index, multiplier_index]
+        return totals
+
+    def _is_feasible(self, totals) -> bool:
+        return bool(np.all(totals >= self.mins - 1e-9) and np.all(totals <= self.maxs + 1e-9))
+
+    def solve(self, start_totals=None, time_budget: float = DEFAULT_TIME_BUDGET) -> dict:
+        started = time.perf_counter()
+        deadline = started + time_budget
+        if self.scores is None:
+            return {"items": [], "totals": {}, "feasible": False, "violations": [], "penalty": None,
+                    "iterations": 0, "elapsed": 0.0}
+
+        start = np.asarray(
+            [float((start_totals or {}).get(key, 0) or 0) for key in NUTRIENT_KEYS],
+            dtype=np.float64
+        )
+
+        plan = []
+        current = self.penalty(start)
+        while len(plan) < self.max_items and time.perf_counter() < deadline:
+            used = {food_index for food_index, _ in plan}
+            food_index, multiplier_index, candidate = self._best_addition(self._totals(start, plan), used)
+            if candidate >= current - 1e-9:
+                break
+            plan.append((food_index, multiplier_index))
+            current = candidate
+
+        iterations = 0
+        stale = 0
+        while plan and time.perf_counter() < deadline and stale < 4 * self.max_items:
+            iterations += 1
+            position = self.random.randrange(len(plan))
+            rest = plan[:position] + plan[position + 1:]
+            base = self._totals(start, rest)
+
+            used = {food_index for food_index, _ in rest}
+            food_index, multiplier_index, candidate = self._best_addition(base, used)
+            if candidate < current - 1e-9:
+                plan = rest + [(food_index, multiplier_index)]
+                current = candidate
+                stale = 0
+                continue
+
+            rest_penalty = float(self.penalty(base))
+            if rest_penalty < current - 1e-9:
+                plan = rest
+                current = rest_penalty
+                stale = 0
+                continue
+
+            if len(plan) < self.max_items:
+                food_index, multiplier_index, candidate = self._best_addition(
+                    self._totals(start, plan), {food_index for food_index, _ in plan}
+                )
+                if candidate < current - 1e-9:
+                    plan.append((food_index, multiplier_index))
+                    current = candidate
+                    stale = 0
+                    continue
+            stale += 1
+
+        totals = self._totals(start, plan)
+        matrix = self.scores.matrix
+        foods = matrix.get_foods([food_index for food_index, _ in plan])
+        items = []
+        for food, (food_index, multiplier_index) in zip(foods, plan):
+            unit, quantity = matrix.servings[food_index]
+            multiplier = float(self.multipliers[multiplier_index])
+            items.append({
+                "food": food,
+                "unit": unit,
+                "quantity": round(quantity * multiplier, 2),
+                "grams": round(float(matrix.serving_grams[food_index]) * multiplier, 1),
+                "nutrients": nutrients_to_level1(
+                    [round(float(v), 2) for v in self.candidates[food_index, multiplier_index]]
+                )
+            })
+
+        return {
+            "items": items,
+            "totals": nutrients_to_level1([round(float(v), 2) for v in totals]),
+            "feasible": self._is_feasible(totals),
+            "violations": [
+                key for i, key in enumerate(NUTRIENT_KEYS)
+                if totals[i] < self.mins[i] - 1e-9 or totals[i] > self.maxs[i] + 1e-9
+            ],
+            "penalty": float(current),
+            "iterations": iterations,
+            "elapsed": time.perf_counter() - started
+        }
+
+def plan_day(goals: dict, start_totals=None, time_budget: float = DEFAULT_TIME_BUDGET,
+             max_items: int = DEFAULT_MAX_ITEMS, seed=None) -> dict:
+    if not NUMPY_AVAILABLE:
+        return {"items": [], "totals": {}, "feasible": False, "violations": [], "penalty": None,
+                "iterations": 0, "elapsed": 0.0}
+    planner = MealPlanner(goals, max_items=max_items, seed=seed)
+    return planner.solve(start_totals=start_totals, time_budget=time_budget)
+
+def main(argv=None):
+    import argparse
+    import json
+    from core.calculations import calculate_nutrition_goals
+    from data.storage import load_user_data
+
+    parser = argparse.ArgumentParser(description="Plan a day of meals inside the nutrition goal ranges.")
+    parser.add_argument("--budget", type=float, default=DEFAULT_TIME_BUDGET, help="time budget in seconds")
+    parser.add_argument("--max-items", type=int, default=DEFAULT_MAX_ITEMS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--runs", type=int, default=1, help="repeat the solve for benchmarking")
+    parser.add_argument("--json", action="store_true", help="print the full plan as JSON")
+    args = parser.parse_args(argv)
+
+    goals = calculate_nutrition_goals(load_user_data())
+    results = []
+    for run in range(args.runs):
+        seed = None if args.seed is None else args.seed + run
+        results.append(plan_day(goals, time_budget=args.budget, max_items=args.max_items, seed=seed))
+
+    if args.json:
+        print(json.dumps(results if args.runs > 1 else results[0], ensure_ascii=False, indent=2, default=str))
+        return 0
+
+    for run, result in enumerate(results):
+        print(f"run {run + 1}: feasible={result['feasible']} penalty={result['penalty']} "
+              f"items={len(result['items'])} iterations={result['iterations']} "
+              f"elapsed={result['elapsed'] * 1000:.1f} ms violations={result['violations']}")
+        for item in result["items"]:
+            print(f"    {item['quantity']} {item['unit']} ({item['grams']} g) {item['food'].get('name', '')}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
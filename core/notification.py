@@ -1,6 +1,11 @@
 
 import os
+import time
+import queue
+import shutil
 import platform
+import threading
+import subprocess
 from core.i18n import i18n_manager
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -9,92 +14,170 @@ ICON_PATH_PNG = os.path.join(PROJECT_ROOT, 'assests', 'resource', 'icon', 'Healt
 
 SYSTEM = platform.system()
 
+NOTIFY_TIMEOUT = 5
+DEDUPE_SECONDS = 300
+MAX_PENDING = 16
+BACKEND_RETRY_SECONDS = 600
+
+BACKENDS = {
+    "Windows": ("win11toast", "plyer"),
+    "Darwin": ("osascript", "plyer"),
+}
+DEFAULT_BACKENDS = ("notify-send", "plyer")
+
+_capabilities = {}
+_retry_at = {}
+
 def send_notification(
     title_key: str = "app_title", 
     message_key: str = "reminder_warning", 
     duration: str = "short"
-):
+) -> bool:
     
     title = i18n_manager.t(title_key)
     message = i18n_manager.t(message_key)
+    return notification_worker.submit(title, message, duration, dedupe_key=(title_key, message_key))
+
+def deliver_notification(title: str, message: str, duration: str = "short") -> bool:
     
-    if SYSTEM == "Windows":
-        return _send_windows_notification(title, message, duration)
-    elif SYSTEM == "Darwin":
-        return _send_macos_notification(title, message)
-    else:
-        return _send_linux_notification(title, message)
-
-def _send_windows_notification(title: str, message: str, duration: str) -> bool:
-    
-    try:
-        from win11toast import toast
-        
-        icon_dict = None
-        if os.path.exists(ICON_PATH):
-            icon_dict = {'src': ICON_PATH, 'placement': 'appLogoOverride', 'hint-crop': 'circle'}
-        
-        toast(
-            title=message,
-            body='',
-            app_id=title,
-            duration=duration,
-        )
-        return True
-        
-    except ImportError:
+    for backend in BACKENDS.get(SYSTEM, DEFAULT_BACKENDS):
+        if _retry_at.get(backend, 0) > time.monotonic():
+            continue
+        try:
+            _SENDERS[backend](title, message, duration)
+            _capabilities[backend] = True
+            _retry_at.pop(backend, None)
+            return True
+        except Exception as e:
+            _capabilities[backend] = False
+            _retry_at[backend] = time.monotonic() + BACKEND_RETRY_SECONDS
+            print(f"[Notification] {backend} unavailable: {e}")
+    _play_beep()
+    return False
 
-        return _send_plyer_notification(title, message)
-    except Exception as e:
-        print(f"[Notification] Windows error: {e}")
-        _play_beep()
-        return False
+def get_capabilities() -> dict:
+    return dict(_capabilities)
 
-def _send_macos_notification(title: str, message: str) -> bool:
-    
-    try:
+def reset_capabilities():
+    _capabilities.clear()
+    _retry_at.clear()
 
-        import subprocess
-        script = f'display notification "{message}" with title "{title}"'
-        subprocess.run(['osascript', '-e', script], check=True)
-        return True
-    except Exception:
+def _call_with_timeout(func, *args, **kwargs):
+    errors = []
+
+    def target():
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=target, name="notification-call", daemon=True)
+    thread.start()
+    thread.join(NOTIFY_TIMEOUT)
+    if errors:
+        raise errors[0]
 
-        return _send_plyer_notification(title, message)
+def _run_command(args: list):
+    if shutil.which(args[0]) is None:
+        raise FileNotFoundError(args[0])
+    subprocess.run(
+        args, check=True, timeout=NOTIFY_TIMEOUT,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
 
-def _send_linux_notification(title: str, message: str) -> bool:
+def _send_windows_notification(title: str, message: str, duration: str):
     
-    try:
+    from win11toast import notify
+    notify(
+        title=message,
+        body='',
+        app_id=title,
+        duration=duration,
+    )
 
-        import subprocess
-        icon = ICON_PATH_PNG if os.path.exists(ICON_PATH_PNG) else ICON_PATH
-        subprocess.run(['notify-send', title, message, '-i', icon], check=True)
-        return True
-    except Exception:
+def _send_macos_notification(title: str, message: str, duration: str):
+    
+    message = message.replace('"', '\\"')
+    title = title.replace('"', '\\"')
+    _run_command(['osascript', '-e', f'display notification "{message}" with title "{title}"'])
 
-        return _send_plyer_notification(title, message)
+def _send_linux_notification(title: str, message: str, duration: str):
+    
+    icon = ICON_PATH_PNG if os.path.exists(ICON_PATH_PNG) else ICON_PATH
+    _run_command(['notify-send', title, message, '-i', icon])
 
-def _send_plyer_notification(title: str, message: str) -> bool:
+def _send_plyer_notification(title: str, message: str, duration: str):
     
-    try:
-        from plyer import notification
-        
-        icon = ICON_PATH if os.path.exists(ICON_PATH) else None
-        notification.notify(
-            title=title,
-            message=message,
-            app_icon=icon,
-            timeout=5
-        )
+    from plyer import notification
+    icon = ICON_PATH if os.path.exists(ICON_PATH) else None
+    _call_with_timeout(
+        notification.notify,
+        title=title,
+        message=message,
+        app_icon=icon,
+        timeout=NOTIFY_TIMEOUT
+    )
+
+_SENDERS = {
+    "win11toast": _send_windows_notification,
+    "osascript": _send_macos_notification,
+    "notify-send": _send_linux_notification,
+    "plyer": _send_plyer_notification,
+}
+
+class NotificationWorker:
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(NotificationWorker, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, '_initialized'):
+            return
+        self._initialized = True
+        self._queue = queue.Queue(maxsize=MAX_PENDING)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._recent = {}
+        self.stats = {"sent": 0, "failed": 0, "deduped": 0, "dropped": 0}
+
+    def submit(self, title: str, message: str, duration: str = "short", dedupe_key=None) -> bool:
+        key = dedupe_key or (title, message)
+        now = time.monotonic()
+        with self._lock:
+            self._recent = {k: t for k, t in self._recent.items() if now - t < DEDUPE_SECONDS}
+            if key in self._recent:
+                self.stats["deduped"] += 1
+                return False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="notification-worker", daemon=True)
+                self._thread.start()
+
+            try:
+                self._queue.put_nowait((title, message, duration))
+            except queue.Full:
+                self.stats["dropped"] += 1
+                return False
+            self._recent[key] = now
         return True
-    except ImportError:
-        print("[Notification] plyer not installed")
-        _play_beep()
-        return False
-    except Exception as e:
-        print(f"[Notification] plyer error: {e}")
-        _play_beep()
-        return False
+
+    def _run(self):
+        while True:
+            title, message, duration = self._queue.get()
+            try:
+                sent = deliver_notification(title, message, duration)
+            except Exception as e:
+                print(f"[Notification] delivery error: {e}")
+                sent = False
+            self.stats["sent" if sent else "failed"] += 1
+            self._queue.task_done()
+
+    def join(self):
+        self._queue.join()
+
+notification_worker = NotificationWorker()
 
 def _play_beep():
     
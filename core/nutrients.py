@@ -0,0 +1,99 @@
+import uuid
+from array import array
+
+NUTRIENT_KEYS = [
+    "calories", "protein", "total_fat", "total_carbs", "fiber",
+    "sugars", "sodium", "calcium", "vitamin_c", "vitamin_d"
+]
+
+DB_COLUMNS = [
+    "calories", "protein", "fat", "carbs", "fiber",
+    "sugar", "sodium", "calcium", "vitamin_c", "vitamin_d"
+]
+
+DB_TO_LEVEL1 = dict(zip(DB_COLUMNS, NUTRIENT_KEYS))
+
+NUTRIENT_INDEX = {key: i for i, key in enumerate(NUTRIENT_KEYS)}
+
+def _as_number(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return 0.0
+
+def food_nutrients(food: dict) -> list:
+    level1 = food.get("level1")
+    if level1:
+        return [_as_number(level1.get(key, 0)) for key in NUTRIENT_KEYS]
+    return [_as_number(food.get(column, 0)) for column in DB_COLUMNS]
+
+def nutrients_to_level1(values) -> dict:
+    return {key: values[i] for i, key in enumerate(NUTRIENT_KEYS)}
+
+def default_serving(portions) -> tuple:
+    portions = portions or []
+    for portion in portions:
+        if portion.get("unit_name") == "RACC" and portion.get("gram_weight"):
+            return portion["unit_name"], 1, float(portion["gram_weight"])
+    for portion in portions:
+        grams = portion.get("gram_weight") or 0
+        if portion.get("unit_name") != "g" and 20 <= grams <= 400:
+            return portion["unit_name"], 1, float(grams)
+    return "g", 100, 100.0
+
+def nutrient_vector(food: dict) -> array:
+    return array('d', food_nutrients(food))
+
+def scale_vector(vector, factor: float) -> array:
+    return array('d', [value * factor for value in vector])
+
+def sum_vectors(vectors) -> array:
+    totals = array('d', [0.0]) * len(NUTRIENT_KEYS)
+    for vector in vectors:
+        for i, value in enumerate(vector):
+            totals[i] += value
+    return totals
+
+def meal_vector(meal: dict) -> array:
+    vector = meal.get("vector")
+    if isinstance(vector, array):
+        return vector
+    if isinstance(vector, list) and len(vector) == len(NUTRIENT_KEYS):
+        return array('d', vector)
+    return nutrient_vector(meal)
+
+def meal_totals(meals) -> dict:
+    if not meals:
+        return {}
+    return nutrients_to_level1(sum_vectors(meal_vector(meal) for meal in meals))
+
+def _scale_nested(values: dict, factor: float) -> dict:
+    scaled = {}
+    for key, value in values.items():
+        if isinstance(value, dict):
+            scaled[key] = _scale_nested(value, factor)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            scaled[key] = round(value * factor, 2)
+        else:
+            scaled[key] = value
+    return scaled
+
+def serialize_meal(meal: dict) -> dict:
+    data = {key: value for key, value in meal.items() if key not in ("vector", "scale")}
+    data["level1"] = nutrients_to_level1([round(value, 2) for value in meal_vector(meal)])
+    scale = meal.get("scale", 1.0)
+    if isinstance(meal.get("level2"), dict) and scale != 1.0:
+        data["level2"] = _scale_nested(meal["level2"], scale)
+    return data
+
+def deserialize_meal(data: dict) -> dict:
+    meal = {key: value for key, value in data.items() if key != "level1"}
+    meal["vector"] = meal_vector(data)
+    meal["scale"] = 1.0
+    meal["meal_id"] = data.get("meal_id") or uuid.uuid4().hex
+    return meal
+
+def serialize_meals(meals) -> list:
+    return [serialize_meal(meal) for meal in meals or []]
+
+def deserialize_meals(data) -> list:
+    return [deserialize_meal(meal) for meal in data or [] if isinstance(meal, dict)]
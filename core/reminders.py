@@ -0,0 +1,232 @@
+import heapq
+import asyncio
+import datetime
+import itertools
+from core import event_bus
+
+WATER = "water"
+MEALS = "meals"
+SLEEP = "sleep"
+EXERCISE = "exercise"
+REMINDER_KINDS = (WATER, MEALS, SLEEP, EXERCISE)
+DEFAULT_KINDS = (WATER,)
+
+MESSAGE_KEYS = {
+    WATER: "reminder_warning",
+    MEALS: "reminder_meals",
+    SLEEP: "reminder_sleep",
+    EXERCISE: "reminder_exercise",
+}
+
+STATE_KEYS = frozenset({"last_drink_timestamp", "daily_meals", "daily_exercises", "reminder_kinds"})
+
+MAX_SLEEP_SECONDS = 900
+
+def next_half_hour(now: datetime.datetime) -> datetime.datetime:
+    base = now.replace(second=0, microsecond=0)
+    if now.minute < 30:
+        return base.replace(minute=30)
+    return base.replace(minute=0) + datetime.timedelta(hours=1)
+
+def daily_at(*times):
+    moments = sorted(datetime.time(hour, minute) for hour, minute in times)
+
+    def next_due(now: datetime.datetime) -> datetime.datetime:
+        for moment in moments:
+            due = datetime.datetime.combine(now.date(), moment)
+            if due > now:
+                return due
+        return datetime.datetime.combine(now.date() + datetime.timedelta(days=1), moments[0])
+    return next_due
+
+def every_second(now: datetime.datetime) -> datetime.datetime:
+    return now.replace(microsecond=0) + datetime.timedelta(seconds=1)
+
+def half_hour_period(dt: datetime.datetime) -> tuple:
+    return dt.date().isoformat(), dt.hour * 2 + (1 if dt.minute >= 30 else 0)
+
+class Job:
+    __slots__ = ("kind", "next_due", "callback", "due", "cancelled")
+
+    def __init__(self, kind: str, next_due, callback):
+        self.kind = kind
+        self.next_due = next_due
+        self.callback = callback
+        self.due = None
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class ReminderScheduler:
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(ReminderScheduler, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, '_initialized'):
+            return
+        self._initialized = True
+        self._heap = []
+        self._counter = itertools.count()
+        self._wakeup = None
+        self._task = None
+        self.wakeups = 0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def schedule(self, kind: str, next_due, callback) -> Job:
+        job = Job(kind, next_due, callback)
+        self._push(job, datetime.datetime.now())
+        return job
+
+    def _push(self, job: Job, now: datetime.datetime):
+        job.due = job.next_due(now)
+        if job.due is None:
+            return
+        is_earliest = not self._heap or job.due < self._heap[0][0]
+        heapq.heappush(self._heap, (job.due, next(self._counter), job))
+        if is_earliest and self._wakeup is not None:
+            self._wakeup.set()
+
+    def next_due(self, kind: str = None):
+        dues = [due for due, _, job in self._heap if not job.cancelled and (kind is None or job.kind == kind)]
+        return min(dues) if dues else None
+
+    def _run_due(self, now: datetime.datetime):
+        while self._heap and self._heap[0][0] <= now:
+            _, _, job = heapq.heappop(self._heap)
+            if job.cancelled:
+                continue
+            try:
+                job.callback(now)
+            except Exception as e:
+                print(f"Error in {job.kind} reminder: {e}")
+            if not job.cancelled:
+                self._push(job, now)
+
+    async def _run(self):
+        while True:
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+
+            timeout = MAX_SLEEP_SECONDS
+            if self._heap:
+                delay = (self._heap[0][0] - datetime.datetime.now()).total_seconds()
+                timeout = min(max(delay, 0), MAX_SLEEP_SECONDS)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeups += 1
+            self._run_due(datetime.datetime.now())
+
+class ReminderState:
+
+    def __init__(self):
+        self.last_drink = None
+        self.meals_date = None
+        self.meal_count = 0
+        self.exercise_date = None
+        self.kinds = DEFAULT_KINDS
+
+    def load(self, user_data: dict):
+        last_drink = user_data.get("last_drink_timestamp")
+        try:
+            self.last_drink = datetime.datetime.fromisoformat(last_drink) if last_drink else None
+        except (ValueError, TypeError):
+            self.last_drink = None
+
+        daily_meals = user_data.get("daily_meals") or {}
+        self.meals_date = daily_meals.get("date")
+        self.meal_count = len(daily_meals.get("meals") or [])
+        daily_exercises = user_data.get("daily_exercises") or {}
+        self.exercise_date = daily_exercises.get("date") if daily_exercises.get("records") else None
+
+        kinds = user_data.get("reminder_kinds")
+        if isinstance(kinds, (list, tuple)):
+            self.kinds = tuple(kind for kind in kinds if kind in REMINDER_KINDS)
+
+    def water_due(self, now: datetime.datetime) -> bool:
+        return self.last_drink is None or half_hour_period(self.last_drink) != half_hour_period(now)
+
+    def is_due(self, kind: str, now: datetime.datetime) -> bool:
+        today = now.date().isoformat()
+        if kind == WATER:
+            return self.water_due(now)
+        if kind == MEALS:
+            return self.meals_date != today or self.meal_count == 0
+        if kind == EXERCISE:
+            return self.exercise_date != today
+        return kind == SLEEP
+
+RULES = {
+    WATER: next_half_hour,
+    MEALS: daily_at((12, 30), (19, 0)),
+    EXERCISE: daily_at((18, 0)),
+    SLEEP: daily_at((22, 30)),
+}
+
+reminder_scheduler = ReminderScheduler()
+reminder_state = ReminderState()
+
+class Reminders:
+
+    def __init__(self, scheduler: ReminderScheduler = reminder_scheduler, state: ReminderState = reminder_state):
+        self.scheduler = scheduler
+        self.state = state
+        self.jobs = {}
+        self._due = set()
+
+    def start(self, user_data: dict):
+        self.state.load(user_data)
+        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_user_data_saved, keys=STATE_KEYS)
+        self._sync_jobs()
+        self.scheduler.start()
+
+    def stop(self):
+        event_bus.unsubscribe(event_bus.USER_DATA_SAVED, self._on_user_data_saved)
+        for job in self.jobs.values():
+            job.cancel()
+        self.jobs.clear()
+        self.scheduler.stop()
+
+    def _sync_jobs(self):
+        for kind in list(self.jobs):
+            if kind not in self.state.kinds:
+                self.jobs.pop(kind).cancel()
+        for kind in self.state.kinds:
+            if kind not in self.jobs:
+                self.jobs[kind] = self.scheduler.schedule(kind, RULES[kind], self._make_trigger(kind))
+
+    def _make_trigger(self, kind: str):
+        def trigger(now):
+            if not self.state.is_due(kind, now):
+                return
+            if not self._due:
+                asyncio.get_running_loop().call_soon(self._publish_due)
+            self._due.add(kind)
+        return trigger
+
+    def _publish_due(self):
+        kinds, self._due = frozenset(self._due), set()
+        event_bus.publish(event_bus.REMINDER_DUE, kinds)
+
+    def _on_user_data_saved(self, changes=None, *args, **kwargs):
+        if isinstance(changes, event_bus.ChangeSet):
+            self.state.load(changes.snapshot)
+            self._sync_jobs()
@@ -2,6 +2,7 @@ import json
 import os
 import sqlite3
 import glob
+from core.food_history import food_history, SHORT_QUERY_LENGTH
 
 try:
     from pypinyin import pinyin, Style
@@ -212,31 +213,51 @@ def _init_dbs():
     for json_file in json_files:
         _create_db_from_json(json_file)
 
+def _row_to_food(row):
+    food = dict(row)
+    try:
+        food['portions'] = json.loads(row['portions_json']) if row['portions_json'] else []
+    except (json.JSONDecodeError, TypeError):
+        food['portions'] = []
+    food.pop('portions_json', None)
+    return food
+
+def get_catalog_files():
+    _init_dbs()
+    return sorted(glob.glob(os.path.join(NUTRITION_DIR, "*.db")))
+
+def load_custom_foods():
+    if not os.path.exists(CUSTOM_DATA_FILE):
+        return []
+    try:
+        with open(CUSTOM_DATA_FILE, "r", encoding="utf-8") as f:
+            custom_data = json.load(f)
+        return custom_data if isinstance(custom_data, list) else []
+    except Exception:
+        return []
+
+def suggest_foods(query="", limit=10):
+    return food_history.suggest(query, limit=limit)
+
 def search_food(query, db_name=None):
     if not query:
         return []
+
+    if len(query) < SHORT_QUERY_LENGTH:
+        return suggest_foods(query)
     
     all_results = []
     found_names = set()
     scored_results = []
 
-    try:
-        if os.path.exists(CUSTOM_DATA_FILE):
-            with open(CUSTOM_DATA_FILE, "r", encoding="utf-8") as f:
-                custom_data = json.load(f)
-
-            for item in custom_data:
-                name = item.get("name", "")
-                score = _fuzzy_match(query, name)
-                if score > 0:
-                    scored_results.append((score, item))
-                    found_names.add(name.lower())
-    except Exception as e:
-        pass
-
-    _init_dbs()
+    for item in load_custom_foods():
+        name = item.get("name", "")
+        score = _fuzzy_match(query, name)
+        if score > 0:
+            scored_results.append((score, item))
+            found_names.add(name.lower())
 
-    db_files = glob.glob(os.path.join(NUTRITION_DIR, "*.db"))
+    db_files = get_catalog_files()
 
     for db_file in db_files:
         try:
@@ -254,12 +275,7 @@ def search_food(query, db_name=None):
                 if name.lower() not in found_names:
                     score = _fuzzy_match(query, name)
                     if score > 0:
-                        result_item = dict(row)
-                        try:
-                            result_item['portions'] = json.loads(row['portions_json']) if row['portions_json'] else []
-                        except (json.JSONDecodeError, TypeError):
-                            result_item['portions'] = []
-                        del result_item['portions_json']
+                        result_item = _row_to_food(row)
                         scored_results.append((score, result_item))
                         found_names.add(name.lower())
             
@@ -272,12 +288,7 @@ def search_food(query, db_name=None):
                     if name.lower() not in found_names:
                         score = _fuzzy_match(query, name)
                         if score > 0:
-                            result_item = dict(row)
-                            try:
-                                result_item['portions'] = json.loads(row['portions_json']) if row['portions_json'] else []
-                            except (json.JSONDecodeError, TypeError):
-                                result_item['portions'] = []
-                            del result_item['portions_json']
+                            result_item = _row_to_food(row)
                             scored_results.append((score, result_item))
                             found_names.add(name.lower())
                 
@@ -289,6 +300,17 @@ def search_food(query, db_name=None):
         except Exception as e:
             pass
     
+    for food in suggest_foods(query, limit=20):
+        if food.get("name", "").lower() not in found_names:
+            score = _fuzzy_match(query, food.get("name", ""))
+            if score > 0:
+                scored_results.append((score, food))
+                found_names.add(food.get("name", "").lower())
+
+    scored_results = [
+        (score + food_history.boost(item.get("name", "")), item)
+        for score, item in scored_results
+    ]
     scored_results.sort(key=lambda x: x[0], reverse=True)
     all_results = [item for score, item in scored_results[:100]]
     
@@ -0,0 +1,231 @@
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+PROFILE_FLAG = "--profile-startup"
+REPORT_FLAG = "--profile-report"
+EXIT_FLAG = "--profile-exit"
+BUDGET_FLAG = "--startup-budget-ms"
+DEFAULT_REPORT = "startup_profile.json"
+DEFAULT_BUDGET_MS = float(os.environ.get("HEALTH_APP_STARTUP_BUDGET_MS", 3000))
+TOP_IMPORTS = 40
+
+def _flag_value(argv: list, flag: str, default=None):
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return default
+
+class _TimedLoader:
+
+    def __init__(self, loader, profiler, name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter_import(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(self._name)
+
+class _ImportTimer:
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "busy", False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self._profiler, fullname)
+                    return spec
+            return None
+        finally:
+            self._local.busy = False
+
+class StartupProfiler:
+
+    def __init__(self):
+        self.enabled = False
+        self.started_at = time.perf_counter()
+        self.phases = []
+        self.marks = {}
+        self.imports = {}
+        self.db_calls = {"get_db_connection": 0, "sqlite3.connect": 0}
+        self.report_path = DEFAULT_REPORT
+        self.exit_after_report = False
+        self.budget_ms = DEFAULT_BUDGET_MS
+        self._import_stack = []
+        self._import_timer = None
+        self._finished = False
+        self._exit_hooks = []
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def start(self, argv=None):
+        if self.enabled:
+            return
+        argv = sys.argv if argv is None else argv
+        self.enabled = True
+        self.report_path = _flag_value(argv, REPORT_FLAG, DEFAULT_REPORT)
+        self.exit_after_report = EXIT_FLAG in argv
+        self.budget_ms = float(_flag_value(argv, BUDGET_FLAG, DEFAULT_BUDGET_MS))
+
+        self._import_timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self._import_timer)
+        self._patch_sqlite()
+
+    def _patch_sqlite(self):
+        import sqlite3
+        original_connect = sqlite3.connect
+
+        def counting_connect(*args, **kwargs):
+            self.db_calls["sqlite3.connect"] += 1
+            return original_connect(*args, **kwargs)
+
+        sqlite3.connect = counting_connect
+
+    def instrument_database(self, database_module):
+        if not self.enabled or getattr(database_module, "_profiled", False):
+            return
+        original = database_module.get_db_connection
+
+        def counting_get_db_connection(*args, **kwargs):
+            self.db_calls["get_db_connection"] += 1
+            return original(*args, **kwargs)
+
+        database_module.get_db_connection = counting_get_db_connection
+        database_module._profiled = True
+
+    def _enter_import(self, name: str):
+        self._import_stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit_import(self, name: str):
+        if not self._import_stack:
+            return
+        entry_name, started, children = self._import_stack.pop()
+        elapsed = (time.perf_counter() - started) * 1000
+        record = self.imports.setdefault(entry_name, {"cumulative_ms": 0.0, "self_ms": 0.0})
+        record["cumulative_ms"] += elapsed
+        record["self_ms"] += elapsed - children
+        if self._import_stack:
+            self._import_stack[-1][2] += elapsed
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        started = self._now_ms()
+        db_before = self.db_calls["sqlite3.connect"]
+        try:
+            yield
+        finally:
+            self.phases.append({
+                "name": name,
+                "start_ms": round(started, 3),
+                "duration_ms": round(self._now_ms() - started, 3),
+                "db_calls": self.db_calls["sqlite3.connect"] - db_before,
+            })
+
+    def mark(self, name: str):
+        if self.enabled and name not in self.marks:
+            self.marks[name] = round(self._now_ms(), 3)
+
+    def report(self) -> dict:
+        top_imports = sorted(self.imports.items(), key=lambda item: item[1]["self_ms"], reverse=True)
+        first_frame = self.marks.get("first_frame")
+        return {
+            "time_to_first_frame_ms": first_frame,
+            "budget_ms": self.budget_ms,
+            "within_budget": first_frame is not None and first_frame <= self.budget_ms,
+            "marks": self.marks,
+            "phases": self.phases,
+            "db_calls": self.db_calls,
+            "import_count": len(self.imports),
+            "import_total_ms": round(sum(v["self_ms"] for v in self.imports.values()), 3),
+            "imports": [
+                {"module": name, "self_ms": round(v["self_ms"], 3), "cumulative_ms": round(v["cumulative_ms"], 3)}
+                for name, v in top_imports[:TOP_IMPORTS]
+            ],
+        }
+
+    def finish(self) -> bool:
+        if not self.enabled or self._finished:
+            return True
+        self._finished = True
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+
+        report = self.report()
+        try:
+            with open(self.report_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"Startup profile written to {self.report_path}")
+        except IOError as e:
+            print(f"Error writing startup profile: {e}")
+
+        print(f"Time to first frame: {report['time_to_first_frame_ms']} ms (budget {self.budget_ms} ms)")
+        return report["within_budget"]
+
+    def add_exit_hook(self, hook):
+        self._exit_hooks.append(hook)
+
+    def exit(self, code: int = 0):
+        for hook in self._exit_hooks:
+            try:
+                hook()
+            except Exception as e:
+                print(f"Error in exit hook: {e}")
+        os._exit(code)
+
+profiler = StartupProfiler()
+
+def check_report(path: str, budget_ms: float = None) -> bool:
+    with open(path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    budget = report.get("budget_ms", DEFAULT_BUDGET_MS) if budget_ms is None else budget_ms
+    first_frame = report.get("time_to_first_frame_ms")
+    if first_frame is None:
+        print("Startup report has no first frame mark")
+        return False
+    if first_frame > budget:
+        print(f"Time to first frame {first_frame} ms exceeds budget {budget} ms")
+        for phase in sorted(report.get("phases", []), key=lambda p: p["duration_ms"], reverse=True)[:5]:
+            print(f"    {phase['name']}: {phase['duration_ms']} ms, {phase['db_calls']} db calls")
+        return False
+    print(f"Time to first frame {first_frame} ms within budget {budget} ms")
+    return True
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Check a startup profile report against a time-to-first-frame budget.")
+    parser.add_argument("report", nargs="?", default=DEFAULT_REPORT)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+    return 0 if check_report(args.report, args.budget_ms) else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,11 +2,13 @@ import threading
 import sys
 import os
 from core.i18n import i18n_manager
+from core import event_bus
 
 class SystemTray:
-    def __init__(self, page, on_show_window, on_quit, on_navigate=None):
+    def __init__(self, page, on_show_window, on_quit, on_navigate=None, on_hide_window=None):
         self.page = page
         self.on_show_window = on_show_window
+        self.on_hide_window = on_hide_window
         self.on_quit = on_quit
         self.on_navigate = on_navigate
         self.tray_icon = None
@@ -28,13 +30,19 @@ class SystemTray:
                     image = Image.new('RGB', (width, height), color='white')
                     return image
             
+            def hide_window():
+                if not self.page.web:
+                    self.page.window.visible = False
+                    self.page.window.skip_task_bar = True
+                    self.page.update()
+
             def toggle_window(icon, item):
                 if self.page.window.visible:
 
-                    if not self.page.web:
-                        self.page.window.visible = False
-                        self.page.window.skip_task_bar = True
-                        self.page.update()
+                    if self.on_hide_window:
+                        self.on_hide_window()
+                    elif not event_bus.call_in_loop(hide_window):
+                        hide_window()
                 else:
 
                     if self.on_show_window:
@@ -52,6 +60,9 @@ class SystemTray:
                 else:
                     return i18n_manager.t("tray_show_window")
 
+            def translated(key):
+                return lambda item: i18n_manager.t(key)
+
             def quit_app(icon, item):
                 self._running = False
                 
@@ -70,16 +81,16 @@ class SystemTray:
                     default=True
                 ),
                 Menu.SEPARATOR,
-                MenuItem(i18n_manager.t("tray_nav_home"), navigate_to(0)),
-                MenuItem(i18n_manager.t("tray_nav_water"), navigate_to(1)),
-                MenuItem(i18n_manager.t("tray_nav_food"), navigate_to(2)),
-                MenuItem(i18n_manager.t("tray_nav_sleep"), navigate_to(3)),
-                MenuItem(i18n_manager.t("tray_nav_exercise"), navigate_to(4)),
-                MenuItem(i18n_manager.t("tray_nav_calendar"), navigate_to(5)),
-                MenuItem(i18n_manager.t("tray_nav_settings"), navigate_to(6)),
+                MenuItem(translated("tray_nav_home"), navigate_to(0)),
+                MenuItem(translated("tray_nav_water"), navigate_to(1)),
+                MenuItem(translated("tray_nav_food"), navigate_to(2)),
+                MenuItem(translated("tray_nav_sleep"), navigate_to(3)),
+                MenuItem(translated("tray_nav_exercise"), navigate_to(4)),
+                MenuItem(translated("tray_nav_calendar"), navigate_to(5)),
+                MenuItem(translated("tray_nav_settings"), navigate_to(6)),
                 Menu.SEPARATOR,
                 MenuItem(
-                    i18n_manager.t("tray_quit"),
+                    translated("tray_quit"),
                     quit_app
                 )
             )
@@ -90,6 +101,8 @@ class SystemTray:
                 menu=menu
             )
             
+            i18n_manager.subscribe(self._on_language_changed)
+
             def run_tray():
                 self._running = True
                 self.tray_icon.run()
@@ -104,7 +117,17 @@ class SystemTray:
         except Exception as e:
             return False
     
+    def _on_language_changed(self):
+        if not self.tray_icon:
+            return
+        try:
+            self.tray_icon.title = i18n_manager.t("app_title")
+            self.tray_icon.update_menu()
+        except Exception as e:
+            print(f"Error updating tray menu: {e}")
+
     def stop(self):
+        i18n_manager.unsubscribe(self._on_language_changed)
         if self.tray_icon:
             try:
                 self.tray_icon.stop()
@@ -0,0 +1,128 @@
+import asyncio
+from core import event_bus
+
+_state = {"page": None, "loop": None, "page_dirty": False, "flush_scheduled": False, "pending": 0,
+          "suspended": False, "catch_up": False}
+_dirty = {}
+
+_stats = {"requests": 0, "flushes": 0, "patched": 0, "coalesced": 0, "direct": 0, "deferred": 0}
+
+def bind(page, loop=None):
+    _state["page"] = page
+    _state["loop"] = loop or asyncio.get_running_loop()
+    event_bus.register_debug_source("ui_update_requests", lambda: _stats["requests"])
+    event_bus.register_debug_source("ui_updates_coalesced", lambda: _stats["coalesced"])
+
+def unbind():
+    flush()
+    _state["page"] = None
+    _state["loop"] = None
+
+def _bound_loop():
+    loop = _state["loop"]
+    if loop is None or loop.is_closed() or _state["page"] is None:
+        return None
+    return loop
+
+def _update_now(controls: tuple):
+    _stats["direct"] += 1
+    for control in controls:
+        try:
+            if control is None:
+                if _state["page"] is not None:
+                    _state["page"].update()
+            elif control.page:
+                control.update()
+        except RuntimeError:
+            pass
+
+def request_update(*controls):
+    loop = _bound_loop()
+    if loop is None:
+        _stats["requests"] += 1
+        _update_now(controls or (None,))
+        return
+    if not event_bus._is_loop_thread(loop):
+        if not event_bus.call_in_loop(request_update, *controls):
+            _stats["requests"] += 1
+            _update_now(controls or (None,))
+        return
+
+    _stats["requests"] += 1
+    if _state["suspended"]:
+        _stats["deferred"] += 1
+        _state["catch_up"] = True
+        return
+
+    _state["pending"] += 1
+    page = _state["page"]
+    if not controls or any(control is None or control is page for control in controls):
+        _state["page_dirty"] = True
+    else:
+        for control in controls:
+            _dirty[id(control)] = control
+
+    if not _state["flush_scheduled"]:
+        _state["flush_scheduled"] = True
+        loop.call_soon(flush)
+
+def suspend():
+    flush()
+    _state["suspended"] = True
+
+def resume():
+    if not _state["suspended"]:
+        return
+    _state["suspended"] = False
+    if _state["catch_up"]:
+        _state["catch_up"] = False
+        request_update()
+
+def is_suspended() -> bool:
+    return _state["suspended"]
+
+def _is_mounted(control, page) -> bool:
+    try:
+        return control.page is page
+    except RuntimeError:
+        return False
+
+def _has_dirty_ancestor(control, dirty: dict) -> bool:
+    parent = control.parent
+    while parent is not None:
+        if id(parent) in dirty:
+            return True
+        parent = parent.parent
+    return False
+
+def flush():
+    _state["flush_scheduled"] = False
+    page = _state["page"]
+    pending = _state["pending"]
+    page_dirty = _state["page_dirty"]
+    dirty = {key: control for key, control in _dirty.items() if _is_mounted(control, page)}
+    _dirty.clear()
+    _state["pending"] = 0
+    _state["page_dirty"] = False
+    if page is None or (not dirty and not page_dirty):
+        return
+
+    if page_dirty:
+        targets = []
+    else:
+        targets = [control for control in dirty.values() if not _has_dirty_ancestor(control, dirty)]
+
+    _stats["flushes"] += 1
+    _stats["patched"] += len(targets) or 1
+    _stats["coalesced"] += max(0, pending - (len(targets) or 1))
+    try:
+        page.update(*targets)
+    except Exception as e:
+        print(f"Error flushing UI updates: {e}")
+
+def get_stats() -> dict:
+    return dict(_stats)
+
+def reset_stats():
+    for key in _stats:
+        _stats[key] = 0
@@ -3,6 +3,7 @@ import json
 import os
 import datetime
 import shutil
+from data.rollup import ROLLUP_METRICS, rollup_values
 
 DB_FILE = "user_data.db"
 JSON_FILE = "user_data.json"
@@ -36,13 +37,84 @@ def init_db():
         )
     ''')
     
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS daily_rollup (
+            date TEXT PRIMARY KEY,
+            {", ".join(f"{key} REAL" for key in ROLLUP_METRICS)}
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS food_history (
+            name TEXT PRIMARY KEY,
+            count INTEGER,
+            last_used REAL,
+            food TEXT
+        )
+    ''')
+    
     conn.commit()
     conn.close()
     
     _check_migration()
+    _backfill_rollup()
+    _migrate_food_history()
     
     _db_initialized = True
 
+_ROLLUP_INSERT = (
+    f"INSERT OR REPLACE INTO daily_rollup (date, {', '.join(ROLLUP_METRICS)}) "
+    f"VALUES (?, {', '.join('?' for _ in ROLLUP_METRICS)})"
+)
+
+def _save_rollup(cursor, date_str, summary):
+    cursor.execute(_ROLLUP_INSERT, (date_str, *rollup_values(summary)))
+
+def _backfill_rollup():
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT history.date, history.summary FROM history
+            LEFT JOIN daily_rollup ON daily_rollup.date = history.date
+            WHERE daily_rollup.date IS NULL
+        ''')
+        for row in cursor.fetchall():
+            try:
+                summary = json.loads(row['summary'])
+            except (json.JSONDecodeError, TypeError):
+                summary = {}
+            _save_rollup(cursor, row['date'], summary)
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"Error building daily rollup: {e}")
+
+def _migrate_food_history():
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT value FROM kv_store WHERE key = 'food_history'")
+        row = cursor.fetchone()
+        if row:
+            try:
+                entries = json.loads(row['value'])
+            except (json.JSONDecodeError, TypeError):
+                entries = []
+            for entry in entries if isinstance(entries, list) else []:
+                food = entry.get("food") if isinstance(entry, dict) else None
+                if isinstance(food, dict) and food.get("name"):
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO food_history (name, count, last_used, food) VALUES (?, ?, ?, ?)",
+                        (food["name"].strip().lower(), int(entry.get("count", 1)),
+                         float(entry.get("last_used", 0)), json.dumps(food, ensure_ascii=False))
+                    )
+            cursor.execute("DELETE FROM kv_store WHERE key = 'food_history'")
+            conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"Error migrating food history: {e}")
+
 def _check_migration():
     if os.path.exists(JSON_FILE) and not os.path.exists(DB_FILE + ".migrated"):
         try:
@@ -123,6 +195,7 @@ def save_history(date_str, summary):
         "INSERT OR REPLACE INTO history (date, summary) VALUES (?, ?)",
         (date_str, json.dumps(summary, ensure_ascii=False))
     )
+    _save_rollup(cursor, date_str, summary)
     
     conn.commit()
     conn.close()
@@ -142,6 +215,7 @@ def save_multiple_keys(data_dict):
                             "INSERT OR REPLACE INTO history (date, summary) VALUES (?, ?)",
                             (h_date, json.dumps(h_summary, ensure_ascii=False))
                         )
+                        _save_rollup(cursor, h_date, h_summary)
             else:
                 cursor.execute(
                     "INSERT OR REPLACE INTO kv_store (key, value) VALUES (?, ?)",
@@ -171,6 +245,21 @@ def get_month_history(year, month):
     conn.close()
     return result
 
+def get_year_rollup(year):
+    if not _db_initialized:
+        init_db()
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        f"SELECT date, {', '.join(ROLLUP_METRICS)} FROM daily_rollup WHERE date BETWEEN ? AND ?",
+        (f"{year:04d}-01-01", f"{year:04d}-12-31")
+    )
+    result = {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+    
+    conn.close()
+    return result
+
 def get_daily_history(date_str):
     if not _db_initialized:
         init_db()
@@ -188,3 +277,39 @@ def get_daily_history(date_str):
     
     conn.close()
     return result
+
+def get_food_history(limit):
+    if not _db_initialized:
+        init_db()
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        "SELECT name, count, last_used, food FROM food_history ORDER BY last_used DESC LIMIT ?",
+        (limit,)
+    )
+    
+    result = []
+    for row in cursor.fetchall():
+        try:
+            result.append({"count": row['count'], "last_used": row['last_used'], "food": json.loads(row['food'])})
+        except (json.JSONDecodeError, TypeError): pass
+    
+    conn.close()
+    return result
+
+def save_food_history_entry(name, count, last_used, food, evicted=None):
+    if not _db_initialized:
+        init_db()
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        "INSERT OR REPLACE INTO food_history (name, count, last_used, food) VALUES (?, ?, ?, ?)",
+        (name, count, last_used, json.dumps(food, ensure_ascii=False))
+    )
+    if evicted:
+        cursor.execute("DELETE FROM food_history WHERE name = ?", (evicted,))
+    
+    conn.commit()
+    conn.close()
@@ -19,6 +19,7 @@ def get_default_user_data():
         "china_ai_mode": False,
         "use_china_ai_mode": False,
         "reminder_active": False,
+        "reminder_kinds": ["water"],
         
 
         "water_intake": 0,
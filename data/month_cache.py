@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+from data import database
+
+MAX_MONTHS = 15
+
+def _month_key(year: int, month: int) -> tuple:
+    return int(year), int(month)
+
+def shift_month(year: int, month: int, delta: int) -> tuple:
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+class MonthCache:
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(MonthCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, max_months: int = MAX_MONTHS):
+        if hasattr(self, '_initialized'):
+            return
+        self._initialized = True
+        self.max_months = max_months
+        self._months = OrderedDict()
+        self._loading = set()
+        self._generation = 0
+        self._epoch = 0
+        self._versions = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "prefetched": 0}
+
+    def _store(self, key: tuple, data: dict):
+        self._months[key] = data
+        self._months.move_to_end(key)
+        while len(self._months) > self.max_months:
+            self._months.popitem(last=False)
+
+    def peek(self, year: int, month: int):
+        key = _month_key(year, month)
+        with self._lock:
+            data = self._months.get(key)
+            if data is not None:
+                self._months.move_to_end(key)
+                self.stats["hits"] += 1
+            return data
+
+    def get(self, year: int, month: int) -> dict:
+        data = self.peek(year, month)
+        if data is not None:
+            return data
+
+        key = _month_key(year, month)
+        with self._lock:
+            generation = self._generation
+        data = database.get_month_history(*key)
+        with self._lock:
+            self.stats["misses"] += 1
+            cached = self._months.get(key)
+            if cached is not None:
+                return cached
+            if generation == self._generation:
+                self._store(key, data)
+        return data
+
+    def _load_in_background(self, keys: list):
+        for key in keys:
+            try:
+                with self._lock:
+                    generation = self._generation
+                data = database.get_month_history(*key)
+            except Exception as e:
+                print(f"Error prefetching month {key[0]}-{key[1]:02d}: {e}")
+                data = None
+            with self._lock:
+                self._loading.discard(key)
+                if data is not None and key not in self._months and generation == self._generation:
+                    self._store(key, data)
+                    self.stats["prefetched"] += 1
+
+    def prefetch(self, year: int, month: int, radius: int = 1):
+        keys = []
+        with self._lock:
+            for delta in range(-radius, radius + 1):
+                key = shift_month(year, month, delta)
+                if key not in self._months and key not in self._loading:
+                    self._loading.add(key)
+                    keys.append(key)
+        if keys:
+            threading.Thread(target=self._load_in_background, args=(keys,), daemon=True).start()
+
+    def update_day(self, date_str: str, summary: dict):
+        try:
+            key = _month_key(date_str[:4], date_str[5:7])
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._generation += 1
+            self._versions[key] = self._versions.get(key, 0) + 1
+            data = self._months.get(key)
+            if data is not None:
+                data[date_str] = summary
+
+    def version(self, year: int, month: int) -> tuple:
+        key = _month_key(year, month)
+        with self._lock:
+            return self._epoch, self._versions.get(key, 0)
+
+    def clear(self):
+        with self._lock:
+            self._months.clear()
+            self._generation += 1
+            self._epoch += 1
+
+month_cache = MonthCache()
@@ -0,0 +1,22 @@
+ROLLUP_METRICS = ("water", "nutrition_score", "sleep_grade", "exercise_score")
+GRADE_VALUES = {"A": 1.0, "B": 0.8, "C": 0.6, "D": 0.4, "F": 0.2}
+
+def metric_value(summary: dict, data_key: str):
+    if not summary:
+        return None
+    if data_key == "water":
+        intake = summary.get("water_intake", 0)
+        goal = summary.get("water_goal", 2000) or 2000
+        return intake / goal if intake > 0 else None
+    if data_key == "sleep_grade":
+        if summary.get("sleep_duration", 0) > 0:
+            return GRADE_VALUES.get(summary.get(data_key, "F"), 0.2)
+        return None
+    score = summary.get(data_key, 0)
+    return score / 100.0 if score > 0 else None
+
+def rollup_values(summary: dict) -> tuple:
+    try:
+        return tuple(metric_value(summary, key) for key in ROLLUP_METRICS)
+    except (TypeError, AttributeError):
+        return (None,) * len(ROLLUP_METRICS)
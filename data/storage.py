@@ -1,9 +1,18 @@
+import copy
 import datetime
 import json
 from data import database
+from data.month_cache import month_cache
 from core import event_bus
+from core.nutrients import meal_totals
 from data.defaults import get_default_user_data
 
+PROFILE_KEYS = frozenset({"age", "gender", "height", "weight", "exercise_intensity", "environment"})
+DAILY_KEYS = frozenset({"water_intake", "water_records", "daily_meals", "daily_sleep", "daily_exercises"})
+SUMMARY_KEYS = PROFILE_KEYS | DAILY_KEYS
+
+_user_data_cache = None
+
 _INTENSITY_MIGRATION = {
     "almost no exercise": "sedentary",
     "light activity": "light_active",
@@ -42,11 +51,40 @@ def load_user_data() -> dict:
 
     return defaults
 
+def user_data_from(changes=None) -> dict:
+    
+    if isinstance(changes, event_bus.ChangeSet):
+        return changes.snapshot
+    return load_user_data()
+
+def _cached_user_data() -> dict:
+    
+    global _user_data_cache
+    if _user_data_cache is None:
+        _user_data_cache = load_user_data()
+    return _user_data_cache
+
+def _apply_changes(cache: dict, data: dict) -> event_bus.ChangeSet:
+    
+    changed = []
+    for key, value in data.items():
+        if key not in cache or cache[key] != value:
+            cache[key] = copy.deepcopy(value)
+            changed.append(key)
+
+    snapshot = dict(cache)
+    return event_bus.ChangeSet({key: snapshot[key] for key in changed}, snapshot=snapshot)
+
 def save_user_data(data: dict, update_history: bool = False) -> bool:
     
     try:
+        cache = _cached_user_data()
         database.save_multiple_keys(data)
-        event_bus.publish(event_bus.USER_DATA_SAVED, data)
+        if "history" in data:
+            month_cache.clear()
+        changes = _apply_changes(cache, data)
+        if changes:
+            event_bus.publish(event_bus.USER_DATA_SAVED, changes)
         
         if update_history:
             try:
@@ -83,6 +121,7 @@ def save_all_history(data: dict) -> bool:
     try:
         for date_str, summary in data.items():
             database.save_history(date_str, summary)
+        month_cache.clear()
         return True
     except Exception as e:
         print(f"Error saving history: {e}")
@@ -91,6 +130,7 @@ def save_all_history(data: dict) -> bool:
 def save_daily_summary(date_str: str, summary: dict) -> None:
     
     database.save_history(date_str, summary)
+    month_cache.update_day(date_str, summary)
 
 def load_daily_summary(date_str: str) -> dict:
     
@@ -98,7 +138,15 @@ def load_daily_summary(date_str: str) -> dict:
 
 def load_month_summaries(year: int, month: int) -> dict:
     
-    return database.get_month_history(year, month)
+    return month_cache.get(year, month)
+
+def prefetch_month_summaries(year: int, month: int) -> None:
+    
+    month_cache.prefetch(year, month)
+
+def load_year_rollup(year: int) -> dict:
+    
+    return database.get_year_rollup(year)
 
 def update_today_summary() -> dict:
     
@@ -145,17 +193,12 @@ def update_today_summary() -> dict:
 
 def _calculate_actual_intake(user_data: dict, today: str) -> dict:
     
-    actual_intake = {}
     daily_meals = user_data.get("daily_meals", {})
     
     if daily_meals.get("date") == today:
-        for meal in daily_meals.get("meals", []):
-            level1 = meal.get("level1", {})
-            for key, value in level1.items():
-                if isinstance(value, (int, float)):
-                    actual_intake[key] = actual_intake.get(key, 0) + value
+        return meal_totals(daily_meals.get("meals", []))
     
-    return actual_intake
+    return {}
 
 def _calculate_sleep_data(user_data: dict, today: str, score_func) -> tuple:
     
@@ -1,7 +1,15 @@
-import flet as ft
 import sys
+from core.startup_profiler import profiler, PROFILE_FLAG
+if PROFILE_FLAG in sys.argv:
+    profiler.start()
+    from data import database
+    profiler.instrument_database(database)
+
+with profiler.phase("import_flet"):
+    import flet as ft
 import os
-from ui import main as flet_main
+with profiler.phase("import_ui"):
+    from ui import main as flet_main
 
 def check_single_instance():
     import tempfile
@@ -88,13 +96,16 @@ def cleanup_lock_file():
         pass
 
 if __name__ == "__main__":
-    if not check_single_instance():
-        print("Another instance is already running. Bringing it to front.")
-        sys.exit(0)
+    with profiler.phase("single_instance_check"):
+        if not check_single_instance():
+            print("Another instance is already running. Bringing it to front.")
+            sys.exit(0)
     
     update_lock_file()
     
     import atexit
     atexit.register(cleanup_lock_file)
+    profiler.add_exit_hook(cleanup_lock_file)
     
+    profiler.mark("flet_run")
     ft.run(main=flet_main)
\ No newline at end of file
@@ -0,0 +1,51 @@
+import datetime
+
+import pytest
+
+from core import chart_series
+from core.chart_series import Series, build_series, downsample, range_months
+from data.month_cache import month_cache
+
+def test_downsample_keeps_short_series():
+    assert downsample([0.5, None, 1.0], 3) == Series((0.5, None, 1.0), 3)
+
+def test_downsample_averages_recorded_values_per_bucket():
+    values = [1.0, 3.0, None, None, 2.0]
+    series = downsample(values, 6, max_points=3)
+    assert series == Series((2.0, None, 2.0), 3)
+
+def test_downsample_bounds_point_count():
+    series = downsample([1.0] * 92, 92)
+    assert series.slots <= chart_series.MAX_POINTS
+    assert len(series.values) <= series.slots
+    assert set(series.values) == {1.0}
+
+def test_range_months_ends_at_requested_month():
+    assert range_months(2024, 2, 3) == [(2023, 12), (2024, 1), (2024, 2)]
+
+@pytest.fixture
+def months(monkeypatch):
+    loads = []
+    versions = {}
+    data = {"2024-02-01": {"water_intake": 1000, "water_goal": 2000}}
+    monkeypatch.setattr(chart_series, "_series_cache", chart_series.OrderedDict())
+    monkeypatch.setattr(month_cache, "version", lambda y, m: (0, versions.get((y, m), 0)))
+    monkeypatch.setattr(month_cache, "get", lambda y, m: loads.append((y, m)) or data)
+    return loads, versions
+
+def test_build_series_reuses_cached_series(months):
+    loads, _ = months
+    today = datetime.date(2024, 2, 3)
+    first = build_series("water", 2024, 2, today=today)
+    assert build_series("water", 2024, 2, today=today) is first
+    assert loads == [(2024, 2)]
+    assert first.values == (0.5, None, None)
+    assert first.slots == 29
+
+def test_build_series_reloads_after_month_changes(months):
+    loads, versions = months
+    today = datetime.date(2024, 2, 3)
+    build_series("water", 2024, 2, today=today)
+    versions[(2024, 2)] = 1
+    build_series("water", 2024, 2, today=today)
+    assert loads == [(2024, 2), (2024, 2)]
@@ -0,0 +1,86 @@
+import asyncio
+import gc
+
+import pytest
+
+from core import event_bus
+from core.event_bus import ChangeSet
+
+@pytest.fixture(autouse=True)
+def isolated_bus(monkeypatch):
+    monkeypatch.setattr(event_bus, "_subscribers", {})
+    monkeypatch.setattr(event_bus, "_pending", {})
+    monkeypatch.setattr(event_bus, "_flush_handle", None)
+    monkeypatch.setitem(event_bus._batching, "loop", None)
+    monkeypatch.setitem(event_bus._ui_loop, "loop", None)
+
+class Listener:
+
+    def __init__(self):
+        self.calls = []
+
+    def on_event(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+def test_merge_combines_change_sets():
+    first = ChangeSet({"weight": 70}, snapshot={"weight": 70, "height": 180})
+    second = ChangeSet({"height": 181}, snapshot={"weight": 70, "height": 181})
+    payloads = [((first,), {})]
+    event_bus._merge(payloads, (second,), {})
+    assert len(payloads) == 1
+    merged = payloads[0][0][0]
+    assert dict(merged) == {"weight": 70, "height": 181}
+    assert merged.snapshot == second.snapshot
+
+def test_merge_drops_repeated_bare_events():
+    payloads = [((), {})]
+    event_bus._merge(payloads, (), {})
+    assert payloads == [((), {})]
+
+def test_merge_keeps_distinct_payloads():
+    payloads = [((250,), {})]
+    event_bus._merge(payloads, (500,), {})
+    assert payloads == [((250,), {}), ((500,), {})]
+
+def test_batched_publishes_are_coalesced_per_tick():
+    listener = Listener()
+    event_bus.subscribe(event_bus.USER_DATA_SAVED, listener.on_event)
+
+    async def main():
+        event_bus.enable_batching()
+        event_bus.publish(event_bus.USER_DATA_SAVED, ChangeSet({"weight": 70}))
+        event_bus.publish(event_bus.USER_DATA_SAVED, ChangeSet({"height": 180}))
+        assert listener.calls == []
+        await asyncio.sleep(0)
+        event_bus.disable_batching()
+
+    asyncio.run(main())
+    assert len(listener.calls) == 1
+    assert dict(listener.calls[0][0][0]) == {"weight": 70, "height": 180}
+
+def test_keyed_subscription_skips_unrelated_changes():
+    listener = Listener()
+    event_bus.subscribe(event_bus.USER_DATA_SAVED, listener.on_event, keys=("weight",))
+    event_bus.publish(event_bus.USER_DATA_SAVED, ChangeSet({"height": 180}))
+    event_bus.publish(event_bus.USER_DATA_SAVED, ChangeSet({"weight": 70}))
+    assert len(listener.calls) == 1
+
+def test_release_drops_only_the_owners_subscriptions():
+    owner, other = Listener(), Listener()
+    event_bus.subscribe(event_bus.WATER_ADDED, owner.on_event)
+    event_bus.subscribe(event_bus.SLEEP_ADDED, owner.on_event)
+    event_bus.subscribe(event_bus.WATER_ADDED, other.on_event)
+
+    event_bus.release(owner)
+    event_bus.publish(event_bus.WATER_ADDED, 250)
+    event_bus.publish(event_bus.SLEEP_ADDED)
+
+    assert owner.calls == []
+    assert other.calls == [((250,), {})]
+
+def test_dead_subscribers_are_pruned():
+    listener = Listener()
+    event_bus.subscribe(event_bus.WATER_ADDED, listener.on_event)
+    del listener
+    gc.collect()
+    assert event_bus.debug_report()[event_bus.WATER_ADDED] == 0
@@ -0,0 +1,43 @@
+import flet as ft
+
+from ui.keyed_list import KeyedList
+
+def _make_list(**kwargs):
+    built = []
+
+    def build_row(item):
+        row = ft.Text(str(item["value"]))
+        built.append(row)
+        return row
+
+    return KeyedList(ft.Column(), build_row, **kwargs), built
+
+def test_unchanged_rows_are_reused():
+    view, built = _make_list()
+    view.set_items([{"id": 1, "value": "a"}, {"id": 2, "value": "b"}], update=False)
+    first = list(view.container.controls)
+    view.set_items([{"id": 2, "value": "b"}, {"id": 1, "value": "a"}], update=False)
+    assert view.container.controls == [first[1], first[0]]
+    assert len(built) == 2
+
+def test_changed_rows_are_rebuilt():
+    view, built = _make_list()
+    view.set_items([{"id": 1, "value": "a"}, {"id": 2, "value": "b"}], update=False)
+    untouched = view.container.controls[1]
+    view.set_items([{"id": 1, "value": "c"}, {"id": 2, "value": "b"}], update=False)
+    assert view.container.controls[0].value == "c"
+    assert view.container.controls[1] is untouched
+    assert len(built) == 3
+
+def test_custom_signature_controls_rebuilds():
+    view, built = _make_list(signature=lambda item: item["id"])
+    view.set_items([{"id": 1, "value": "a"}], update=False)
+    view.set_items([{"id": 1, "value": "c"}], update=False)
+    assert view.container.controls[0].value == "a"
+    assert len(built) == 1
+
+def test_rows_beyond_page_size_are_hidden():
+    view, _ = _make_list(page_size=2)
+    view.set_items([{"id": i, "value": i} for i in range(5)], update=False)
+    assert [c.value for c in view.container.controls[:2]] == ["0", "1"]
+    assert len(view.container.controls) == 3
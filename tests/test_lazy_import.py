@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+from core.lazy_import import check_import_budget, parse_importtime, lazy_import, DEFERRED_MODULES
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _loaded_deferred_modules(target: str) -> list:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    script = (
+        "import sys\n"
+        f"import {target}\n"
+        f"deferred = {DEFERRED_MODULES!r}\n"
+        "print('\\n'.join(name for name in sys.modules\n"
+        "                 if any(name == d or name.startswith(d + '.') for d in deferred)))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return [line for line in result.stdout.splitlines() if line]
+
+def test_app_import_defers_optional_modules():
+    assert check_import_budget("ui.app", budget_ms=float("inf"))
+    assert _loaded_deferred_modules("ui.app") == []
+
+def test_check_import_budget_reports_eager_modules(capsys):
+    assert not check_import_budget("core.notification", budget_ms=float("inf"))
+    assert "imported eagerly" in capsys.readouterr().out
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   core.event_bus\n"
+        "import time:      2500 |       2620 | ui.app\n"
+    )
+    modules = parse_importtime(stderr)
+    assert modules["ui.app"] == {"self_ms": 2.5, "cumulative_ms": 2.62}
+    assert modules["core.event_bus"]["self_ms"] == 0.12
+
+def test_lazy_import_loads_on_first_use():
+    name = "json.decoder"
+    saved = sys.modules.pop(name, None)
+    try:
+        JSONDecoder = lazy_import(name, "JSONDecoder")
+        assert name not in sys.modules
+        assert JSONDecoder().decode("[1]") == [1]
+        assert name in sys.modules
+    finally:
+        if saved is not None:
+            sys.modules[name] = saved
@@ -0,0 +1,67 @@
+import pytest
+
+from data import database
+from data.month_cache import MonthCache, shift_month
+
+@pytest.fixture
+def cache():
+    instance = object.__new__(MonthCache)
+    MonthCache.__init__(instance, max_months=3)
+    return instance
+
+def test_shift_month_wraps_years():
+    assert shift_month(2024, 1, -1) == (2023, 12)
+    assert shift_month(2024, 12, 1) == (2025, 1)
+    assert shift_month(2024, 3, -15) == (2022, 12)
+
+def test_get_caches_and_evicts_least_recent(cache, monkeypatch):
+    loads = []
+    monkeypatch.setattr(database, "get_month_history", lambda y, m: loads.append((y, m)) or {})
+    for month in (1, 2, 3):
+        cache.get(2024, month)
+    cache.get(2024, 1)
+    cache.get(2024, 4)
+    assert cache.peek(2024, 2) is None
+    assert cache.peek(2024, 1) is not None
+    assert loads == [(2024, 1), (2024, 2), (2024, 3), (2024, 4)]
+
+def test_get_does_not_store_data_invalidated_while_loading(cache, monkeypatch):
+    def load(year, month):
+        cache.update_day("2024-05-10", {"water_intake": 500})
+        return {"2024-05-10": {"water_intake": 0}}
+
+    monkeypatch.setattr(database, "get_month_history", load)
+    assert cache.get(2024, 5) == {"2024-05-10": {"water_intake": 0}}
+    assert cache.peek(2024, 5) is None
+
+def test_prefetch_does_not_store_data_cleared_while_loading(cache, monkeypatch):
+    def load(year, month):
+        cache.clear()
+        return {}
+
+    monkeypatch.setattr(database, "get_month_history", load)
+    cache._loading.add((2024, 5))
+    cache._load_in_background([(2024, 5)])
+    assert cache.peek(2024, 5) is None
+    assert cache._loading == set()
+    assert cache.stats["prefetched"] == 0
+
+def test_prefetch_keeps_month_loaded_by_get(cache, monkeypatch):
+    fresh = {"2024-05-10": {"water_intake": 750}}
+
+    def load(year, month):
+        cache._store((2024, 5), fresh)
+        return {}
+
+    monkeypatch.setattr(database, "get_month_history", load)
+    cache._load_in_background([(2024, 5)])
+    assert cache.peek(2024, 5) is fresh
+
+def test_update_day_patches_cached_month_and_bumps_version(cache, monkeypatch):
+    monkeypatch.setattr(database, "get_month_history", lambda y, m: {})
+    cache.get(2024, 5)
+    before = cache.version(2024, 5)
+    cache.update_day("2024-05-10", {"water_intake": 500})
+    assert cache.peek(2024, 5) == {"2024-05-10": {"water_intake": 500}}
+    assert cache.version(2024, 5) != before
+    assert cache.version(2024, 6) == (0, 0)
@@ -0,0 +1,80 @@
+import pytest
+
+from core import notification
+from core.notification import NotificationWorker
+
+class Clock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(notification.time, "monotonic", clock)
+    return clock
+
+@pytest.fixture
+def delivered(monkeypatch):
+    sent = []
+    monkeypatch.setattr(notification, "deliver_notification", lambda *args: sent.append(args) or True)
+    return sent
+
+@pytest.fixture
+def worker():
+    instance = object.__new__(NotificationWorker)
+    NotificationWorker.__init__(instance)
+    return instance
+
+def test_submit_dedupes_repeated_notifications(worker, delivered, clock):
+    assert worker.submit("Health", "Drink water", dedupe_key=("app_title", "reminder_warning"))
+    assert not worker.submit("Health", "Drink water", dedupe_key=("app_title", "reminder_warning"))
+    assert worker.submit("Health", "Time to eat", dedupe_key=("app_title", "reminder_meals"))
+    worker.join()
+    assert len(delivered) == 2
+    assert worker.stats["deduped"] == 1
+    assert worker.stats["sent"] == 2
+
+def test_submit_allows_repeat_after_dedupe_window(worker, delivered, clock):
+    assert worker.submit("Health", "Drink water")
+    clock.now += notification.DEDUPE_SECONDS
+    assert worker.submit("Health", "Drink water")
+    worker.join()
+    assert len(delivered) == 2
+
+@pytest.fixture
+def backends(monkeypatch, clock):
+    calls = []
+
+    def failing(title, message, duration):
+        calls.append("native")
+        raise OSError("no notification daemon")
+
+    def working(title, message, duration):
+        calls.append("plyer")
+
+    monkeypatch.setattr(notification, "SYSTEM", "Linux")
+    monkeypatch.setattr(notification, "_SENDERS", {"notify-send": failing, "plyer": working})
+    monkeypatch.setattr(notification, "_play_beep", lambda: None)
+    monkeypatch.setattr(notification, "_capabilities", {})
+    monkeypatch.setattr(notification, "_retry_at", {})
+    return calls
+
+def test_failed_backend_is_skipped_until_retry(backends, clock):
+    assert notification.deliver_notification("Health", "Drink water")
+    assert notification.deliver_notification("Health", "Drink water")
+    assert backends == ["native", "plyer", "plyer"]
+    assert notification.get_capabilities() == {"notify-send": False, "plyer": True}
+
+    clock.now += notification.BACKEND_RETRY_SECONDS + 1
+    assert notification.deliver_notification("Health", "Drink water")
+    assert backends[3:] == ["native", "plyer"]
+
+def test_delivery_fails_when_every_backend_is_down(backends, monkeypatch):
+    monkeypatch.setitem(notification._SENDERS, "plyer", notification._SENDERS["notify-send"])
+    assert not notification.deliver_notification("Health", "Drink water")
+    assert not notification.deliver_notification("Health", "Drink water")
+    assert backends == ["native", "native"]
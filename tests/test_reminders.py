@@ -0,0 +1,50 @@
+import datetime
+
+import pytest
+
+from core.reminders import Job, ReminderScheduler, daily_at, half_hour_period, next_half_hour
+
+def at(hour, minute, second=0, day=10):
+    return datetime.datetime(2024, 5, day, hour, minute, second)
+
+@pytest.mark.parametrize("now, expected", [
+    (at(9, 0), at(9, 30)),
+    (at(9, 29, 59), at(9, 30)),
+    (at(9, 30), at(10, 0)),
+    (at(23, 45), at(0, 0, day=11)),
+])
+def test_next_half_hour(now, expected):
+    assert next_half_hour(now) == expected
+
+def test_half_hour_period_matches_next_half_hour_boundary():
+    assert half_hour_period(at(9, 29, 59)) != half_hour_period(next_half_hour(at(9, 29, 59)))
+    assert half_hour_period(at(9, 30)) == half_hour_period(at(9, 59, 59))
+
+def test_daily_at_picks_next_time_today():
+    next_due = daily_at((20, 0), (8, 0), (12, 30))
+    assert next_due(at(7, 0)) == at(8, 0)
+    assert next_due(at(8, 0)) == at(12, 30)
+    assert next_due(at(12, 31)) == at(20, 0)
+
+def test_daily_at_rolls_over_to_tomorrow():
+    next_due = daily_at((8, 0), (20, 0))
+    assert next_due(at(20, 0)) == at(8, 0, day=11)
+    assert next_due(at(23, 59)) == at(8, 0, day=11)
+
+def test_scheduler_runs_due_jobs_and_reschedules():
+    scheduler = object.__new__(ReminderScheduler)
+    ReminderScheduler.__init__(scheduler)
+    calls = []
+    meals = Job("meals", daily_at((8, 0), (12, 0)), calls.append)
+    sleep = Job("sleep", daily_at((8, 0)), calls.append)
+    scheduler._push(meals, at(7, 0))
+    scheduler._push(sleep, at(7, 0))
+    sleep.cancel()
+
+    scheduler._run_due(at(7, 59))
+    assert calls == []
+    scheduler._run_due(at(8, 0))
+    assert calls == [at(8, 0)]
+    assert scheduler.next_due("meals") == at(12, 0)
+    assert scheduler.next_due("sleep") is None
+    assert scheduler.next_due() == at(12, 0)
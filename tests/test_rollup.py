@@ -0,0 +1,37 @@
+import pytest
+
+from data import database
+from data.rollup import ROLLUP_METRICS, metric_value, rollup_values
+
+def test_rollup_values_follow_metric_order():
+    summary = {
+        "water_intake": 1500, "water_goal": 2000,
+        "nutrition_score": 80,
+        "sleep_duration": 420, "sleep_grade": "B",
+        "exercise_score": 0,
+    }
+    assert rollup_values(summary) == (0.75, 0.8, 0.8, None)
+    assert len(rollup_values(summary)) == len(ROLLUP_METRICS)
+
+def test_rollup_values_of_empty_summary():
+    assert rollup_values({}) == (None,) * len(ROLLUP_METRICS)
+    assert rollup_values(None) == (None,) * len(ROLLUP_METRICS)
+
+def test_rollup_values_tolerate_malformed_summary():
+    assert rollup_values({"water_intake": "a lot"}) == (None,) * len(ROLLUP_METRICS)
+
+def test_metric_value_needs_recorded_sleep_for_grade():
+    assert metric_value({"sleep_grade": "A"}, "sleep_grade") is None
+    assert metric_value({"sleep_duration": 300, "sleep_grade": "?"}, "sleep_grade") == 0.2
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(database, "_db_initialized", False)
+    yield
+    monkeypatch.setattr(database, "_db_initialized", False)
+
+def test_saved_history_is_rolled_up(temp_db):
+    database.save_history("2024-05-10", {"water_intake": 1000, "water_goal": 2000, "nutrition_score": 50})
+    database.save_history("2023-12-31", {"water_intake": 2000, "water_goal": 2000})
+    assert database.get_year_rollup(2024) == {"2024-05-10": (0.5, 0.5, None, None)}
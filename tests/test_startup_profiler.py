@@ -0,0 +1,42 @@
+import json
+import sqlite3
+
+from core.startup_profiler import StartupProfiler, check_report, PROFILE_FLAG, REPORT_FLAG, BUDGET_FLAG
+
+def _generate_report(tmp_path, monkeypatch, budget_ms=3000):
+    monkeypatch.setattr(sqlite3, "connect", sqlite3.connect)
+    report_path = tmp_path / "startup_profile.json"
+
+    profiler = StartupProfiler()
+    profiler.start([PROFILE_FLAG, REPORT_FLAG, str(report_path), BUDGET_FLAG, str(budget_ms)])
+    with profiler.phase("build_ui"):
+        sqlite3.connect(":memory:").close()
+    profiler.mark("first_frame")
+    profiler.finish()
+    return report_path
+
+def test_check_report_passes_within_budget(tmp_path, monkeypatch):
+    report_path = _generate_report(tmp_path, monkeypatch)
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["within_budget"]
+    assert report["phases"][0]["name"] == "build_ui"
+    assert report["phases"][0]["db_calls"] == 1
+    assert check_report(str(report_path))
+
+def test_check_report_fails_over_budget(tmp_path, monkeypatch, capsys):
+    report_path = _generate_report(tmp_path, monkeypatch)
+
+    assert not check_report(str(report_path), budget_ms=0)
+    assert "exceeds budget" in capsys.readouterr().out
+
+def test_check_report_uses_budget_from_report(tmp_path, monkeypatch):
+    report_path = _generate_report(tmp_path, monkeypatch, budget_ms=0)
+
+    assert not check_report(str(report_path))
+
+def test_check_report_fails_without_first_frame(tmp_path):
+    report_path = tmp_path / "startup_profile.json"
+    report_path.write_text(json.dumps({"budget_ms": 3000, "phases": []}), encoding="utf-8")
+
+    assert not check_report(str(report_path))
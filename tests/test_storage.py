@@ -0,0 +1,21 @@
+from data.storage import _apply_changes
+
+def test_apply_changes_reports_only_changed_keys():
+    cache = {"weight": 70, "daily_meals": {"breakfast": []}}
+    changes = _apply_changes(cache, {"weight": 70, "water_intake": 500})
+    assert changes.changed_keys == {"water_intake"}
+    assert changes.snapshot == {"weight": 70, "daily_meals": {"breakfast": []}, "water_intake": 500}
+
+def test_apply_changes_copies_changed_values():
+    meals = {"breakfast": [{"name": "egg"}]}
+    cache = {}
+    changes = _apply_changes(cache, {"daily_meals": meals})
+    meals["breakfast"].append({"name": "toast"})
+    assert cache["daily_meals"] == {"breakfast": [{"name": "egg"}]}
+    assert changes["daily_meals"] == {"breakfast": [{"name": "egg"}]}
+
+def test_apply_changes_snapshot_is_detached_from_cache():
+    cache = {"weight": 70}
+    changes = _apply_changes(cache, {"height": 180})
+    cache["weight"] = 71
+    assert changes.snapshot["weight"] == 70
@@ -1,12 +1,14 @@
 import flet as ft
-from ui.styles import get_card_style
+from ui.styles import get_card_style, theme_manager
 from core.i18n import i18n_manager, I18nText
 from data.storage import load_user_data
+from core import update_scheduler
 
 class ChinaAIModeCard(ft.Container):
     def __init__(self):
         style = get_card_style()
         super().__init__(**style)
+        theme_manager.track_card(self)
         
 
         user_data = load_user_data()
@@ -47,7 +49,7 @@ class ChinaAIModeCard(ft.Container):
             row = self.content.controls[0]
             if isinstance(row, ft.Row) and len(row.controls) > 2:
                 row.controls[2].value = f"({i18n_manager.t('china_ai_mode_note')})"
-        self.update()
+        update_scheduler.request_update(self)
 
     def get_selected_mode(self):
         
@@ -1,8 +1,9 @@
 import flet as ft
-from ui.styles import get_card_style
+from ui.styles import get_card_style, theme_manager
 from ui.Desktop.utils.selection_dialog import SelectionDialog, SelectionOption
 from core.i18n import i18n_manager, I18nText
 from data.storage import load_user_data
+from core import update_scheduler
 
 CLOSE_MODE_OPTIONS = ["ask", "minimize", "quit"]
 
@@ -10,6 +11,7 @@ class CloseModeCard(ft.Container):
     def __init__(self):
         style = get_card_style()
         super().__init__(**style)
+        theme_manager.track_card(self)
         
 
         user_data = load_user_data()
@@ -63,7 +65,7 @@ class CloseModeCard(ft.Container):
             return
 
         self.mode_selector.set_selected(self.selected_mode)
-        self.update()
+        update_scheduler.request_update(self)
 
     def get_selected_mode(self):
         
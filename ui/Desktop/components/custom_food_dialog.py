@@ -2,6 +2,7 @@ import flet as ft
 from core.i18n import i18n_manager, I18nText
 from data.storage import load_user_data
 import copy
+from core import update_scheduler
 
 class CustomFoodDialog(ft.AlertDialog):
     
@@ -96,6 +97,21 @@ class CustomFoodDialog(ft.AlertDialog):
             read_only=True,
             width=520
         )
+        i18n_manager.track(self.prompt_text, label="food_custom_ai_prompt")
+
+        for field, label_key, unit in (
+            (self.calories_input, "food_calories", "kcal"),
+            (self.protein_input, "food_protein", "g"),
+            (self.fat_input, "food_fat", "g"),
+            (self.carbs_input, "food_carbs", "g"),
+            (self.fiber_input, "food_fiber", "g"),
+            (self.sugar_input, "food_sugar", "g"),
+            (self.sodium_input, "food_sodium", "mg"),
+            (self.calcium_input, "food_calcium", "mg"),
+            (self.vitamin_c_input, "food_vitamin_c", "mg"),
+            (self.vitamin_d_input, "food_vitamin_d", "µg"),
+        ):
+            i18n_manager.track(field, label=lambda label_key=label_key, unit=unit: f"{i18n_manager.t(label_key)} ({unit})")
         
 
         content = ft.Column([
@@ -103,7 +119,7 @@ class CustomFoodDialog(ft.AlertDialog):
             ft.Container(
                 content=ft.Column([
                     ft.Row([
-                        ft.Text(i18n_manager.t("food_custom_name"), size=14, weight=ft.FontWeight.BOLD),
+                        I18nText(key="food_custom_name", size=14, weight=ft.FontWeight.BOLD),
                         ft.Container(expand=True),
                         ft.IconButton(
                             icon=ft.Icons.ADD_CIRCLE,
@@ -129,15 +145,15 @@ class CustomFoodDialog(ft.AlertDialog):
 
             ft.Row([
                 ft.ElevatedButton(
-                    content=ft.Text(i18n_manager.t("food_custom_generate_prompt")),
+                    content=I18nText(key="food_custom_generate_prompt"),
                     icon=ft.Icons.AUTO_AWESOME,
                     on_click=self._generate_prompt
                 ),
-                ft.IconButton(
+                i18n_manager.track(ft.IconButton(
                     icon=ft.Icons.COPY,
                     tooltip=i18n_manager.t("food_custom_copy_prompt"),
                     on_click=self._copy_prompt
-                )
+                ), tooltip="food_custom_copy_prompt")
             ], spacing=10),
             ft.Container(height=8),
             self.prompt_text,
@@ -155,7 +171,7 @@ class CustomFoodDialog(ft.AlertDialog):
 
             ft.Row([
                 ft.OutlinedButton(
-                    content=ft.Text(i18n_manager.t("food_custom_paste_and_fill"), color=ft.Colors.GREEN_600),
+                    content=I18nText(key="food_custom_paste_and_fill", color=ft.Colors.GREEN_600),
                     icon=ft.Icons.PASTE,
                     icon_color=ft.Colors.GREEN_600,
                     style=ft.ButtonStyle(side=ft.BorderSide(1, ft.Colors.GREEN_600)),
@@ -178,7 +194,7 @@ class CustomFoodDialog(ft.AlertDialog):
         super().__init__(
             modal=True,
             title=ft.Container(
-                content=ft.Text(i18n_manager.t("food_custom_dialog_title"), size=20, weight=ft.FontWeight.BOLD),
+                content=I18nText(key="food_custom_dialog_title", size=20, weight=ft.FontWeight.BOLD),
                 padding=ft.padding.only(bottom=10)
             ),
             content=ft.Container(
@@ -189,11 +205,11 @@ class CustomFoodDialog(ft.AlertDialog):
             ),
             actions=[
                 ft.TextButton(
-                    content=ft.Text(i18n_manager.t("food_details_close")),
+                    content=I18nText(key="food_details_close"),
                     on_click=self._close
                 ),
                 ft.ElevatedButton(
-                    content=ft.Text(i18n_manager.t("food_add_tooltip")),
+                    content=I18nText(key="food_add_tooltip"),
                     on_click=self._save
                 )
             ],
@@ -220,6 +236,9 @@ class CustomFoodDialog(ft.AlertDialog):
             value="g",
             width=80
         )
+        i18n_manager.track(name_input, label=lambda: f"{i18n_manager.t('food_custom_name')} {item_index + 1}")
+        i18n_manager.track(portion_input, label="food_custom_portion")
+        i18n_manager.track(unit_input, label="food_custom_unit")
         
         self.food_items.append({
             "name": name_input,
@@ -238,14 +257,14 @@ class CustomFoodDialog(ft.AlertDialog):
     def _on_add_food_item(self, e):
         
         self._add_food_item()
-        self.food_items_container.update()
+        update_scheduler.request_update(self.food_items_container)
     
     def _on_remove_food_item(self, e):
         
         if len(self.food_items) > 1:
             self.food_items.pop()
             self.food_items_container.controls.pop()
-            self.food_items_container.update()
+            update_scheduler.request_update(self.food_items_container)
         
     def _build_ai_buttons_row(self):
         
@@ -256,17 +275,17 @@ class CustomFoodDialog(ft.AlertDialog):
 
             return ft.Row([
                 ft.TextButton(
-                    content=ft.Text(i18n_manager.t("food_custom_open_deepseek")),
+                    content=I18nText(key="food_custom_open_deepseek"),
                     icon=ft.Icons.ROCKET_LAUNCH,
                     on_click=lambda e: self._open_url("https://chat.deepseek.com/")
                 ),
                 ft.TextButton(
-                    content=ft.Text(i18n_manager.t("food_custom_open_doubao")),
+                    content=I18nText(key="food_custom_open_doubao"),
                     icon=ft.Icons.OPEN_IN_NEW,
                     on_click=lambda e: self._open_url("https://www.doubao.com/chat/")
                 ),
                 ft.TextButton(
-                    content=ft.Text(i18n_manager.t("food_custom_open_qwen")),
+                    content=I18nText(key="food_custom_open_qwen"),
                     icon=ft.Icons.OPEN_IN_NEW,
                     on_click=lambda e: self._open_url("https://tongyi.aliyun.com/qianwen/")
                 ),
@@ -275,17 +294,17 @@ class CustomFoodDialog(ft.AlertDialog):
 
             return ft.Row([
                 ft.TextButton(
-                    content=ft.Text(i18n_manager.t("food_custom_open_chatgpt")),
+                    content=I18nText(key="food_custom_open_chatgpt"),
                     icon=ft.Icons.ROCKET_LAUNCH,
                     on_click=lambda e: self._open_url("https://chatgpt.com/?temporary-chat=true")
                 ),
                 ft.TextButton(
-                    content=ft.Text(i18n_manager.t("food_custom_open_gemini")),
+                    content=I18nText(key="food_custom_open_gemini"),
                     icon=ft.Icons.OPEN_IN_NEW,
                     on_click=lambda e: self._open_url("https://gemini.google.com/")
                 ),
                 ft.TextButton(
-                    content=ft.Text(i18n_manager.t("food_custom_open_grok")),
+                    content=I18nText(key="food_custom_open_grok"),
                     icon=ft.Icons.OPEN_IN_NEW,
                     on_click=lambda e: self._open_url("https://grok.com/")
                 ),
@@ -338,7 +357,7 @@ class CustomFoodDialog(ft.AlertDialog):
         
         if not is_all_valid:
             self.prompt_text.value = i18n_manager.t("food_input_invalid")
-            self.prompt_text.update()
+            update_scheduler.request_update(self.prompt_text)
             return
 
         food_list = [f"{item['portion']}{item['unit']} {item['name']}" for item in valid_items]
@@ -365,7 +384,7 @@ class CustomFoodDialog(ft.AlertDialog):
             )
         
         self.prompt_text.value = prompt
-        self.prompt_text.update()
+        update_scheduler.request_update(self.prompt_text)
     
     def _copy_prompt(self, e):
         
@@ -386,11 +405,11 @@ class CustomFoodDialog(ft.AlertDialog):
 
             try:
                 self.page.snack_bar = ft.SnackBar(
-                    content=ft.Text(i18n_manager.t("food_custom_prompt_copied")),
+                    content=I18nText(key="food_custom_prompt_copied"),
                     duration=2000
                 )
                 self.page.snack_bar.open = True
-                self.page.update()
+                update_scheduler.request_update()
             except Exception:
                 pass
                 
@@ -445,15 +464,15 @@ class CustomFoodDialog(ft.AlertDialog):
                 self.vitamin_c_input.value = str(data.get("vitamin_c", 0))
                 self.vitamin_d_input.value = str(data.get("vitamin_d", 0))
                 
-                self.update()
+                update_scheduler.request_update(self)
                 
                 self.page.snack_bar = ft.SnackBar(
-                    content=ft.Text(i18n_manager.t("food_custom_autofill_success")),
+                    content=I18nText(key="food_custom_autofill_success"),
                     bgcolor=ft.Colors.GREEN_700,
                     duration=2000
                 )
                 self.page.snack_bar.open = True
-                self.page.update()
+                update_scheduler.request_update()
             else:
                 raise ValueError("No JSON found")
                 
@@ -461,12 +480,12 @@ class CustomFoodDialog(ft.AlertDialog):
             print(f"JSON Parse Error: {ex}")
             try:
                 self.page.snack_bar = ft.SnackBar(
-                    content=ft.Text(i18n_manager.t("food_custom_json_error")),
+                    content=I18nText(key="food_custom_json_error"),
                     bgcolor=ft.Colors.RED_700,
                     duration=3000
                 )
                 self.page.snack_bar.open = True
-                self.page.update()
+                update_scheduler.request_update()
             except:
                 pass
 
@@ -493,7 +512,7 @@ class CustomFoodDialog(ft.AlertDialog):
         if not valid_foods:
 
             self.food_items[0]["name"].error_text = i18n_manager.t("food_error_select")
-            self.food_items[0]["name"].update()
+            update_scheduler.request_update(self.food_items[0]["name"])
             return
         
 
@@ -562,5 +581,4 @@ class CustomFoodDialog(ft.AlertDialog):
         self.vitamin_d_input.value = "0"
         self.prompt_text.value = ""
         
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
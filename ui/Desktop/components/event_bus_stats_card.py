@@ -0,0 +1,131 @@
+import os
+import asyncio
+import flet as ft
+from ui.styles import get_card_style, theme_manager
+from core import event_bus
+from core import update_scheduler
+from core.i18n import I18nText
+
+DEV_TOOLS_ENABLED = os.environ.get("HEALTH_APP_DEV_TOOLS") == "1"
+REFRESH_INTERVAL = 2
+MAX_HANDLER_ROWS = 12
+
+class EventBusStatsCard(ft.Container):
+    def __init__(self):
+        style = get_card_style()
+        super().__init__(**style)
+        theme_manager.track_card(self)
+        self.margin = ft.margin.only(top=20)
+        self.running = False
+        self.refresh_task = None
+
+        self.topics_row = ft.Row(wrap=True, spacing=8, run_spacing=5)
+        self.subscribers_row = ft.Row(wrap=True, spacing=8, run_spacing=5)
+        self.handlers_column = ft.Column(spacing=2)
+
+        self.content = ft.Column(
+            [
+                ft.Row(
+                    [
+                        ft.Row([
+                            ft.Icon(ft.Icons.SPEED, color=ft.Colors.DEEP_ORANGE_400),
+                            I18nText(key="dev_event_stats_title", size=16, weight=ft.FontWeight.W_500),
+                        ], spacing=10),
+                        ft.Row([
+                            ft.IconButton(icon=ft.Icons.REFRESH, icon_size=18, on_click=lambda _: self.refresh()),
+                            ft.IconButton(icon=ft.Icons.DELETE_SWEEP, icon_size=18, on_click=self._reset),
+                        ], spacing=0),
+                    ],
+                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                ),
+                I18nText(key="dev_event_stats_publishes", size=12, color=ft.Colors.GREY_600),
+                self.topics_row,
+                I18nText(key="dev_event_stats_subscribers", size=12, color=ft.Colors.GREY_600),
+                self.subscribers_row,
+                I18nText(key="dev_event_stats_handlers", size=12, color=ft.Colors.GREY_600),
+                self.handlers_column,
+            ],
+            spacing=8
+        )
+        self.refresh(update_ui=False)
+
+    def did_mount(self):
+        self.running = True
+        if not update_scheduler.is_suspended():
+            self._start_refresh()
+        event_bus.subscribe(event_bus.BACKGROUND_CHANGED, self._on_background_changed)
+
+    def will_unmount(self):
+        self.running = False
+        self._stop_refresh()
+        event_bus.release(self)
+
+    def _start_refresh(self):
+        if self.refresh_task is None or self.refresh_task.done():
+            self.refresh_task = asyncio.create_task(self._refresh_loop())
+
+    def _stop_refresh(self):
+        if self.refresh_task is not None:
+            self.refresh_task.cancel()
+            self.refresh_task = None
+
+    def _on_background_changed(self, in_background, *args, **kwargs):
+        if not self.running:
+            return
+        if in_background:
+            self._stop_refresh()
+        else:
+            self.refresh()
+            self._start_refresh()
+
+    async def _refresh_loop(self):
+        while self.running:
+            await asyncio.sleep(REFRESH_INTERVAL)
+            if self.running and not update_scheduler.is_suspended():
+                self.refresh()
+
+    def _reset(self, e):
+        event_bus.reset_stats()
+        self.refresh()
+
+    def _chip(self, label: str, value, color=ft.Colors.BLUE_GREY_50):
+        return ft.Container(
+            content=ft.Text(f"{label}: {value}", size=11, color=ft.Colors.GREY_800),
+            padding=ft.padding.symmetric(horizontal=6, vertical=2),
+            bgcolor=color,
+            border_radius=4
+        )
+
+    def refresh(self, update_ui=True):
+        stats = event_bus.get_stats()
+        self.topics_row.controls = [
+            self._chip(topic, count) for topic, count in sorted(stats["publishes"].items())
+        ]
+        self.subscribers_row.controls = [
+            self._chip(topic, count, ft.Colors.GREEN_50)
+            for topic, count in sorted(event_bus.debug_report().items())
+        ]
+
+        self.handlers_column.controls.clear()
+        for item in stats["handlers"][:MAX_HANDLER_ROWS]:
+            slow = item["p95_ms"] >= stats["slow_ms"]
+            self.handlers_column.controls.append(
+                ft.Row(
+                    [
+                        ft.Text(f"{item['handler']} ({item['event']})", size=11, expand=True,
+                                color=ft.Colors.RED_700 if slow else ft.Colors.GREY_900),
+                        ft.Text(
+                            f"n={item['calls']}  total={item['total_ms']:.1f}  p95={item['p95_ms']:.1f}  "
+                            f"max={item['max_ms']:.1f} ms  err={item['errors']}",
+                            size=11, color=ft.Colors.GREY_700
+                        ),
+                    ],
+                    spacing=10
+                )
+            )
+
+        if update_ui:
+            try:
+                update_scheduler.request_update(self)
+            except RuntimeError:
+                pass
@@ -1,7 +1,7 @@
 import flet as ft
 import datetime
 import uuid
-from ui.styles import AppColors, CARD_STYLE
+from ui.styles import AppColors, CARD_STYLE, theme_manager
 from core import event_bus
 from data.storage import load_user_data, save_user_data
 from ui.Desktop.utils.confirmation import create_confirmation_dialog
@@ -9,6 +9,8 @@ from ui.Desktop.utils.selection_dialog import SelectionDialog, SelectionOption
 from core.i18n import i18n_manager, I18nText
 
 from core.calculations import EXERCISE_METS, get_calories_for_exercise, get_hourly_calories
+from ui.keyed_list import KeyedList
+from core import update_scheduler
 
 try:
     from pypinyin import pinyin, Style
@@ -52,6 +54,7 @@ EXERCISE_TYPES = _keys
 class ExerciseCard(ft.Container):
     def __init__(self):
         super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
         self.records = []
         self._record_to_delete = None
         self.user_weight = 70
@@ -70,8 +73,7 @@ class ExerciseCard(ft.Container):
             self.page.overlay.append(self.type_dialog)
 
         self.intensity_selector.did_mount()
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
 
     def will_unmount(self):
         if self.page and self.confirmation_dialog in self.page.overlay:
@@ -134,6 +136,7 @@ class ExerciseCard(ft.Container):
             i18n_manager.t(f"exercise_type_{self.selected_type}"),
             size=14
         )
+        i18n_manager.track(self.type_display_text, value=f"exercise_type_{self.selected_type}")
         
 
         self.type_selector_container = ft.Container(
@@ -154,12 +157,13 @@ class ExerciseCard(ft.Container):
             content_padding=10,
             on_change=self._on_search_type
         )
+        i18n_manager.track(self.type_search_box, hint_text="search_placeholder")
         
 
         self.type_list_view = ft.ListView(spacing=0, height=300)
 
         self.type_dialog = ft.AlertDialog(
-            title=ft.Text(i18n_manager.t("exercise_type")),
+            title=I18nText(key="exercise_type"),
             content=ft.Container(
                 content=ft.Column([
                     self.type_search_box,
@@ -170,7 +174,7 @@ class ExerciseCard(ft.Container):
                 height=400,
                 padding=0
             ),
-            actions=[ft.TextButton(i18n_manager.t("cancel_button"), on_click=self._close_type_dialog)],
+            actions=[i18n_manager.track(ft.TextButton(i18n_manager.t("cancel_button"), on_click=self._close_type_dialog), content="cancel_button")],
             modal=True,
         )
         
@@ -183,6 +187,7 @@ class ExerciseCard(ft.Container):
             keyboard_type=ft.KeyboardType.NUMBER,
             border_radius=8,
         )
+        i18n_manager.track(self.duration_input, label=lambda: f"{i18n_manager.t('exercise_duration')} ({i18n_manager.t('exercise_min')})")
         
 
         intensity_options = [
@@ -208,6 +213,7 @@ class ExerciseCard(ft.Container):
             border_radius=8,
             visible=False,
         )
+        i18n_manager.track(self.custom_type_input, label="exercise_custom_type", hint_text="exercise_custom_type_hint")
         
 
         initial_hourly = get_hourly_calories("running", "medium", self.user_weight)
@@ -219,9 +225,11 @@ class ExerciseCard(ft.Container):
             keyboard_type=ft.KeyboardType.NUMBER,
             border_radius=8,
         )
+        i18n_manager.track(self.hourly_kcal_input, label=lambda: f"{i18n_manager.t('exercise_hourly_kcal')} ({i18n_manager.t('exercise_kcal')}/h)")
         
 
         self.records_column = ft.Column(spacing=10)
+        self.records_view = KeyedList(self.records_column, self._build_record_row, empty_builder=self._build_empty_row)
         
 
         self.confirmation_dialog = create_confirmation_dialog(
@@ -234,8 +242,7 @@ class ExerciseCard(ft.Container):
         self.filtered_exercise_types = self.all_exercise_types
         self._update_type_list()
         self.type_dialog.open = True
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
 
     def _on_search_type(self, e):
         
@@ -275,37 +282,34 @@ class ExerciseCard(ft.Container):
             is_selected = t == self.selected_type
             items.append(
                 ft.ListTile(
-                    title=ft.Text(i18n_manager.t(f"exercise_type_{t}")),
+                    title=I18nText(key=f"exercise_type_{t}"),
                     leading=ft.Icon(ft.Icons.CHECK, color=ft.Colors.TEAL) if is_selected else ft.Icon(ft.Icons.CIRCLE_OUTLINED, size=10, opacity=0),
                     on_click=lambda e, type_key=t: self._select_type(type_key),
                     content_padding=ft.padding.symmetric(horizontal=10),
                 )
             )
         self.type_list_view.controls = items
-        if self.page:
-            self.type_list_view.update()
+        update_scheduler.request_update(self.type_list_view)
 
     def _select_type(self, type_key):
         
         self.selected_type = type_key
         self.type_display_text.value = i18n_manager.t(f"exercise_type_{type_key}")
+        i18n_manager.track(self.type_display_text, value=f"exercise_type_{type_key}")
         
 
         self.custom_type_input.visible = (type_key == "other")
         
 
         
-        if self.page:
-            self.type_display_text.update()
-            self.custom_type_input.update()
+        update_scheduler.request_update(self.type_display_text, self.custom_type_input)
             
         self._close_type_dialog(None)
         self._update_hourly_display()
 
     def _close_type_dialog(self, e):
         self.type_dialog.open = False
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
 
     def _on_intensity_select(self, intensity_key):
         
@@ -339,7 +343,7 @@ class ExerciseCard(ft.Container):
                     duration=2000
                 )
                 self.page.snack_bar.open = True
-                self.page.update()
+                update_scheduler.request_update()
         except Exception:
             pass
 
@@ -358,18 +362,18 @@ class ExerciseCard(ft.Container):
                 ft.Container(content=self.duration_input, expand=1),
                 ft.Container(content=self.intensity_selector, expand=1),
                 ft.Container(content=self.hourly_kcal_input, expand=1),
-                ft.IconButton(
+                i18n_manager.track(ft.IconButton(
                     icon=ft.Icons.CONTENT_COPY,
                     icon_color=ft.Colors.GREY_600,
                     tooltip=i18n_manager.t("hint_copy_prompt"),
                     on_click=self._copy_ai_prompt
-                ),
-                ft.IconButton(
+                ), tooltip="hint_copy_prompt"),
+                i18n_manager.track(ft.IconButton(
                     icon=ft.Icons.OPEN_IN_NEW,
                     icon_color=ft.Colors.BLUE_500,
                     tooltip=i18n_manager.t("exercise_ask_ai"),
                     on_click=self._open_ai_url
-                )
+                ), tooltip="exercise_ask_ai")
             ], spacing=10),
             
             ft.Divider(height=10, color="transparent"),
@@ -385,7 +389,7 @@ class ExerciseCard(ft.Container):
                     content=ft.Container(
                         content=ft.Row([
                             ft.Icon(ft.Icons.ADD, color=ft.Colors.WHITE, size=16),
-                            ft.Text(i18n_manager.t("exercise_add"), color=ft.Colors.WHITE)
+                            I18nText(key="exercise_add", color=ft.Colors.WHITE)
                         ], tight=True, spacing=5),
                         padding=ft.padding.symmetric(horizontal=10, vertical=3)
                     ),
@@ -410,7 +414,7 @@ class ExerciseCard(ft.Container):
             duration = int(self.duration_input.value or "0")
             if duration <= 0 or duration > 600:
                 self.duration_input.error_text = i18n_manager.t("food_error_invalid")
-                self.duration_input.update()
+                update_scheduler.request_update(self.duration_input)
                 return
             
             intensity = self.selected_intensity
@@ -420,11 +424,11 @@ class ExerciseCard(ft.Container):
                 hourly_rate = float(self.hourly_kcal_input.value or "0")
                 if hourly_rate < 0:
                     self.hourly_kcal_input.error_text = i18n_manager.t("food_error_invalid")
-                    self.hourly_kcal_input.update()
+                    update_scheduler.request_update(self.hourly_kcal_input)
                     return
             except ValueError:
                 self.hourly_kcal_input.error_text = i18n_manager.t("food_error_invalid")
-                self.hourly_kcal_input.update()
+                update_scheduler.request_update(self.hourly_kcal_input)
                 return
             
 
@@ -448,6 +452,7 @@ class ExerciseCard(ft.Container):
 
             self.selected_type = "running"
             self.type_display_text.value = i18n_manager.t("exercise_type_running")
+            i18n_manager.track(self.type_display_text, value="exercise_type_running")
             self.selected_intensity = "medium"
             self.intensity_selector.set_selected("medium")
             self.duration_input.value = "0"
@@ -455,8 +460,7 @@ class ExerciseCard(ft.Container):
             self.hourly_kcal_input.error_text = None
             initial_hourly = get_hourly_calories("running", "medium", self.user_weight)
             self.hourly_kcal_input.value = str(initial_hourly)
-            if self.page:
-                self.update()
+            update_scheduler.request_update(self)
                 
         except (ValueError, TypeError):
             pass
@@ -470,8 +474,7 @@ class ExerciseCard(ft.Container):
         hourly = get_hourly_calories(exercise_type, intensity, self.user_weight)
         self.hourly_kcal_input.value = str(hourly)
         
-        if self.page:
-            self.hourly_kcal_input.update()
+        update_scheduler.request_update(self.hourly_kcal_input)
 
     def _open_ai_url(self, e):
         
@@ -489,8 +492,7 @@ class ExerciseCard(ft.Container):
         self._record_to_delete = record_id
         self.confirmation_dialog.title.value = i18n_manager.t("exercise_confirm_delete")
         self.confirmation_dialog.open = True
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
 
     def _on_confirm_delete(self, e):
         
@@ -503,8 +505,7 @@ class ExerciseCard(ft.Container):
     def _close_dialog(self, e=None):
         self.confirmation_dialog.open = False
         self._record_to_delete = None
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
 
     def _get_exercise_icon(self, exercise_type):
         
@@ -534,96 +535,87 @@ class ExerciseCard(ft.Container):
         }
         return colors.get(intensity, ft.Colors.GREY_500)
 
-    def _update_records_ui(self):
-        
-        self.records_column.controls.clear()
-        
-        if not self.records:
-            self.records_column.controls.append(
-                ft.Container(
-                    content=I18nText(
-                        key="exercise_no_record",
-                        size=14,
-                        color=ft.Colors.GREY_500,
-                        text_align=ft.TextAlign.CENTER
+    def _build_empty_row(self):
+        return ft.Container(
+            content=I18nText(
+                key="exercise_no_record",
+                size=14,
+                color=ft.Colors.GREY_500,
+                text_align=ft.TextAlign.CENTER
+            ),
+            alignment=ft.Alignment(0, 0),
+            padding=20
+        )
+
+    def _build_record_row(self, record):
+        exercise_type = record["type"]
+        duration = record["duration_minutes"]
+        intensity = record.get("intensity", "medium")
+        calories = record.get("calories", 0)
+
+        record_card = ft.Container(
+            content=ft.Row([
+                ft.Row([
+                    ft.Icon(
+                        self._get_exercise_icon(exercise_type),
+                        color=ft.Colors.TEAL_500,
+                        size=24
                     ),
-                    alignment=ft.Alignment(0, 0),
-                    padding=20
-                )
-            )
-        else:
-            for record in self.records:
-                try:
-                    exercise_type = record["type"]
-                    duration = record["duration_minutes"]
-                    intensity = record.get("intensity", "medium")
-                    calories = record.get("calories", 0)
-                    
-                    record_card = ft.Container(
-                        content=ft.Row([
-                            ft.Row([
-                                ft.Icon(
-                                    self._get_exercise_icon(exercise_type),
-                                    color=ft.Colors.TEAL_500,
-                                    size=24
+                    ft.Column([
+                        I18nText(
+                            key=f"exercise_type_{exercise_type}",
+                            size=14,
+                            weight=ft.FontWeight.W_500
+                        ),
+                        ft.Row([
+                            ft.Container(
+                                content=I18nText(
+                                    key="exercise_min",
+                                    prefix=f"{duration} ",
+                                    size=11,
+                                    color=ft.Colors.WHITE
                                 ),
-                                ft.Column([
-                                    ft.Text(
-                                        i18n_manager.t(f"exercise_type_{exercise_type}"),
-                                        size=14,
-                                        weight=ft.FontWeight.W_500
-                                    ),
-                                    ft.Row([
-                                        ft.Container(
-                                            content=ft.Text(
-                                                f"{duration} {i18n_manager.t('exercise_min')}",
-                                                size=11,
-                                                color=ft.Colors.WHITE
-                                            ),
-                                            bgcolor=ft.Colors.TEAL_400,
-                                            padding=ft.padding.symmetric(horizontal=6, vertical=2),
-                                            border_radius=8
-                                        ),
-                                        ft.Container(
-                                            content=ft.Text(
-                                                i18n_manager.t(f"exercise_intensity_{intensity}"),
-                                                size=11,
-                                                color=ft.Colors.WHITE
-                                            ),
-                                            bgcolor=self._get_intensity_color(intensity),
-                                            padding=ft.padding.symmetric(horizontal=6, vertical=2),
-                                            border_radius=8
-                                        ),
-                                        ft.Container(
-                                            content=ft.Text(
-                                                f"🔥 {calories} {i18n_manager.t('exercise_kcal')}",
-                                                size=11,
-                                                color=ft.Colors.ORANGE_800
-                                            ),
-                                            bgcolor=ft.Colors.ORANGE_100,
-                                            padding=ft.padding.symmetric(horizontal=6, vertical=2),
-                                            border_radius=8
-                                        ),
-                                    ], spacing=6)
-                                ], spacing=4)
-                            ], spacing=10),
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE_OUTLINE,
-                                icon_color=ft.Colors.RED_300,
-                                icon_size=20,
-                                on_click=lambda e, rid=record["id"]: self._delete_record(rid),
-                                tooltip=i18n_manager.t("sleep_delete")
-                            )
-                        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                        bgcolor=ft.Colors.GREY_100,
-                        padding=12,
-                        border_radius=10
-                    )
-                    self.records_column.controls.append(record_card)
-                except (ValueError, KeyError):
-                    continue
-        
-        try:
-            self.records_column.update()
-        except Exception:
-            pass
+                                bgcolor=ft.Colors.TEAL_400,
+                                padding=ft.padding.symmetric(horizontal=6, vertical=2),
+                                border_radius=8
+                            ),
+                            ft.Container(
+                                content=I18nText(
+                                    key=f"exercise_intensity_{intensity}",
+                                    size=11,
+                                    color=ft.Colors.WHITE
+                                ),
+                                bgcolor=self._get_intensity_color(intensity),
+                                padding=ft.padding.symmetric(horizontal=6, vertical=2),
+                                border_radius=8
+                            ),
+                            ft.Container(
+                                content=I18nText(
+                                    key="exercise_kcal",
+                                    prefix=f"🔥 {calories} ",
+                                    size=11,
+                                    color=ft.Colors.ORANGE_800
+                                ),
+                                bgcolor=ft.Colors.ORANGE_100,
+                                padding=ft.padding.symmetric(horizontal=6, vertical=2),
+                                border_radius=8
+                            ),
+                        ], spacing=6)
+                    ], spacing=4)
+                ], spacing=10),
+                i18n_manager.track(ft.IconButton(
+                    icon=ft.Icons.DELETE_OUTLINE,
+                    icon_color=ft.Colors.RED_300,
+                    icon_size=20,
+                    on_click=lambda e, rid=record["id"]: self._delete_record(rid),
+                    tooltip=i18n_manager.t("sleep_delete")
+                ), tooltip="sleep_delete")
+            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+            bgcolor=ft.Colors.GREY_100,
+            padding=12,
+            border_radius=10
+        )
+        return record_card
+
+    def _update_records_ui(self):
+        self.records_view.set_items(self.records)
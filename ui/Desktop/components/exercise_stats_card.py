@@ -1,13 +1,15 @@
 import flet as ft
 import datetime
-from ui.styles import AppColors, CARD_STYLE
+from ui.styles import AppColors, CARD_STYLE, theme_manager
 from core import event_bus
 from data.storage import load_user_data
 from core.i18n import i18n_manager, I18nText
+from core import update_scheduler
 
 class ExerciseStatsCard(ft.Container):
     def __init__(self):
         super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
         self.total_duration = 0
         self.total_calories = 0
         
@@ -15,11 +17,14 @@ class ExerciseStatsCard(ft.Container):
         self._init_components()
         self.content = self._build_content()
         self._update_ui(initial_load=True)
-        
+
+    def did_mount(self):
         event_bus.subscribe(event_bus.EXERCISE_ADDED, self._on_exercise_changed)
+        self._initialize_data()
+        self._update_ui()
 
     def will_unmount(self):
-        pass
+        event_bus.release(self)
 
     def _initialize_data(self):
         
@@ -110,6 +115,6 @@ class ExerciseStatsCard(ft.Container):
         
         if not initial_load:
             try:
-                self.update()
+                update_scheduler.request_update(self)
             except Exception:
                 pass
@@ -1,15 +1,26 @@
+import asyncio
 import flet as ft
-from ui.styles import AppColors, CARD_STYLE
-from core.search import search_food
+from ui.styles import AppColors, CARD_STYLE, theme_manager
+from core.search import search_food, suggest_foods
+from core.food_history import food_history
+from core.food_similarity import find_similar_foods, find_alternatives
 from data.storage import load_user_data, save_user_data
 from core.i18n import i18n_manager, I18nText
+from core import update_scheduler
+from core.nutrients import (
+    NUTRIENT_INDEX, nutrient_vector, scale_vector, meal_vector, serialize_meals,
+    deserialize_meal, deserialize_meals
+)
 from ui.Desktop.components.custom_food_dialog import CustomFoodDialog
-import copy
+from ui.keyed_list import KeyedList
+from ui.Desktop.utils.pooled_list import PooledList
 import datetime
+import uuid
 
 class FoodCard(ft.Container):
     def __init__(self, nutrition_goals_card_ref):
         super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
         self.nutrition_goals_card_ref = nutrition_goals_card_ref
         self.meals = []
         self.selected_food_data = None
@@ -28,7 +39,7 @@ class FoodCard(ft.Container):
             if self.custom_food_dialog not in self.page.overlay:
                 self.page.overlay.append(self.custom_food_dialog)
             self.update_meals_ui()
-            self.page.update()
+            update_scheduler.request_update()
 
     def will_unmount(self):
         if self.page:
@@ -47,7 +58,7 @@ class FoodCard(ft.Container):
             today_str = datetime.date.today().isoformat()
 
             if last_date_str == today_str:
-                self.meals = daily_meals_data.get("meals", [])
+                self.meals = deserialize_meals(daily_meals_data.get("meals", []))
             else:
 
                 self.meals = []
@@ -62,7 +73,7 @@ class FoodCard(ft.Container):
         save_user_data({
             "daily_meals": {
                 "date": today_str,
-                "meals": self.meals
+                "meals": serialize_meals(self.meals)
             }
         })
 
@@ -81,7 +92,8 @@ class FoodCard(ft.Container):
             text_size=14,
             content_padding=common_padding,
             border_radius=8,
-            on_change=self._on_search_change
+            on_change=self._on_search_change,
+            on_focus=self._on_search_focus
         )
 
         self.quantity_input = ft.TextField(
@@ -104,25 +116,28 @@ class FoodCard(ft.Container):
             bgcolor=ft.Colors.GREY_50,
             options=[]
         )
+        i18n_manager.track(self.food_name_input, label="food_search_placeholder")
+        i18n_manager.track(self.quantity_input, label="food_quantity_label")
+        i18n_manager.track(self.unit_dropdown, label="food_unit_label")
 
-        self.search_results_container = ft.Container(
-            content=ft.ListView(spacing=2, padding=0),
-            visible=False,
+        self.search_results = PooledList(
+            self._create_result_row, self._bind_result_row,
             bgcolor=ft.Colors.WHITE,
-            border_radius=5,
-
+            border_radius=5
         )
+        self.search_results_container = self.search_results.control
 
         self.meals_list = ft.ListView(spacing=10, height=300, padding=ft.padding.only(right=10))
+        self.meals_view = KeyedList(self.meals_list, self._build_meal_row, key=lambda meal: meal["meal_id"])
 
         self.details_dialog = ft.AlertDialog(
             modal=True,
-            title=ft.Text(i18n_manager.t("food_details_title")),
+            title=I18nText(key="food_details_title"),
             content=ft.Container(
                 content=ft.Column(height=300, scroll=ft.ScrollMode.ADAPTIVE),
                 width=600
             ),
-            actions=[ft.TextButton(i18n_manager.t("food_details_close"), on_click=self._close_details_dialog)],
+            actions=[i18n_manager.track(ft.TextButton(i18n_manager.t("food_details_close"), on_click=self._close_details_dialog), content="food_details_close")],
             actions_alignment=ft.MainAxisAlignment.END,
         )
         
@@ -132,7 +147,7 @@ class FoodCard(ft.Container):
     def _build_content(self):
         return ft.Column([
             ft.Row([
-                ft.Icon(ft.Icons.RESTAURANT, color=AppColors.FOOD_ICON),
+                theme_manager.track(ft.Icon(ft.Icons.RESTAURANT, color=AppColors.FOOD_ICON), color="FOOD_ICON"),
                 I18nText(key="food_title", size=18, weight=ft.FontWeight.W_600),
             ]),
 
@@ -146,13 +161,13 @@ class FoodCard(ft.Container):
             ft.Row(
                 [
                     self.unit_dropdown,
-                    ft.IconButton(
+                    i18n_manager.track(theme_manager.track(ft.IconButton(
                         icon=ft.Icons.ADD_CIRCLE,
                         icon_color=AppColors.ADD_BUTTON,
                         icon_size=30,
                         on_click=self.add_meal,
                         tooltip=i18n_manager.t("food_add_tooltip")
-                    )
+                    ), icon_color="ADD_BUTTON"), tooltip="food_add_tooltip")
                 ],
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN
             ),
@@ -160,7 +175,7 @@ class FoodCard(ft.Container):
 
             ft.Container(
                 content=ft.TextButton(
-                    content=ft.Text(i18n_manager.t("food_custom_add")),
+                    content=I18nText(key="food_custom_add"),
                     icon=ft.Icons.EDIT,
                     on_click=self._open_custom_dialog
                 ),
@@ -169,10 +184,15 @@ class FoodCard(ft.Container):
 
             self.search_results_container,
             ft.Divider(),
-            I18nText(key="food_today_records", size=14, color=AppColors.TEXT_SECONDARY),
+            theme_manager.track(I18nText(key="food_today_records", size=14, color=AppColors.TEXT_SECONDARY), color="TEXT_SECONDARY"),
             self.meals_list
         ])
 
+    def _on_search_focus(self, e):
+        if self._is_selecting or self.food_name_input.value:
+            return
+        self._show_search_results(suggest_foods())
+
     def _on_search_change(self, e):
         if self._is_selecting: return
 
@@ -180,54 +200,53 @@ class FoodCard(ft.Container):
         self.selected_food_data = None
 
         if not query:
-            self.search_results_container.visible = False
-            self.search_results_container.content.controls.clear()
-            if self.page: self.update()
+            self._show_search_results(suggest_foods())
             return
 
-        results = search_food(query)
-        self.search_results_container.content.controls.clear()
+        self._show_search_results(search_food(query))
 
-        if results:
-            for food in results:
-                details_button = ft.IconButton(
-                    icon=ft.Icons.INFO_OUTLINE,
-                    icon_color=ft.Colors.BLUE_400,
-                    tooltip=i18n_manager.t("food_view_details"),
-                    on_click=lambda _, f=food: self._show_details(f),
-                )
-                
-                result_item = ft.Container(
-                    content=ft.Row(
-                        [
-                            ft.Text(f"{food['name']}", size=14, weight=ft.FontWeight.BOLD, expand=True),
-                            details_button,
-                        ],
-                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                    ),
-                    padding=ft.padding.symmetric(horizontal=10, vertical=5),
-                    bgcolor=ft.Colors.BLUE_50,
-                    border_radius=5,
-                    on_click=lambda _, f=food: self._select_food(f),
-                    ink=True
-                )
-                self.search_results_container.content.controls.append(result_item)
-            
+    def _create_result_row(self):
+        name_text = ft.Text(size=14, weight=ft.FontWeight.BOLD, expand=True)
+        details_button = ft.IconButton(
+            icon=ft.Icons.INFO_OUTLINE,
+            icon_color=ft.Colors.BLUE_400,
+            tooltip=i18n_manager.t("food_view_details"),
+            on_click=self._on_result_details,
+        )
+        i18n_manager.track(details_button, tooltip="food_view_details")
+        return ft.Container(
+            content=ft.Row(
+                [name_text, details_button],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+            ),
+            height=48,
+            margin=ft.margin.only(bottom=2),
+            padding=ft.padding.symmetric(horizontal=10, vertical=5),
+            bgcolor=ft.Colors.BLUE_50,
+            border_radius=5,
+            on_click=self._on_result_click,
+            ink=True
+        )
 
-            item_height = 50
-            max_items = 5
-            count = len(results)
-            
-            if count > max_items:
-                self.search_results_container.height = max_items * item_height
-            else:
-                self.search_results_container.height = count * item_height
-                
-            self.search_results_container.visible = True
-        else:
-            self.search_results_container.visible = False
+    def _bind_result_row(self, row, food, index):
+        name_text, details_button = row.content.controls
+        name_text.value = f"{food['name']}"
+        row.data = index
+        details_button.data = index
+
+    def _on_result_click(self, e):
+        food = self.search_results.item_at(e.control.data)
+        if food is not None:
+            self._select_food(food)
+
+    def _on_result_details(self, e):
+        food = self.search_results.item_at(e.control.data)
+        if food is not None:
+            self._show_details(food)
 
-        if self.page: self.update()
+    def _show_search_results(self, results):
+        self.search_results.set_items(results or [])
+        update_scheduler.request_update(self)
 
     def _show_details(self, food):
         
@@ -258,25 +277,69 @@ class FoodCard(ft.Container):
             ft.Row([ft.Text(i18n_manager.t("food_vitamin_c"), weight=ft.FontWeight.BOLD), ft.Text(f"{nutrients.get('vitamin_c', 0)} mg")]),
             ft.Row([ft.Text(i18n_manager.t("food_vitamin_d"), weight=ft.FontWeight.BOLD), ft.Text(f"{nutrients.get('vitamin_d', 0)} µg")]),
         ]
-        
 
         self.details_dialog.content.content.controls = details_content
         self.details_dialog.open = True
-        if self.page: self.page.update()
+        update_scheduler.request_update()
+        asyncio.create_task(self._load_related_foods(food, details_content))
+
+    async def _load_related_foods(self, food, details_content):
+        try:
+            similar, alternatives = await asyncio.to_thread(
+                lambda: (find_similar_foods(food), find_alternatives(food, "sodium"))
+            )
+        except Exception as e:
+            print(f"Error finding related foods: {e}")
+            return
+
+        if self.details_dialog.content.content.controls is not details_content:
+            return
+        details_content.extend(self._build_related_foods("food_similar_title", similar))
+        details_content.extend(self._build_related_foods("food_lower_sodium_title", alternatives))
+        update_scheduler.request_update(self.details_dialog)
+
+    def _build_related_foods(self, title_key, related):
+        if not related:
+            return []
+
+        controls = [ft.Divider(), ft.Text(i18n_manager.t(title_key), size=14, weight=ft.FontWeight.BOLD)]
+        for item in related:
+            related_food = item["food"]
+            controls.append(
+                ft.Container(
+                    content=ft.Row(
+                        [
+                            ft.Text(related_food.get('name', ''), size=13, expand=True),
+                            ft.Text(f"{related_food.get('calories', related_food.get('level1', {}).get('calories', 0))} kcal", size=12, color=ft.Colors.GREY_600),
+                        ],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                    ),
+                    padding=ft.padding.symmetric(horizontal=10, vertical=5),
+                    bgcolor=ft.Colors.BLUE_50,
+                    border_radius=5,
+                    on_click=lambda _, f=related_food: self._select_related_food(f),
+                    ink=True
+                )
+            )
+        return controls
+
+    def _select_related_food(self, food):
+        self.details_dialog.open = False
+        self._select_food(food)
+        update_scheduler.request_update()
 
     def _close_details_dialog(self, e):
         self.details_dialog.open = False
-        if self.page: self.page.update()
+        update_scheduler.request_update()
     
     def _open_custom_dialog(self, e):
         
         self.custom_food_dialog.open = True
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
     
     def _add_custom_food(self, custom_food):
         
-        self.meals.append(custom_food)
+        self.meals.append(deserialize_meal(custom_food))
         self._save_meals()
         self.update_meals_ui()
         if self.nutrition_goals_card_ref:
@@ -305,17 +368,23 @@ class FoodCard(ft.Container):
                 self.quantity_input.value = "100"
 
             self.unit_dropdown.options = new_options
-            self.search_results_container.visible = False
-            self.search_results_container.content.controls.clear()
+            self.search_results.clear()
 
-            if self.page: self.update()
+            update_scheduler.request_update(self)
         finally:
             self._is_selecting = False
 
+    def select_suggested_food(self, food, unit, quantity):
+        self._select_food(food)
+        if any(option.key == unit for option in self.unit_dropdown.options):
+            self.unit_dropdown.value = unit
+            self.quantity_input.value = f"{quantity:g}"
+        update_scheduler.request_update(self)
+
     def add_meal(self, e):
         if not self.selected_food_data:
             self.food_name_input.error_text = i18n_manager.t("food_error_select")
-            self.food_name_input.update()
+            update_scheduler.request_update(self.food_name_input)
             return
 
         try:
@@ -323,13 +392,13 @@ class FoodCard(ft.Container):
             if user_quantity <= 0: raise ValueError()
         except (ValueError, TypeError):
             self.quantity_input.error_text = i18n_manager.t("food_error_invalid")
-            self.quantity_input.update()
+            update_scheduler.request_update(self.quantity_input)
             return
 
         selected_unit_name = self.unit_dropdown.value
         if not selected_unit_name:
             self.unit_dropdown.error_text = i18n_manager.t("food_error_unit")
-            self.unit_dropdown.update()
+            update_scheduler.request_update(self.unit_dropdown)
             return
 
         total_grams = 0
@@ -345,37 +414,19 @@ class FoodCard(ft.Container):
 
         if total_grams <= 0:
             self.quantity_input.error_text = i18n_manager.t("food_error_invalid")
-            self.quantity_input.update()
+            update_scheduler.request_update(self.quantity_input)
             return
 
         scale = total_grams / 100.0
-        scaled_meal = copy.deepcopy(self.selected_food_data)
-        
-        if 'level1' not in scaled_meal:
-            scaled_meal['level1'] = {}
-            db_to_level1_map = {
-                'calories': 'calories', 'protein': 'protein', 'fat': 'total_fat',
-                'carbs': 'total_carbs', 'fiber': 'fiber', 'sugar': 'sugars',
-                'sodium': 'sodium', 'calcium': 'calcium', 'vitamin_c': 'vitamin_c',
-                'vitamin_d': 'vitamin_d'
-            }
-            for db_key, l1_key in db_to_level1_map.items():
-                original_value = self.selected_food_data.get(db_key, 0)
-                if isinstance(original_value, (int, float)):
-                    scaled_meal['level1'][l1_key] = round(original_value * scale, 2)
-        else:
-            for level in ['level1', 'level2']:
-                if level in scaled_meal:
-                    for category in scaled_meal[level]:
-                        if isinstance(scaled_meal[level][category], dict):
-                            for key, value in scaled_meal[level][category].items():
-                                if isinstance(value, (int, float)):
-                                    scaled_meal[level][category][key] = round(value * scale, 2)
-                        elif isinstance(scaled_meal[level][category], (int, float)):
-                             scaled_meal[level][category] = round(scaled_meal[level][category] * scale, 2)
-
+        scaled_meal = {
+            key: value for key, value in self.selected_food_data.items() if key != 'level1'
+        }
+        scaled_meal['vector'] = scale_vector(nutrient_vector(self.selected_food_data), scale)
+        scaled_meal['scale'] = scale
         scaled_meal['serving_eaten'] = {"value": user_quantity, "unit": selected_unit_name}
+        scaled_meal['meal_id'] = uuid.uuid4().hex
         self.meals.append(scaled_meal)
+        food_history.record(self.selected_food_data)
         
         self._save_meals()
         
@@ -401,10 +452,10 @@ class FoodCard(ft.Container):
         if self.nutrition_goals_card_ref:
             self.nutrition_goals_card_ref._update_from_meals()
 
-    def _build_nutrient_badge(self, label, value, unit, color):
+    def _build_nutrient_badge(self, label_key, value, unit, color):
         return ft.Container(
             content=ft.Column([
-                ft.Text(label, size=10, color=ft.Colors.GREY_600),
+                I18nText(key=label_key, size=10, color=ft.Colors.GREY_600),
                 ft.Text(f"{value}{unit}", size=12, weight=ft.FontWeight.BOLD, color=color)
             ], spacing=0, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
             padding=5,
@@ -412,75 +463,78 @@ class FoodCard(ft.Container):
             border_radius=5,
         )
 
-    def update_meals_ui(self):
-        self.meals_list.controls.clear()
-        for meal in reversed(self.meals):
-            l1 = meal.get('level1', {})
-            
-            delete_button = ft.IconButton(
-                icon=ft.Icons.DELETE_OUTLINE,
-                icon_color=ft.Colors.GREY_400,
-                tooltip=i18n_manager.t("food_delete"),
-                on_click=lambda _, m=meal: self._delete_meal(m),
-                icon_size=18
-            )
+    def _build_meal_row(self, meal):
+        vector = meal_vector(meal)
+        l1 = {key: round(vector[i], 2) for key, i in NUTRIENT_INDEX.items()}
 
-            macro_row = ft.Row([
-                self._build_nutrient_badge(i18n_manager.t("nutrient_calories"), l1.get('calories', 0), "kcal", ft.Colors.RED),
-                self._build_nutrient_badge(i18n_manager.t("nutrient_protein"), l1.get('protein', 0), "g", ft.Colors.BLUE),
-                self._build_nutrient_badge(i18n_manager.t("nutrient_fat"), l1.get('total_fat', 0), "g", ft.Colors.ORANGE),
-                self._build_nutrient_badge(i18n_manager.t("nutrient_carbs"), l1.get('total_carbs', 0), "g", ft.Colors.GREEN),
-            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
-            
-            details_map = [
-                (i18n_manager.t("nutrient_fiber"), "fiber", "g"), (i18n_manager.t("nutrient_sugar"), "sugars", "g"), (i18n_manager.t("nutrient_sodium"), "sodium", "mg"),
-                (i18n_manager.t("nutrient_calcium"), "calcium", "mg"), (i18n_manager.t("nutrient_vitamin_c"), "vitamin_c", "mg"), (i18n_manager.t("nutrient_vitamin_d"), "vitamin_d", "µg")
-            ]
-            detail_controls = []
-            for label, key, unit in details_map:
-                val = l1.get(key, 0)
-                if val > 0:
-                    detail_controls.append(
-                        ft.Container(
-                            content=ft.Text(f"{label}: {val}{unit}", size=11, color=ft.Colors.GREY_700),
-                            padding=ft.padding.symmetric(horizontal=6, vertical=2),
-                            bgcolor=ft.Colors.GREY_100,
-                            border_radius=4
-                        )
+        delete_button = ft.IconButton(
+            icon=ft.Icons.DELETE_OUTLINE,
+            icon_color=ft.Colors.GREY_400,
+            tooltip=i18n_manager.t("food_delete"),
+            on_click=lambda _, m=meal: self._delete_meal(m),
+            icon_size=18
+        )
+        i18n_manager.track(delete_button, tooltip="food_delete")
+
+        macro_row = ft.Row([
+            self._build_nutrient_badge("nutrient_calories", l1.get('calories', 0), "kcal", ft.Colors.RED),
+            self._build_nutrient_badge("nutrient_protein", l1.get('protein', 0), "g", ft.Colors.BLUE),
+            self._build_nutrient_badge("nutrient_fat", l1.get('total_fat', 0), "g", ft.Colors.ORANGE),
+            self._build_nutrient_badge("nutrient_carbs", l1.get('total_carbs', 0), "g", ft.Colors.GREEN),
+        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
+
+        details_map = [
+            ("nutrient_fiber", "fiber", "g"), ("nutrient_sugar", "sugars", "g"), ("nutrient_sodium", "sodium", "mg"),
+            ("nutrient_calcium", "calcium", "mg"), ("nutrient_vitamin_c", "vitamin_c", "mg"), ("nutrient_vitamin_d", "vitamin_d", "µg")
+        ]
+        detail_controls = []
+        for label_key, key, unit in details_map:
+            val = l1.get(key, 0)
+            if val > 0:
+                detail_controls.append(
+                    ft.Container(
+                        content=I18nText(key=label_key, suffix=f": {val}{unit}", size=11, color=ft.Colors.GREY_700),
+                        padding=ft.padding.symmetric(horizontal=6, vertical=2),
+                        bgcolor=ft.Colors.GREY_100,
+                        border_radius=4
                     )
-            details_row = ft.Row(detail_controls, wrap=True, spacing=5, run_spacing=5)
-            
-            serving_eaten = meal.get('serving_eaten', {})
-            serving_text = f"{i18n_manager.t('food_serving')} {serving_eaten.get('value', '')} {serving_eaten.get('unit', '')}"
-
-            item = ft.Container(
-                content=ft.Column([
-                    ft.Row(
-                        [
-                            ft.Text(meal["name"], size=16, weight=ft.FontWeight.BOLD, expand=True),
-                            delete_button
-                        ],
-                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                    ),
-                    ft.Row(
-                        [
-                            ft.Text(serving_text, size=12, color=ft.Colors.BLACK)
-                        ],
-                        alignment=ft.MainAxisAlignment.START
-                    ),
-                    ft.Divider(height=5, color="transparent"),
-                    macro_row,
-                    ft.Divider(height=5, color="transparent"),
-                    details_row
-                ]),
-                padding=15,
-                bgcolor=ft.Colors.WHITE,
-                border=ft.border.all(1, ft.Colors.GREY_200),
-                border_radius=8,
-                shadow=ft.BoxShadow(
-                    spread_radius=1, blur_radius=3,
-                    color=ft.Colors.with_opacity(0.1, ft.Colors.BLACK), offset=ft.Offset(0, 2),
                 )
+        details_row = ft.Row(detail_controls, wrap=True, spacing=5, run_spacing=5)
+
+        serving_eaten = meal.get('serving_eaten', {})
+        serving_suffix = f" {serving_eaten.get('value', '')} {serving_eaten.get('unit', '')}"
+
+        item = ft.Container(
+            content=ft.Column([
+                ft.Row(
+                    [
+                        ft.Text(meal["name"], size=16, weight=ft.FontWeight.BOLD, expand=True),
+                        delete_button
+                    ],
+                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                ),
+                ft.Row(
+                    [
+                        I18nText(key="food_serving", suffix=serving_suffix, size=12, color=ft.Colors.BLACK)
+                    ],
+                    alignment=ft.MainAxisAlignment.START
+                ),
+                ft.Divider(height=5, color="transparent"),
+                macro_row,
+                ft.Divider(height=5, color="transparent"),
+                details_row
+            ]),
+            padding=15,
+            bgcolor=ft.Colors.WHITE,
+            border=ft.border.all(1, ft.Colors.GREY_200),
+            border_radius=8,
+            shadow=ft.BoxShadow(
+                spread_radius=1, blur_radius=3,
+                color=ft.Colors.with_opacity(0.1, ft.Colors.BLACK), offset=ft.Offset(0, 2),
             )
-            self.meals_list.controls.append(item)
-        if self.page: self.update()
+        )
+        return item
+
+    def update_meals_ui(self):
+        self.meals_view.set_items(list(reversed(self.meals)), update=False)
+        update_scheduler.request_update(self)
@@ -1,5 +1,5 @@
 import flet as ft
-from ui.styles import AppColors
+from ui.styles import AppColors, theme_manager
 from ui.Desktop.utils.time_utils import get_current_date_str, get_current_time_str, get_timezone_str
 from core.i18n import i18n_manager
 
@@ -15,6 +15,12 @@ class DateHeader(ft.Container):
         timezone_str = get_timezone_str()
         
         return ft.Column([
-            ft.Text(date_str, size=24, weight=ft.FontWeight.BOLD, color=AppColors.TEXT_PRIMARY),
-            ft.Text(f"{timezone_str} {i18n_manager.t('header_current_time')} {time_str}", size=14, color=AppColors.TEXT_SECONDARY),
+            i18n_manager.track(theme_manager.track(
+                ft.Text(date_str, size=24, weight=ft.FontWeight.BOLD, color=AppColors.TEXT_PRIMARY),
+                color="TEXT_PRIMARY"
+            ), value=get_current_date_str),
+            i18n_manager.track(theme_manager.track(
+                ft.Text(f"{timezone_str} {i18n_manager.t('header_current_time')} {time_str}", size=14, color=AppColors.TEXT_SECONDARY),
+                color="TEXT_SECONDARY"
+            ), value=lambda: f"{timezone_str} {i18n_manager.t('header_current_time')} {time_str}"),
         ])
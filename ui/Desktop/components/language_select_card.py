@@ -1,5 +1,5 @@
 import flet as ft
-from ui.styles import get_card_style
+from ui.styles import get_card_style, theme_manager
 from ui.Desktop.utils.selection_dialog import SelectionDialog, SelectionOption
 from core.i18n import i18n_manager, I18nText
 
@@ -7,6 +7,7 @@ class LanguageSelectCard(ft.Container):
     def __init__(self):
         style = get_card_style()
         super().__init__(**style)
+        theme_manager.track_card(self)
         
         self.selected_code = i18n_manager.current_lang
         
@@ -54,15 +55,14 @@ class LanguageSelectCard(ft.Container):
                 return 999
 
         sorted_codes = sorted(
-            i18n_manager.translations.keys(),
+            i18n_manager.available_languages(),
             key=lambda k: get_sort_index(k)
         )
         
         options = []
         for code in sorted_codes:
 
-            data = i18n_manager.translations.get(code, {})
-            name = data.get("language_name", code)
+            name = i18n_manager.language_name(code)
             if code == "zh_TW":
                 name = "Traditional Chinese"
             
@@ -1,6 +1,7 @@
 import flet as ft
 from core.i18n import i18n_manager
 from ui.styles import theme_manager, AppColors
+from core import update_scheduler
 
 class AppNavigationRail(ft.Container):
     def __init__(self, on_destination_selected):
@@ -39,7 +40,6 @@ class AppNavigationRail(ft.Container):
     def update_theme(self):
         self.bgcolor = theme_manager.current_colors.CARD_BG
         self._update_selection_visuals()
-        self.update()
 
     def update_ui(self):
         
@@ -48,7 +48,7 @@ class AppNavigationRail(ft.Container):
             if idx in self.nav_buttons:
                 _, text_control, _ = self.nav_buttons[idx]
                 text_control.value = i18n_manager.t(config["key"])
-        self.update()
+        update_scheduler.request_update(self)
 
     def _build_nav_item(self, config):
         idx = config["index"]
@@ -149,7 +149,7 @@ class AppNavigationRail(ft.Container):
             text_control.color = color
             container.bgcolor = bgcolor
             
-            container.update()
+            update_scheduler.request_update(container)
 
     def set_selection(self, index):
         
@@ -195,8 +195,6 @@ class MobileNavigationBar(ft.Container):
     def update_theme(self):
         self.bgcolor = theme_manager.current_colors.CARD_BG
         self._update_selection_visuals()
-        if self.page:
-            self.update()
 
     def update_ui(self):
         for config in self.nav_configs:
@@ -204,8 +202,7 @@ class MobileNavigationBar(ft.Container):
             if idx in self.nav_buttons:
                 _, text_control, _ = self.nav_buttons[idx]
                 text_control.value = i18n_manager.t(config["key"])
-        if self.page:
-            self.update()
+        update_scheduler.request_update(self)
 
     def _build_nav_item(self, config):
         idx = config["index"]
@@ -279,8 +276,7 @@ class MobileNavigationBar(ft.Container):
             text_control.color = color
             container.bgcolor = bgcolor
             
-            if self.page:
-                container.update()
+            update_scheduler.request_update(container)
 
     def set_selection(self, actual_index):
         
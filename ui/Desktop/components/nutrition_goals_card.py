@@ -1,15 +1,33 @@
+import asyncio
 import flet as ft
-from ui.styles import CARD_STYLE
+from ui.styles import CARD_STYLE, theme_manager
 from core.calculations import calculate_nutrition_goals
-from data.storage import load_user_data
+from core.food_recommender import recommend_foods
+from core.meal_planner import plan_day
+from core.nutrients import meal_totals
+from data.storage import load_user_data, user_data_from, PROFILE_KEYS
 from core import event_bus
-from core.i18n import i18n_manager, I18nText
+from core import update_scheduler
+from core.i18n import I18nText
+
+NUTRIENT_LABEL_KEYS = {
+    "calories": "nutrient_calories",
+    "protein": "nutrient_protein",
+    "total_fat": "nutrient_fat",
+    "total_carbs": "nutrient_carbs",
+    "fiber": "nutrient_fiber",
+    "sugars": "nutrient_sugar",
+    "sodium": "nutrient_sodium",
+    "calcium": "nutrient_calcium",
+    "vitamin_c": "nutrient_vitamin_c",
+    "vitamin_d": "nutrient_vitamin_d",
+}
 
 class _GoalBar(ft.Container):
     
-    def __init__(self, label: str, unit: str, goal_range: list):
+    def __init__(self, label_key: str, unit: str, goal_range: list):
         super().__init__()
-        self.label = label
+        self.label_key = label_key
         self.unit = unit
         self.goal_range = goal_range
         self.current_value = 0
@@ -75,7 +93,7 @@ class _GoalBar(ft.Container):
 
         return ft.Column([
             ft.Row([
-                ft.Text(self.label, weight=ft.FontWeight.BOLD, size=14),
+                I18nText(key=self.label_key, weight=ft.FontWeight.BOLD, size=14),
                 self.progress_text
             ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
             self.progress_stack
@@ -93,12 +111,12 @@ class _GoalBar(ft.Container):
         self.left_spacer.expand = int(progress_percent * 1000)
         self.right_spacer.expand = int((1 - progress_percent) * 1000)
         
-        if self.page:
-            self.update()
+        update_scheduler.request_update(self)
 
 class NutritionGoalsCard(ft.Container):
     def __init__(self, food_card_ref):
         super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
         self.food_card_ref = food_card_ref
         self.is_expanded = False
         self.goals = {}
@@ -110,20 +128,20 @@ class NutritionGoalsCard(ft.Container):
         
     def did_mount(self):
         self._update_from_meals()
-        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_user_data_changed)
+        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_user_data_changed, keys=PROFILE_KEYS)
 
     def will_unmount(self):
-        event_bus.unsubscribe(event_bus.USER_DATA_SAVED, self._on_user_data_changed)
+        event_bus.release(self)
 
     def _initialize_goals(self):
         user_data = load_user_data()
         self.goals = calculate_nutrition_goals(user_data)
 
-    def _on_user_data_changed(self, *args, **kwargs):
+    def _on_user_data_changed(self, changes=None, *args, **kwargs):
         if not self.page:
             return
 
-        user_data = load_user_data()
+        user_data = user_data_from(changes)
         self.goals = calculate_nutrition_goals(user_data)
         self._update_goal_bars()
         self._update_from_meals()
@@ -132,17 +150,103 @@ class NutritionGoalsCard(ft.Container):
         current_totals = self._calculate_totals()
         for key, bar in self.goal_bars.items():
             bar.update_value(current_totals.get(key, 0))
-        if self.page:
-            self.update()
+        self._update_suggestions(current_totals)
+        update_scheduler.request_update(self)
+
+    def _update_suggestions(self, current_totals=None):
+        self.suggestions_column.controls.clear()
+        if not self.is_expanded:
+            return
+        if current_totals is None:
+            current_totals = self._calculate_totals()
+
+        try:
+            suggestions = recommend_foods(current_totals, self.goals, k=3)
+        except Exception as e:
+            print(f"Error computing food suggestions: {e}")
+            suggestions = []
+
+        self.suggestions_column.visible = bool(suggestions)
+        if not suggestions:
+            return
+
+        self.suggestions_column.controls.append(
+            I18nText(key="nutrient_suggestions_title", size=14, weight=ft.FontWeight.BOLD)
+        )
+        for suggestion in suggestions:
+            food = suggestion["food"]
+            serving_text = f"{suggestion['quantity']} {suggestion['unit']} ({suggestion['grams']:.0f} g)"
+            self.suggestions_column.controls.append(
+                ft.Container(
+                    content=ft.Row(
+                        [
+                            ft.Text(food.get("name", ""), size=13, weight=ft.FontWeight.W_500, expand=True),
+                            ft.Text(serving_text, size=12, color=ft.Colors.GREY_600),
+                        ],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                    ),
+                    padding=ft.padding.symmetric(horizontal=10, vertical=6),
+                    bgcolor=ft.Colors.GREEN_50,
+                    border_radius=5,
+                    on_click=lambda _, s=suggestion: self._select_suggestion(s),
+                    ink=True
+                )
+            )
+
+    def _select_suggestion(self, suggestion):
+        if self.food_card_ref and hasattr(self.food_card_ref, 'select_suggested_food'):
+            self.food_card_ref.select_suggested_food(
+                suggestion["food"], suggestion["unit"], suggestion["quantity"]
+            )
+
+    async def _plan_day(self, e):
+        self.plan_button.disabled = True
+        self.plan_column.controls = [ft.ProgressRing(width=20, height=20, stroke_width=2)]
+        update_scheduler.request_update(self)
+
+        try:
+            plan = await asyncio.to_thread(plan_day, self.goals, self._calculate_totals())
+        except Exception as ex:
+            print(f"Error planning meals: {ex}")
+            plan = {"items": [], "feasible": False}
+
+        self.plan_column.controls.clear()
+        if not plan["items"]:
+            self.plan_column.controls.append(
+                I18nText(key="meal_plan_empty", size=13, color=ft.Colors.GREY_600)
+            )
+        else:
+            self.plan_column.controls.append(
+                I18nText(
+                    key="meal_plan_title" if plan["feasible"] else "meal_plan_partial",
+                    size=14, weight=ft.FontWeight.BOLD
+                )
+            )
+            for item in plan["items"]:
+                serving_text = f"{item['quantity']} {item['unit']} ({item['grams']:.0f} g)"
+                self.plan_column.controls.append(
+                    ft.Container(
+                        content=ft.Row(
+                            [
+                                ft.Text(item["food"].get("name", ""), size=13, weight=ft.FontWeight.W_500, expand=True),
+                                ft.Text(serving_text, size=12, color=ft.Colors.GREY_600),
+                            ],
+                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                        ),
+                        padding=ft.padding.symmetric(horizontal=10, vertical=6),
+                        bgcolor=ft.Colors.BLUE_50,
+                        border_radius=5,
+                        on_click=lambda _, s=item: self._select_suggestion(s),
+                        ink=True
+                    )
+                )
+        self.plan_button.disabled = False
+        update_scheduler.request_update(self)
 
     def _calculate_totals(self):
-        totals = {}
         if self.food_card_ref and hasattr(self.food_card_ref, 'meals'):
-            for meal in self.food_card_ref.meals:
-                nutrients = meal.get('level1', {})
-                for key, value in nutrients.items():
-                    totals[key] = totals.get(key, 0) + value
-        return totals
+            return meal_totals(self.food_card_ref.meals)
+        return {}
 
     def _init_components(self):
         self.arrow_button = ft.IconButton(
@@ -157,22 +261,17 @@ class NutritionGoalsCard(ft.Container):
         )
         
         self.expandable_content = ft.Column(visible=self.is_expanded, spacing=10)
+        self.suggestions_column = ft.Column(spacing=5, visible=False)
+        self.plan_button = ft.TextButton(
+            content=I18nText(key="meal_plan_button", size=14),
+            icon=ft.Icons.AUTO_AWESOME,
+            on_click=self._plan_day
+        )
+        self.plan_column = ft.Column(spacing=5)
+        self.plan_section = ft.Column([self.plan_button, self.plan_column], spacing=5, visible=False)
         
-        nutrient_label_map = {
-            "calories": i18n_manager.t("nutrient_calories"),
-            "protein": i18n_manager.t("nutrient_protein"),
-            "total_fat": i18n_manager.t("nutrient_fat"),
-            "total_carbs": i18n_manager.t("nutrient_carbs"),
-            "fiber": i18n_manager.t("nutrient_fiber"),
-            "sugars": i18n_manager.t("nutrient_sugar"),
-            "sodium": i18n_manager.t("nutrient_sodium"),
-            "calcium": i18n_manager.t("nutrient_calcium"),
-            "vitamin_c": i18n_manager.t("nutrient_vitamin_c"),
-            "vitamin_d": i18n_manager.t("nutrient_vitamin_d"),
-        }
         for key, data in self.goals.items():
-            label = nutrient_label_map.get(key, key.replace("_", " ").title())
-            bar = _GoalBar(label=label, unit=data["unit"], goal_range=data["range"])
+            bar = _GoalBar(label_key=NUTRIENT_LABEL_KEYS.get(key, key), unit=data["unit"], goal_range=data["range"])
             self.goal_bars[key] = bar
             self.expandable_content.controls.append(bar)
 
@@ -180,7 +279,9 @@ class NutritionGoalsCard(ft.Container):
         return ft.Column(
             [
                 self.header,
-                self.expandable_content
+                self.expandable_content,
+                self.suggestions_column,
+                self.plan_section
             ],
             spacing=10
         )
@@ -189,27 +290,17 @@ class NutritionGoalsCard(ft.Container):
         self.is_expanded = not self.is_expanded
         self.expandable_content.visible = self.is_expanded
         self.arrow_button.icon = ft.Icons.REMOVE_CIRCLE if self.is_expanded else ft.Icons.ADD_CIRCLE
-        self.update()
+        self.plan_section.visible = self.is_expanded
+        self._update_suggestions()
+        if not self.is_expanded:
+            self.suggestions_column.visible = False
+        update_scheduler.request_update(self)
 
     def _update_goal_bars(self):
         self.expandable_content.controls.clear()
         self.goal_bars.clear()
-        nutrient_label_map = {
-            "calories": i18n_manager.t("nutrient_calories"),
-            "protein": i18n_manager.t("nutrient_protein"),
-            "total_fat": i18n_manager.t("nutrient_fat"),
-            "total_carbs": i18n_manager.t("nutrient_carbs"),
-            "fiber": i18n_manager.t("nutrient_fiber"),
-            "sugars": i18n_manager.t("nutrient_sugar"),
-            "sodium": i18n_manager.t("nutrient_sodium"),
-            "calcium": i18n_manager.t("nutrient_calcium"),
-            "vitamin_c": i18n_manager.t("nutrient_vitamin_c"),
-            "vitamin_d": i18n_manager.t("nutrient_vitamin_d"),
-        }
         for key, data in self.goals.items():
-            label = nutrient_label_map.get(key, key.replace("_", " ").title())
-            bar = _GoalBar(label=label, unit=data["unit"], goal_range=data["range"])
+            bar = _GoalBar(label_key=NUTRIENT_LABEL_KEYS.get(key, key), unit=data["unit"], goal_range=data["range"])
             self.goal_bars[key] = bar
             self.expandable_content.controls.append(bar)
-        if self.page:
-            self.update()
+        update_scheduler.request_update(self)
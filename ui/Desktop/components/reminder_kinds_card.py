@@ -0,0 +1,37 @@
+import flet as ft
+from ui.styles import get_card_style, theme_manager
+from core.i18n import I18nText
+from core.reminders import REMINDER_KINDS, DEFAULT_KINDS
+from data.storage import load_user_data
+
+class ReminderKindsCard(ft.Container):
+    def __init__(self):
+        style = get_card_style()
+        super().__init__(**style)
+        theme_manager.track_card(self)
+
+        user_data = load_user_data()
+        selected = user_data.get("reminder_kinds", list(DEFAULT_KINDS))
+
+        self.kind_checkboxes = {
+            kind: ft.Checkbox(value=kind in selected, active_color=ft.Colors.BLUE_500)
+            for kind in REMINDER_KINDS
+        }
+
+        self.content = ft.Row(
+            controls=[
+                ft.Row([
+                    ft.Icon(ft.Icons.NOTIFICATIONS_ACTIVE, color=ft.Colors.BLUE_500),
+                    I18nText(key="reminder_kinds_label", size=16, weight=ft.FontWeight.W_500),
+                ], spacing=8),
+                ft.Row([
+                    ft.Row([self.kind_checkboxes[kind], I18nText(key=f"reminder_kind_{kind}", size=14)], spacing=0)
+                    for kind in REMINDER_KINDS
+                ], spacing=12),
+            ],
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER
+        )
+
+    def get_selected_kinds(self):
+        return [kind for kind in REMINDER_KINDS if self.kind_checkboxes[kind].value]
@@ -1,15 +1,48 @@
 import flet as ft
 import datetime
 import uuid
-from ui.styles import AppColors, CARD_STYLE
+from ui.styles import AppColors, CARD_STYLE, theme_manager
 from core import event_bus
 from data.storage import load_user_data, save_user_data
 from ui.Desktop.utils.confirmation import create_confirmation_dialog
 from core.i18n import i18n_manager, I18nText
+from ui.keyed_list import KeyedList
+from core import update_scheduler
+
+SLEEP_DATE_OPTIONS = [
+    ("yesterday", "sleep_date_yesterday"),
+    ("today", "sleep_date_today"),
+]
+
+SLEEP_QUALITY_OPTIONS = [
+    ("excellent", "sleep_quality_excellent"),
+    ("good", "sleep_quality_good"),
+    ("fair", "sleep_quality_fair"),
+    ("poor", "sleep_quality_poor"),
+]
+
+def _build_options(options):
+    return [
+        i18n_manager.track(ft.dropdown.Option(key=key, text=i18n_manager.t(text_key)), text=text_key)
+        for key, text_key in options
+    ]
+
+def _format_duration(minutes):
+    hours = minutes // 60
+    mins = minutes % 60
+    h_text = i18n_manager.t("sleep_hours")
+    m_text = i18n_manager.t("sleep_minutes")
+    if hours > 0 and mins > 0:
+        return f"{hours}{h_text}{mins}{m_text}"
+    elif hours > 0:
+        return f"{hours}{h_text}"
+    else:
+        return f"{mins}{m_text}"
 
 class SleepCard(ft.Container):
     def __init__(self):
         super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
         self.records = []
         self._record_to_delete = None
         self.error_message = None
@@ -22,7 +55,7 @@ class SleepCard(ft.Container):
     def did_mount(self):
         if self.page and self.confirmation_dialog not in self.page.overlay:
             self.page.overlay.append(self.confirmation_dialog)
-            self.page.update()
+            update_scheduler.request_update()
 
     def will_unmount(self):
         if self.page and self.confirmation_dialog in self.page.overlay:
@@ -58,10 +91,7 @@ class SleepCard(ft.Container):
 
         self.bedtime_date = ft.Dropdown(
             hint_text=i18n_manager.t("hint_pleaseselect"),
-            options=[
-                ft.dropdown.Option(key="yesterday", text=i18n_manager.t("sleep_date_yesterday")),
-                ft.dropdown.Option(key="today", text=i18n_manager.t("sleep_date_today")),
-            ],
+            options=_build_options(SLEEP_DATE_OPTIONS),
             height=dropdown_height, content_padding=8, text_size=13,
             border_radius=8, value="yesterday"
         )
@@ -80,10 +110,7 @@ class SleepCard(ft.Container):
 
         self.wakeup_date = ft.Dropdown(
             hint_text=i18n_manager.t("hint_pleaseselect"),
-            options=[
-                ft.dropdown.Option(key="yesterday", text=i18n_manager.t("sleep_date_yesterday")),
-                ft.dropdown.Option(key="today", text=i18n_manager.t("sleep_date_today")),
-            ],
+            options=_build_options(SLEEP_DATE_OPTIONS),
             height=dropdown_height, content_padding=8, text_size=13,
             border_radius=8, value="today"
         )
@@ -102,21 +129,19 @@ class SleepCard(ft.Container):
 
         self.quality_selector = ft.Dropdown(
             hint_text=i18n_manager.t("hint_pleaseselect"),
-            options=[
-                ft.dropdown.Option(key="excellent", text=i18n_manager.t("sleep_quality_excellent")),
-                ft.dropdown.Option(key="good", text=i18n_manager.t("sleep_quality_good")),
-                ft.dropdown.Option(key="fair", text=i18n_manager.t("sleep_quality_fair")),
-                ft.dropdown.Option(key="poor", text=i18n_manager.t("sleep_quality_poor")),
-            ],
+            options=_build_options(SLEEP_QUALITY_OPTIONS),
             height=dropdown_height, content_padding=8, text_size=13,
             border_radius=8, value="good"
         )
+        for dropdown in (self.bedtime_date, self.wakeup_date, self.quality_selector):
+            i18n_manager.track(dropdown, hint_text="hint_pleaseselect")
         
 
         self.error_text = ft.Text("", size=12, color=ft.Colors.RED_500, visible=False)
         
 
         self.records_column = ft.Column(spacing=10)
+        self.records_view = KeyedList(self.records_column, self._build_record_row, empty_builder=self._build_empty_row)
         
 
         self.confirmation_dialog = create_confirmation_dialog(
@@ -163,7 +188,7 @@ class SleepCard(ft.Container):
                     content=ft.Container(
                         content=ft.Row([
                             ft.Icon(ft.Icons.ADD, color=ft.Colors.WHITE, size=16),
-                            ft.Text(i18n_manager.t("sleep_add"), color=ft.Colors.WHITE)
+                            I18nText(key="sleep_add", color=ft.Colors.WHITE)
                         ], tight=True, spacing=5),
                         padding=ft.padding.symmetric(horizontal=10, vertical=3)
                     ),
@@ -231,14 +256,12 @@ class SleepCard(ft.Container):
         
         self.error_text.value = message
         self.error_text.visible = True
-        if self.page:
-            self.error_text.update()
+        update_scheduler.request_update(self.error_text)
 
     def _hide_error(self):
         
         self.error_text.visible = False
-        if self.page:
-            self.error_text.update()
+        update_scheduler.request_update(self.error_text)
 
     def _add_sleep_record(self, e):
         
@@ -318,8 +341,7 @@ class SleepCard(ft.Container):
             self.bedtime_minute.value = ""
             self.wakeup_hour.value = ""
             self.wakeup_minute.value = ""
-            if self.page:
-                self.update()
+            update_scheduler.request_update(self)
                 
         except (ValueError, TypeError):
             self._show_error(i18n_manager.t("sleep_error_invalid_time"))
@@ -329,8 +351,7 @@ class SleepCard(ft.Container):
         self._record_to_delete = record_id
         self.confirmation_dialog.title.value = i18n_manager.t("sleep_confirm_delete")
         self.confirmation_dialog.open = True
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
 
     def _on_confirm_delete(self, e):
         
@@ -343,21 +364,7 @@ class SleepCard(ft.Container):
     def _close_dialog(self, e=None):
         self.confirmation_dialog.open = False
         self._record_to_delete = None
-        if self.page:
-            self.page.update()
-
-    def _format_duration(self, minutes):
-        
-        hours = minutes // 60
-        mins = minutes % 60
-        h_text = i18n_manager.t("sleep_hours")
-        m_text = i18n_manager.t("sleep_minutes")
-        if hours > 0 and mins > 0:
-            return f"{hours}{h_text}{mins}{m_text}"
-        elif hours > 0:
-            return f"{hours}{h_text}"
-        else:
-            return f"{mins}{m_text}"
+        update_scheduler.request_update()
 
     def _get_quality_color(self, quality):
         
@@ -369,85 +376,70 @@ class SleepCard(ft.Container):
         }
         return colors.get(quality, ft.Colors.GREY_500)
 
-    def _get_quality_text(self, quality):
-        
-        return i18n_manager.t(f"sleep_quality_{quality}")
+    def _build_empty_row(self):
+        return ft.Container(
+            content=I18nText(
+                key="sleep_no_record",
+                size=14,
+                color=ft.Colors.GREY_500,
+                text_align=ft.TextAlign.CENTER
+            ),
+            alignment=ft.Alignment(0, 0),
+            padding=20
+        )
+
+    def _build_record_row(self, record):
+        bedtime = datetime.datetime.fromisoformat(record["bedtime"])
+        wakeup = datetime.datetime.fromisoformat(record["wakeup"])
+        duration = record["duration_minutes"]
+        quality = record.get("quality", "good")
+
+        record_card = ft.Container(
+            content=ft.Row([
+                ft.Column([
+                    ft.Row([
+                        ft.Icon(ft.Icons.NIGHTLIGHT, color=ft.Colors.INDIGO_300, size=16),
+                        ft.Text(bedtime.strftime("%H:%M"), size=14, weight=ft.FontWeight.W_500),
+                        ft.Text("→", size=14),
+                        ft.Icon(ft.Icons.WB_SUNNY, color=ft.Colors.ORANGE_300, size=16),
+                        ft.Text(wakeup.strftime("%H:%M"), size=14, weight=ft.FontWeight.W_500),
+                    ], spacing=5),
+                    ft.Row([
+                        ft.Container(
+                            content=i18n_manager.track(ft.Text(
+                                _format_duration(duration),
+                                size=12,
+                                color=ft.Colors.WHITE
+                            ), value=lambda: _format_duration(duration)),
+                            bgcolor=ft.Colors.INDIGO_400,
+                            padding=ft.padding.symmetric(horizontal=8, vertical=2),
+                            border_radius=10
+                        ),
+                        ft.Container(
+                            content=I18nText(
+                                key=f"sleep_quality_{quality}",
+                                size=12,
+                                color=ft.Colors.WHITE
+                            ),
+                            bgcolor=self._get_quality_color(quality),
+                            padding=ft.padding.symmetric(horizontal=8, vertical=2),
+                            border_radius=10
+                        ),
+                    ], spacing=8)
+                ], spacing=5),
+                i18n_manager.track(ft.IconButton(
+                    icon=ft.Icons.DELETE_OUTLINE,
+                    icon_color=ft.Colors.RED_300,
+                    icon_size=20,
+                    on_click=lambda e, rid=record["id"]: self._delete_record(rid),
+                    tooltip=i18n_manager.t("sleep_delete")
+                ), tooltip="sleep_delete")
+            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+            bgcolor=ft.Colors.GREY_100,
+            padding=12,
+            border_radius=10
+        )
+        return record_card
 
     def _update_records_ui(self):
-        
-        self.records_column.controls.clear()
-        
-        if not self.records:
-            self.records_column.controls.append(
-                ft.Container(
-                    content=I18nText(
-                        key="sleep_no_record",
-                        size=14,
-                        color=ft.Colors.GREY_500,
-                        text_align=ft.TextAlign.CENTER
-                    ),
-                    alignment=ft.Alignment(0, 0),
-                    padding=20
-                )
-            )
-        else:
-            for record in self.records:
-                try:
-                    bedtime = datetime.datetime.fromisoformat(record["bedtime"])
-                    wakeup = datetime.datetime.fromisoformat(record["wakeup"])
-                    duration = record["duration_minutes"]
-                    quality = record.get("quality", "good")
-                    
-                    record_card = ft.Container(
-                        content=ft.Row([
-                            ft.Column([
-                                ft.Row([
-                                    ft.Icon(ft.Icons.NIGHTLIGHT, color=ft.Colors.INDIGO_300, size=16),
-                                    ft.Text(bedtime.strftime("%H:%M"), size=14, weight=ft.FontWeight.W_500),
-                                    ft.Text("→", size=14),
-                                    ft.Icon(ft.Icons.WB_SUNNY, color=ft.Colors.ORANGE_300, size=16),
-                                    ft.Text(wakeup.strftime("%H:%M"), size=14, weight=ft.FontWeight.W_500),
-                                ], spacing=5),
-                                ft.Row([
-                                    ft.Container(
-                                        content=ft.Text(
-                                            self._format_duration(duration),
-                                            size=12,
-                                            color=ft.Colors.WHITE
-                                        ),
-                                        bgcolor=ft.Colors.INDIGO_400,
-                                        padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                                        border_radius=10
-                                    ),
-                                    ft.Container(
-                                        content=ft.Text(
-                                            self._get_quality_text(quality),
-                                            size=12,
-                                            color=ft.Colors.WHITE
-                                        ),
-                                        bgcolor=self._get_quality_color(quality),
-                                        padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                                        border_radius=10
-                                    ),
-                                ], spacing=8)
-                            ], spacing=5),
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE_OUTLINE,
-                                icon_color=ft.Colors.RED_300,
-                                icon_size=20,
-                                on_click=lambda e, rid=record["id"]: self._delete_record(rid),
-                                tooltip=i18n_manager.t("sleep_delete")
-                            )
-                        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                        bgcolor=ft.Colors.GREY_100,
-                        padding=12,
-                        border_radius=10
-                    )
-                    self.records_column.controls.append(record_card)
-                except (ValueError, KeyError):
-                    continue
-        
-        try:
-            self.records_column.update()
-        except Exception:
-            pass
+        self.records_view.set_items(self.records)
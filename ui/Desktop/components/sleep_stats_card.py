@@ -1,13 +1,15 @@
 import flet as ft
 import datetime
-from ui.styles import AppColors, CARD_STYLE
+from ui.styles import AppColors, CARD_STYLE, theme_manager
 from core import event_bus
 from data.storage import load_user_data
-from core.i18n import i18n_manager, I18nText
+from core.i18n import I18nText
+from core import update_scheduler
 
 class SleepStatsCard(ft.Container):
     def __init__(self):
         super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
         self.sleep_goal_hours = 8
         self.today_sleep_minutes = 0
         self.week_avg_minutes = 0
@@ -16,11 +18,14 @@ class SleepStatsCard(ft.Container):
         self._init_components()
         self.content = self._build_content()
         self._update_ui(initial_load=True)
-        
+
+    def did_mount(self):
         event_bus.subscribe(event_bus.SLEEP_ADDED, self._on_sleep_changed)
+        self._initialize_data()
+        self._update_ui()
 
     def will_unmount(self):
-        pass
+        event_bus.release(self)
 
     def _initialize_data(self):
         
@@ -103,8 +108,9 @@ class SleepStatsCard(ft.Container):
                 ft.Container(
                     content=ft.Column([
                         I18nText(key="sleep_goal", size=12, color=ft.Colors.GREY_500),
-                        ft.Text(
-                            f"{self.sleep_goal_hours} {i18n_manager.t('sleep_hours')}",
+                        I18nText(
+                            key="sleep_hours",
+                            prefix=f"{self.sleep_goal_hours} ",
                             size=16,
                             weight=ft.FontWeight.W_600,
                             color=ft.Colors.INDIGO_600
@@ -156,6 +162,6 @@ class SleepStatsCard(ft.Container):
         
         if not initial_load:
             try:
-                self.update()
+                update_scheduler.request_update(self)
             except Exception:
                 pass
@@ -3,6 +3,7 @@ from ui.styles import get_card_style, theme_manager
 from ui.Desktop.utils.selection_dialog import SelectionDialog, SelectionOption
 from core.i18n import i18n_manager, I18nText
 from data.storage import load_user_data
+from core import update_scheduler
 
 THEME_OPTIONS = ["system", "light", "dark"]
 
@@ -10,6 +11,7 @@ class ThemeSelectCard(ft.Container):
     def __init__(self):
         style = get_card_style()
         super().__init__(**style)
+        theme_manager.track_card(self)
         
         self.selected_theme = theme_manager.theme_mode
         
@@ -50,12 +52,10 @@ class ThemeSelectCard(ft.Container):
         self.selected_theme = theme_key
 
     def did_mount(self):
-        theme_manager.subscribe(self._on_theme_updated)
         self.theme_selector.did_mount()
 
     def will_unmount(self):
         i18n_manager.unsubscribe(self.update_ui)
-        theme_manager.unsubscribe(self._on_theme_updated)
         self.theme_selector.will_unmount()
 
     def update_ui(self):
@@ -63,14 +63,7 @@ class ThemeSelectCard(ft.Container):
             return
 
         self.theme_selector.set_selected(self.selected_theme)
-        self.update()
-
-    def _on_theme_updated(self):
-        if self.page:
-            style = get_card_style()
-            self.bgcolor = style["bgcolor"]
-            self.shadow = style["shadow"]
-            self.update()
+        update_scheduler.request_update(self)
 
     def get_selected_theme(self):
         
@@ -1,14 +1,17 @@
 import flet as ft
 import datetime
-from ui.styles import CARD_STYLE
-from data.storage import load_user_data
+from ui.styles import CARD_STYLE, theme_manager
+from data.storage import load_user_data, user_data_from, SUMMARY_KEYS
 from core.calculations import calculate_nutrition_goals, calculate_water_goal
 from core import event_bus
+from core.nutrients import meal_totals
 from core.i18n import i18n_manager, I18nText
+from core import update_scheduler
 
 class TodayOverviewCard(ft.Container):
     def __init__(self):
         super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
         self.padding = 20
         self._init_advice_map()
         
@@ -16,50 +19,49 @@ class TodayOverviewCard(ft.Container):
         self.content = self._build_content()
         self._update_data()
         
-
-        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_data_changed)
+    def did_mount(self):
+        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_data_changed, keys=SUMMARY_KEYS)
         event_bus.subscribe(event_bus.WATER_ADDED, self._on_data_changed)
         event_bus.subscribe(event_bus.SLEEP_ADDED, self._on_data_changed)
         event_bus.subscribe(event_bus.EXERCISE_ADDED, self._on_data_changed)
-        
-    def did_mount(self):
-        pass
+        self._update_data()
+        update_scheduler.request_update(self)
 
     def will_unmount(self):
-        pass
+        event_bus.release(self)
 
     def _init_advice_map(self):
         self.advice_map = {
             "calories": {
-                "low": (i18n_manager.t("overview_calories_low_tag"), i18n_manager.t("overview_calories_low_reason"), i18n_manager.t("overview_calories_low_suggestion")),
-                "high": (i18n_manager.t("overview_calories_high_tag"), i18n_manager.t("overview_calories_high_reason"), i18n_manager.t("overview_calories_high_suggestion"))
+                "low": "overview_calories_low",
+                "high": "overview_calories_high"
             },
             "protein": {
-                "low": (i18n_manager.t("overview_protein_low_tag"), i18n_manager.t("overview_protein_low_reason"), i18n_manager.t("overview_protein_low_suggestion")),
-                "high": (i18n_manager.t("overview_protein_high_tag"), i18n_manager.t("overview_protein_high_reason"), i18n_manager.t("overview_protein_high_suggestion"))
+                "low": "overview_protein_low",
+                "high": "overview_protein_high"
             },
             "total_fat": {
-                "low": (i18n_manager.t("overview_fat_low_tag"), i18n_manager.t("overview_fat_low_reason"), i18n_manager.t("overview_fat_low_suggestion")),
-                "high": (i18n_manager.t("overview_fat_high_tag"), i18n_manager.t("overview_fat_high_reason"), i18n_manager.t("overview_fat_high_suggestion"))
+                "low": "overview_fat_low",
+                "high": "overview_fat_high"
             },
             "fiber": {
-                "low": (i18n_manager.t("overview_fiber_low_tag"), i18n_manager.t("overview_fiber_low_reason"), i18n_manager.t("overview_fiber_low_suggestion")),
-                "high": (i18n_manager.t("overview_fiber_high_tag"), i18n_manager.t("overview_fiber_high_reason"), i18n_manager.t("overview_fiber_high_suggestion"))
+                "low": "overview_fiber_low",
+                "high": "overview_fiber_high"
             },
             "sugars": {
-                "high": (i18n_manager.t("overview_sugars_high_tag"), i18n_manager.t("overview_sugars_high_reason"), i18n_manager.t("overview_sugars_high_suggestion"))
+                "high": "overview_sugars_high"
             },
             "sodium": {
-                "high": (i18n_manager.t("overview_sodium_high_tag"), i18n_manager.t("overview_sodium_high_reason"), i18n_manager.t("overview_sodium_high_suggestion"))
+                "high": "overview_sodium_high"
             },
             "calcium": {
-                "low": (i18n_manager.t("overview_calcium_low_tag"), i18n_manager.t("overview_calcium_low_reason"), i18n_manager.t("overview_calcium_low_suggestion"))
+                "low": "overview_calcium_low"
             },
             "vitamin_c": {
-                "low": (i18n_manager.t("overview_vitamin_c_low_tag"), i18n_manager.t("overview_vitamin_c_low_reason"), i18n_manager.t("overview_vitamin_c_low_suggestion"))
+                "low": "overview_vitamin_c_low"
             },
             "vitamin_d": {
-                "low": (i18n_manager.t("overview_vitamin_d_low_tag"), i18n_manager.t("overview_vitamin_d_low_reason"), i18n_manager.t("overview_vitamin_d_low_suggestion"))
+                "low": "overview_vitamin_d_low"
             }
         }
 
@@ -129,14 +131,15 @@ class TodayOverviewCard(ft.Container):
             )
         ], spacing=5)
 
-    def _on_data_changed(self, *args, **kwargs):
+    def _on_data_changed(self, changes=None, *args, **kwargs):
         if not self.page:
             return
-        self._update_data()
-        self.update()
+        self._update_data(user_data_from(changes))
+        update_scheduler.request_update(self)
 
-    def _update_data(self):
-        user_data = load_user_data()
+    def _update_data(self, user_data=None):
+        if user_data is None:
+            user_data = load_user_data()
         if not user_data:
             return
 
@@ -197,11 +200,7 @@ class TodayOverviewCard(ft.Container):
         current_intake = {}
         daily_meals = user_data.get("daily_meals", {})
         if isinstance(daily_meals, dict):
-            meals = daily_meals.get("meals", [])
-            for meal in meals:
-                nutrients = meal.get('level1', {})
-                for key, value in nutrients.items():
-                    current_intake[key] = current_intake.get(key, 0) + value
+            current_intake = meal_totals(daily_meals.get("meals", []))
 
         has_advice = False
         for key, advice_info in self.advice_map.items():
@@ -220,7 +219,7 @@ class TodayOverviewCard(ft.Container):
             
             if status:
                 has_advice = True
-                tag, reason, suggestion = advice_info[status]
+                advice_key = advice_info[status]
                 color = ft.Colors.ORANGE_700 if status == "low" else ft.Colors.RED_700
                 bg_color = ft.Colors.ORANGE_50 if status == "low" else ft.Colors.RED_50
                 border_color = ft.Colors.ORANGE_200 if status == "low" else ft.Colors.RED_200
@@ -228,10 +227,13 @@ class TodayOverviewCard(ft.Container):
                 card = ft.Container(
                     content=ft.Column([
                         ft.Row([
-                            ft.Text(f"{key.replace('_', ' ').title()} {tag}", weight=ft.FontWeight.BOLD, color=color, size=12),
+                            I18nText(key=f"{advice_key}_tag", prefix=f"{key.replace('_', ' ').title()} ", weight=ft.FontWeight.BOLD, color=color, size=12),
                         ]),
-                        ft.Text(f"{reason}", size=11, max_lines=2, overflow=ft.TextOverflow.ELLIPSIS),
-                        ft.Text(f"{i18n_manager.t('overview_advice_suggestion')} {suggestion}", size=11, weight=ft.FontWeight.BOLD, max_lines=2, overflow=ft.TextOverflow.ELLIPSIS),
+                        I18nText(key=f"{advice_key}_reason", size=11, max_lines=2, overflow=ft.TextOverflow.ELLIPSIS),
+                        i18n_manager.track(
+                            ft.Text(size=11, weight=ft.FontWeight.BOLD, max_lines=2, overflow=ft.TextOverflow.ELLIPSIS),
+                            value=lambda advice_key=advice_key: f"{i18n_manager.t('overview_advice_suggestion')} {i18n_manager.t(f'{advice_key}_suggestion')}"
+                        ),
                     ], spacing=2),
                     padding=8,
                     bgcolor=bg_color,
@@ -1,7 +1,8 @@
 import flet as ft
-from ui.styles import AppColors, CARD_STYLE
+from ui.styles import AppColors, CARD_STYLE, theme_manager
 from data.storage import load_user_data, save_user_data
 from core.i18n import I18nText, i18n_manager
+from core import update_scheduler
 
 class UserInfoCard(ft.Container):
 
@@ -15,6 +16,7 @@ class UserInfoCard(ft.Container):
         style["height"] = 700
         style["padding"] = 20
         super().__init__(**style)
+        theme_manager.track_card(self)
         
         self._init_components()
         self.content = self._build_content()
@@ -22,13 +24,7 @@ class UserInfoCard(ft.Container):
 
         i18n_manager.subscribe(self.update_ui)
 
-    def will_unmount(self):
-        i18n_manager.unsubscribe(self.update_ui)
-
     def update_ui(self):
-        if not self.page:
-            return
-
         self.age_input.label = i18n_manager.t("age_label")
         self.height_input.label = f"{i18n_manager.t('height_label')} (cm)"
         self.weight_input.label = f"{i18n_manager.t('weight_label')} (kg)"
@@ -55,7 +51,7 @@ class UserInfoCard(ft.Container):
         if hasattr(self, 'message_key') and self.message_key:
             self.message_text.value = i18n_manager.t(self.message_key)
 
-        self.page.update()
+        update_scheduler.request_update(self)
 
     def _init_components(self):
         input_width = 380
@@ -154,17 +150,17 @@ class UserInfoCard(ft.Container):
     def _validate_age(self, e):
         valid, error = self._validate_number(e.control.value, *self.AGE_RANGE)
         e.control.error_text = error
-        e.control.update()
+        update_scheduler.request_update(e.control)
 
     def _validate_height(self, e):
         valid, error = self._validate_number(e.control.value, *self.HEIGHT_RANGE)
         e.control.error_text = error
-        e.control.update()
+        update_scheduler.request_update(e.control)
 
     def _validate_weight(self, e):
         valid, error = self._validate_number(e.control.value, *self.WEIGHT_RANGE)
         e.control.error_text = error
-        e.control.update()
+        update_scheduler.request_update(e.control)
 
     def _build_content(self):
         return ft.Column([
@@ -202,7 +198,7 @@ class UserInfoCard(ft.Container):
         self.message_key = key
         self.message_text.value = i18n_manager.t(key)
         self.message_text.color = color
-        self.update()
+        update_scheduler.request_update(self)
 
     def _save_data(self, e):
         age_valid, age_err = self._validate_number(self.age_input.value, *self.AGE_RANGE)
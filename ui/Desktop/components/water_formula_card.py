@@ -1,19 +1,26 @@
 import flet as ft
-from ui.styles import AppColors, CARD_STYLE
-from data.storage import load_user_data
+from ui.styles import AppColors, CARD_STYLE, theme_manager
+from data.storage import load_user_data, user_data_from, PROFILE_KEYS
 from core import event_bus
 from core.i18n import i18n_manager, I18nText
+from core import update_scheduler
 
 class WaterFormulaCard(ft.Container):
     def __init__(self):
         super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
         self.padding = 25
         self._init_components()
         self.content = self._build_content()
         
         self._update_calculation(update_ui=False)
-        
-        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_user_data_saved)
+
+    def did_mount(self):
+        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_user_data_saved, keys=PROFILE_KEYS)
+        self._update_calculation(update_ui=True)
+
+    def will_unmount(self):
+        event_bus.release(self)
 
     def _init_components(self):
         self.header = ft.Row([
@@ -76,8 +83,8 @@ class WaterFormulaCard(ft.Container):
             padding=ft.padding.symmetric(vertical=8, horizontal=5)
         )
 
-    def _on_user_data_saved(self, *args, **kwargs):
-        self._update_calculation(update_ui=True)
+    def _on_user_data_saved(self, changes=None, *args, **kwargs):
+        self._update_calculation(user_data_from(changes), update_ui=True)
 
     def _update_calculation(self, user_data=None, update_ui=True):
         if user_data is None:
@@ -87,7 +94,7 @@ class WaterFormulaCard(ft.Container):
             self.steps_column.controls = [I18nText(key="water_formula_no_data", color=ft.Colors.GREY_500)]
             self.result_text.value = i18n_manager.t("water_formula_default")
             if update_ui and hasattr(self, '_page') and self._page is not None:
-                self.update()
+                update_scheduler.request_update(self)
             return
 
         try:
@@ -189,7 +196,7 @@ class WaterFormulaCard(ft.Container):
             self.result_text.value = f"{final_total} ml"
             
             if update_ui and hasattr(self, '_page') and self._page is not None:
-                self.update()
+                update_scheduler.request_update(self)
 
         except (ValueError, TypeError):
             pass
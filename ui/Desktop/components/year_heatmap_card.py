@@ -0,0 +1,101 @@
+import flet as ft
+import datetime
+import asyncio
+from ui.styles import CARD_STYLE, theme_manager
+from data.storage import load_year_rollup, SUMMARY_KEYS
+from data.rollup import ROLLUP_METRICS
+from core.i18n import i18n_manager, I18nText
+from core import event_bus
+from core import update_scheduler
+from ui.Desktop.utils.heatmap_chart import YearHeatmap
+
+METRICS = (
+    ("water", "calendar_water", ft.Colors.BLUE_400),
+    ("nutrition_score", "calendar_nutrition", ft.Colors.ORANGE_400),
+    ("sleep_grade", "calendar_sleep", ft.Colors.INDIGO_400),
+    ("exercise_score", "calendar_exercise", ft.Colors.TEAL_400),
+)
+METRIC_COLORS = {key: color for key, _, color in METRICS}
+
+class YearHeatmapCard(ft.Container):
+    def __init__(self):
+        super().__init__(**CARD_STYLE)
+        theme_manager.track_card(self)
+        self.padding = 20
+
+        self.year = datetime.date.today().year
+        self.metric = "water"
+        self.rollups = {}
+
+        self._init_components()
+        self.content = self._build_content()
+
+    def did_mount(self):
+        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_data_changed, keys=SUMMARY_KEYS)
+        event_bus.subscribe(event_bus.WATER_ADDED, self._on_data_changed)
+        event_bus.subscribe(event_bus.SLEEP_ADDED, self._on_data_changed)
+        event_bus.subscribe(event_bus.EXERCISE_ADDED, self._on_data_changed)
+        asyncio.create_task(self.refresh_data())
+
+    def will_unmount(self):
+        event_bus.release(self)
+
+    def _on_data_changed(self, *args, **kwargs):
+        if not self.page: return
+        self.rollups.pop(datetime.date.today().year, None)
+        asyncio.create_task(self.refresh_data())
+
+    def _init_components(self):
+        self.year_label = ft.Text("", size=14, weight=ft.FontWeight.BOLD)
+        self.recorded_text = ft.Text("", size=12, color=ft.Colors.GREY_600)
+        self.metric_selector = ft.SegmentedButton(
+            segments=[
+                ft.Segment(value=key, label=I18nText(key=label_key, size=12))
+                for key, label_key, _ in METRICS
+            ],
+            selected=[self.metric],
+            show_selected_icon=False,
+            on_change=self._on_metric_change
+        )
+        self.heatmap = YearHeatmap()
+
+    def _build_content(self):
+        return ft.Column([
+            ft.Row([
+                I18nText(key="calendar_year_heatmap", size=16, weight=ft.FontWeight.BOLD),
+                ft.Row([
+                    ft.IconButton(icon=ft.Icons.CHEVRON_LEFT, icon_color=ft.Colors.PURPLE_500, on_click=lambda e: self._change_year(-1)),
+                    self.year_label,
+                    ft.IconButton(icon=ft.Icons.CHEVRON_RIGHT, icon_color=ft.Colors.PURPLE_500, on_click=lambda e: self._change_year(1)),
+                ], spacing=0)
+            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+            self.metric_selector,
+            ft.Row([self.heatmap]),
+            self.recorded_text
+        ], spacing=10)
+
+    def _on_metric_change(self, e):
+        self.metric = e.control.selected[0]
+        self._render()
+
+    def _change_year(self, delta):
+        self.year = min(self.year + delta, datetime.date.today().year)
+        asyncio.create_task(self.refresh_data())
+
+    async def refresh_data(self):
+        year = self.year
+        if year not in self.rollups:
+            self.rollups[year] = await asyncio.to_thread(load_year_rollup, year)
+        self._render()
+
+    def _render(self):
+        rollup = self.rollups.get(self.year)
+        if rollup is None:
+            return
+        index = ROLLUP_METRICS.index(self.metric)
+        values = {date_str: row[index] for date_str, row in rollup.items() if row[index] is not None}
+
+        self.year_label.value = str(self.year)
+        self.recorded_text.value = i18n_manager.t("calendar_days_recorded", count=len(values))
+        self.heatmap.set_data(self.year, values, METRIC_COLORS[self.metric])
+        update_scheduler.request_update(self)
@@ -0,0 +1,75 @@
+import datetime
+import flet as ft
+import flet.canvas as cv
+from core import update_scheduler
+
+RESIZE_INTERVAL = 100
+LEVELS = ((0.4, 0.3), (0.7, 0.55), (1.0, 0.8))
+
+def _level_opacity(value: float) -> float:
+    for limit, opacity in LEVELS:
+        if value < limit:
+            return opacity
+    return 1.0
+
+class YearHeatmap(cv.Canvas):
+
+    def __init__(self, max_cell: float = 14, gap: float = 2, empty_color=ft.Colors.GREY_200):
+        super().__init__(height=max_cell * 7, expand=True, resize_interval=RESIZE_INTERVAL, on_resize=self._on_resize)
+        self.max_cell = max_cell
+        self.gap = gap
+        self.empty_color = empty_color
+        self.chart_width = 0
+        self.cell = max_cell
+        self.key = None
+        self.year = None
+        self.values = {}
+        self.color = None
+        self.today = None
+
+    def set_data(self, year: int, values: dict, color, today: datetime.date = None) -> bool:
+        today = today or datetime.date.today()
+        key = (year, color, today, tuple(sorted(values.items())))
+        if key == self.key:
+            return False
+        self.key = key
+        self.year, self.values, self.color, self.today = year, values, color, today
+        self._draw()
+        update_scheduler.request_update(self)
+        return True
+
+    def _on_resize(self, e):
+        if e.width == self.chart_width:
+            return
+        self.chart_width = e.width
+        self._draw()
+        update_scheduler.request_update(self)
+
+    def _draw(self):
+        if self.year is None or not self.chart_width:
+            self.shapes = []
+            return
+
+        first = datetime.date(self.year, 1, 1)
+        last = min(datetime.date(self.year, 12, 31), self.today)
+        offset = first.weekday()
+        columns = (offset + (datetime.date(self.year, 12, 31) - first).days) // 7 + 1
+        self.cell = min(self.max_cell, self.chart_width / columns)
+        self.height = self.cell * 7
+        size = max(self.cell - self.gap, 1)
+
+        paints = {}
+        shapes = []
+        for day in range((last - first).days + 1):
+            value = self.values.get((first + datetime.timedelta(days=day)).isoformat())
+            opacity = None if value is None else _level_opacity(value)
+            paint = paints.get(opacity)
+            if paint is None:
+                color = self.empty_color if opacity is None else ft.Colors.with_opacity(opacity, self.color)
+                paint = paints[opacity] = ft.Paint(color=color)
+            index = offset + day
+            shapes.append(cv.Rect(
+                x=(index // 7) * self.cell, y=(index % 7) * self.cell,
+                width=size, height=size, border_radius=2, paint=paint
+            ))
+        self.shapes = shapes
@@ -0,0 +1,79 @@
+import asyncio
+import flet as ft
+from core import update_scheduler
+
+ROW_HEIGHT = 50
+VISIBLE_ROWS = 5
+OVERSCAN = 3
+SCROLL_INTERVAL = 30
+
+class PooledList:
+
+    def __init__(self, create_row, bind_row, row_height: int = ROW_HEIGHT,
+                 visible_rows: int = VISIBLE_ROWS, overscan: int = OVERSCAN, **container_kwargs):
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.visible_rows = visible_rows
+        self.overscan = overscan
+        self.items = []
+        self.first = 0
+        self._scrolled = False
+
+        self.pool = [create_row() for _ in range(visible_rows + 2 * overscan)]
+        for row in self.pool:
+            row.visible = False
+        self.top_spacer = ft.Container(height=0)
+        self.bottom_spacer = ft.Container(height=0)
+        self.column = ft.Column(
+            [self.top_spacer, *self.pool, self.bottom_spacer],
+            spacing=0,
+            scroll=ft.ScrollMode.AUTO,
+            scroll_interval=SCROLL_INTERVAL,
+            on_scroll=self._on_scroll
+        )
+        self.control = ft.Container(content=self.column, visible=False, height=0, **container_kwargs)
+
+    def item_at(self, index):
+        if index is None or not 0 <= index < len(self.items):
+            return None
+        return self.items[index]
+
+    def _render(self):
+        count = len(self.items)
+        self.first = max(0, min(self.first, count - len(self.pool)))
+        shown = 0
+        for slot, row in enumerate(self.pool):
+            index = self.first + slot
+            if index < count:
+                self.bind_row(row, self.items[index], index)
+                row.visible = True
+                shown += 1
+            else:
+                row.visible = False
+        self.top_spacer.height = self.first * self.row_height
+        self.bottom_spacer.height = (count - self.first - shown) * self.row_height
+
+    def set_items(self, items):
+        self.items = list(items)
+        self.first = 0
+        self._render()
+        self.control.visible = bool(self.items)
+        self.control.height = min(len(self.items), self.visible_rows) * self.row_height
+        if self._scrolled:
+            self._scrolled = False
+            try:
+                asyncio.get_running_loop().create_task(self.column.scroll_to(offset=0))
+            except RuntimeError:
+                pass
+
+    def clear(self):
+        self.set_items([])
+
+    def _on_scroll(self, e):
+        self._scrolled = e.pixels > 0
+        first = max(0, int(e.pixels // self.row_height) - self.overscan)
+        if first == self.first:
+            return
+        self.first = first
+        self._render()
+        update_scheduler.request_update(self.column)
@@ -2,7 +2,8 @@
 
 import flet as ft
 from typing import Callable, Optional, List
-from core.i18n import i18n_manager
+from core.i18n import i18n_manager, I18nText
+from core import update_scheduler
 
 class SelectionOption:
     
@@ -57,10 +58,8 @@ class SelectionDialog(ft.Container):
         self._filtered_options = options.copy()
         
 
-        self.display_text = ft.Text(
-            self._get_selected_display(),
-            size=14
-        )
+        self.display_text = ft.Text(size=14)
+        self._track_selected_display()
         
 
         self.search_box = ft.TextField(
@@ -71,6 +70,8 @@ class SelectionDialog(ft.Container):
             content_padding=10,
             on_change=self._on_search
         ) if show_search else None
+        if self.search_box:
+            i18n_manager.track(self.search_box, hint_text=search_placeholder_key)
         
 
         self.list_view = ft.ListView(spacing=0, expand=True)
@@ -83,7 +84,7 @@ class SelectionDialog(ft.Container):
         dialog_content_children.append(self.list_view)
         
         self.dialog = ft.AlertDialog(
-            title=ft.Text(i18n_manager.t(title_key)),
+            title=I18nText(key=title_key),
             content=ft.Container(
                 content=ft.Column(dialog_content_children, spacing=10, expand=True),
                 width=width,
@@ -91,10 +92,10 @@ class SelectionDialog(ft.Container):
                 padding=0
             ),
             actions=[
-                ft.TextButton(
+                i18n_manager.track(ft.TextButton(
                     i18n_manager.t("cancel_button"), 
                     on_click=self._close_dialog
-                )
+                ), content="cancel_button")
             ],
             modal=True,
         )
@@ -115,14 +116,16 @@ class SelectionDialog(ft.Container):
             **container_kwargs
         )
     
-    def _get_selected_display(self) -> str:
-        
-        if not self.selected_key:
-            return ""
-        for opt in self.options:
-            if opt.key == self.selected_key:
-                return opt.get_display_text()
-        return self.selected_key
+    def _track_selected_display(self):
+        
+        fallback = self.selected_key or ""
+        source = lambda: fallback
+        if self.selected_key:
+            for opt in self.options:
+                if opt.key == self.selected_key:
+                    source = opt.get_display_text
+                    break
+        i18n_manager.track(self.display_text, value=source)
     
     def _build_list_items(self):
         
@@ -153,27 +156,20 @@ class SelectionDialog(ft.Container):
         self._filtered_options = self.options.copy()
         self._build_list_items()
         
-
-        self.dialog.title.value = i18n_manager.t(self.title_key)
-        self.dialog.actions[0].text = i18n_manager.t("cancel_button")
-        
         self.dialog.open = True
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
     
     def _close_dialog(self, e=None):
         
         self.dialog.open = False
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
     
     def _select_item(self, key: str):
         
         self.selected_key = key
-        self.display_text.value = self._get_selected_display()
+        self._track_selected_display()
         
-        if self.page:
-            self.display_text.update()
+        update_scheduler.request_update(self.display_text)
         
         self._close_dialog()
         
@@ -191,14 +187,13 @@ class SelectionDialog(ft.Container):
                 if search_term in opt.get_display_text().lower() or search_term in opt.key.lower()
             ]
         self._build_list_items()
-        if self.page:
-            self.list_view.update()
+        update_scheduler.request_update(self.list_view)
     
     def did_mount(self):
         
         if self.page and self.dialog not in self.page.overlay:
             self.page.overlay.append(self.dialog)
-            self.page.update()
+            update_scheduler.request_update()
     
     def will_unmount(self):
         
@@ -210,9 +205,8 @@ class SelectionDialog(ft.Container):
     def set_selected(self, key: str):
         
         self.selected_key = key
-        self.display_text.value = self._get_selected_display()
-        if self.page:
-            self.display_text.update()
+        self._track_selected_display()
+        update_scheduler.request_update(self.display_text)
     
     def get_selected(self) -> str:
         
@@ -1,6 +1,7 @@
 import flet as ft
 from ui.Desktop.components.calendar_grid_card import CalendarGridCard
 from ui.Desktop.components.calendar_chart_card import CalendarChartCard
+from ui.Desktop.components.year_heatmap_card import YearHeatmapCard
 
 class CalendarView(ft.Container):
     def __init__(self):
@@ -12,11 +13,12 @@ class CalendarView(ft.Container):
         
 
         self.grid_card = CalendarGridCard(on_month_change=self.chart_card.update_month)
+        self.heatmap_card = YearHeatmapCard()
         
         self.content = ft.Row(
             controls=[
                 self.grid_card,
-                self.chart_card
+                ft.Column([self.chart_card, self.heatmap_card], spacing=20, expand=True)
             ],
             spacing=20,
             expand=True,
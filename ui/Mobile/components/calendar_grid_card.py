@@ -3,10 +3,49 @@ import flet as ft
 import datetime
 import calendar
 import asyncio
-from ui.styles import AppColors, CARD_STYLE
-from data.storage import load_month_summaries
+from ui.styles import AppColors, CARD_STYLE, theme_manager
+from data.storage import load_month_summaries, prefetch_month_summaries, SUMMARY_KEYS
+from data.month_cache import shift_month
 from core.i18n import i18n_manager, I18nText
 from core import event_bus
+from core import update_scheduler
+
+MAX_WEEKS = 6
+
+class _DayCell(ft.Container):
+    def __init__(self, on_click):
+        self.day_text = ft.Text("", size=12)
+        self.water_dot = ft.Container(width=6, height=6, border_radius=3)
+        self.indicator_row = ft.Row(controls=[self.water_dot], spacing=2, alignment=ft.MainAxisAlignment.CENTER, visible=False)
+        self.placeholder = ft.Container(height=6)
+        self.body = ft.Column([self.day_text, self.indicator_row, self.placeholder],
+                              spacing=1, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+        super().__init__(
+            content=self.body, expand=1, height=45,
+            border_radius=8, alignment=ft.Alignment(0, 0), padding=ft.padding.only(top=2),
+            on_click=on_click, ink=True
+        )
+
+    def bind(self, day, date_str, summary, is_today):
+        self.data = date_str
+        self.body.visible = day != 0
+        self.ink = day != 0
+        if day == 0:
+            self.bgcolor = None
+            self.border = None
+            return
+
+        self.day_text.value = str(day)
+        self.day_text.weight = ft.FontWeight.BOLD if is_today else ft.FontWeight.NORMAL
+        self.day_text.color = ft.Colors.PURPLE_700 if is_today else ft.Colors.BLACK
+        self.bgcolor = ft.Colors.PURPLE_100 if is_today else None
+        self.border = ft.border.all(1, ft.Colors.PURPLE_400) if is_today else None
+
+        has_any_activity = bool(summary) and summary.get("water_intake", 0) > 0
+        if has_any_activity:
+            self.water_dot.bgcolor = ft.Colors.BLUE_400 if summary.get("water_achieved") else ft.Colors.RED_400
+        self.indicator_row.visible = has_any_activity
+        self.placeholder.visible = not has_any_activity
 
 class CalendarGridCard(ft.Container):
     
@@ -14,6 +53,7 @@ class CalendarGridCard(ft.Container):
     def __init__(self, on_month_change=None):
         mobile_style = {**CARD_STYLE, "padding": 12}
         super().__init__(**mobile_style)
+        theme_manager.track_card(self)
         self.expand = True
         self.on_month_change = on_month_change
         self.current_year = datetime.date.today().year
@@ -26,10 +66,10 @@ class CalendarGridCard(ft.Container):
         self._load_month_data()
         self._update_calendar()
         
-        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_data_changed)
-        event_bus.subscribe(event_bus.WATER_ADDED, self._on_data_changed)
 
     def did_mount(self):
+        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_data_changed, keys=SUMMARY_KEYS)
+        event_bus.subscribe(event_bus.WATER_ADDED, self._on_data_changed)
         from data.storage import update_today_summary
         try:
             update_today_summary()
@@ -43,8 +83,7 @@ class CalendarGridCard(ft.Container):
                 self.page.overlay.remove(self.details_dialog)
             except Exception:
                 pass
-        event_bus.unsubscribe(event_bus.USER_DATA_SAVED, self._on_data_changed)
-        event_bus.unsubscribe(event_bus.WATER_ADDED, self._on_data_changed)
+        event_bus.release(self)
 
     def _on_data_changed(self, *args, **kwargs):
         if not self.page: return
@@ -56,6 +95,7 @@ class CalendarGridCard(ft.Container):
             text_align=ft.TextAlign.CENTER
         )
         self.calendar_grid = ft.Column(spacing=2)
+        self._init_day_cells()
         
         self.details_content = ft.Column(spacing=8)
         self.details_dialog = ft.AlertDialog(
@@ -108,88 +148,59 @@ class CalendarGridCard(ft.Container):
 
     def _load_month_data(self):
         self.month_data = load_month_summaries(self.current_year, self.current_month)
+        prefetch_month_summaries(self.current_year, self.current_month)
 
-    def _prev_month(self, e):
-        if self.current_month == 1:
-            self.current_month = 12
-            self.current_year -= 1
-        else:
-            self.current_month -= 1
+    def _change_month(self, delta):
+        self.current_year, self.current_month = shift_month(self.current_year, self.current_month, delta)
         self._load_month_data()
         self._update_calendar()
         if self.on_month_change:
             self.on_month_change(self.current_year, self.current_month)
 
+    def _prev_month(self, e):
+        self._change_month(-1)
+
     def _next_month(self, e):
-        if self.current_month == 12:
-            self.current_month = 1
-            self.current_year += 1
-        else:
-            self.current_month += 1
-        self._load_month_data()
-        self._update_calendar()
-        if self.on_month_change:
-            self.on_month_change(self.current_year, self.current_month)
+        self._change_month(1)
 
     async def refresh_data(self):
         self._load_month_data()
         self._update_calendar()
-        self.update()
+
+    def _init_day_cells(self):
+        self.day_cells = []
+        self.week_rows = []
+        for _ in range(MAX_WEEKS):
+            week_row = ft.Row(spacing=2, alignment=ft.MainAxisAlignment.CENTER)
+            for _ in range(7):
+                cell = _DayCell(self._on_day_click)
+                week_row.controls.append(cell)
+                self.day_cells.append(cell)
+            self.week_rows.append(week_row)
+        self.calendar_grid.controls = self.week_rows
 
     def _update_calendar(self):
         self.month_label.value = f"{self.current_year}-{self.current_month:02d}"
         cal = calendar.Calendar(firstweekday=0)
         month_days = cal.monthdayscalendar(self.current_year, self.current_month)
-        
-        self.calendar_grid.controls.clear()
-        for week in month_days:
-            week_row = ft.Row(spacing=2, alignment=ft.MainAxisAlignment.CENTER)
-            for day in week:
-                if day == 0:
-                    cell = ft.Container(expand=1, height=45)
-                else:
-                    date_str = f"{self.current_year:04d}-{self.current_month:02d}-{day:02d}"
-                    summary = self.month_data.get(date_str, {})
-                    cell = self._build_day_cell(day, date_str, summary)
-                week_row.controls.append(cell)
-            self.calendar_grid.controls.append(week_row)
-        
-        try:
-             self.update()
-        except:
-             pass
+        today_str = self.today.isoformat()
 
-    def _build_day_cell(self, day, date_str, summary):
-        is_today = (date_str == self.today.isoformat())
-        has_data = bool(summary)
-        
-        indicators = []
-        has_any_activity = False
-        if has_data:
-            has_any_activity = (summary.get("water_intake", 0) > 0)
+        for week_index, week_row in enumerate(self.week_rows):
+            week = month_days[week_index] if week_index < len(month_days) else [0] * 7
+            week_row.visible = week_index < len(month_days)
+            for day, cell in zip(week, self.day_cells[week_index * 7:week_index * 7 + 7]):
+                if day == 0:
+                    cell.bind(0, None, {}, False)
+                    continue
+                date_str = f"{self.current_year:04d}-{self.current_month:02d}-{day:02d}"
+                cell.bind(day, date_str, self.month_data.get(date_str, {}), date_str == today_str)
 
-        if has_data and has_any_activity:
-            water_color = ft.Colors.BLUE_400 if summary.get("water_achieved") else ft.Colors.RED_400
-            indicators.append(ft.Container(width=6, height=6, border_radius=3, bgcolor=water_color))
+        update_scheduler.request_update(self)
 
-            
-        elif has_data and not has_any_activity:
-             pass 
-             
-        indicator_row = ft.Row(controls=indicators, spacing=2, alignment=ft.MainAxisAlignment.CENTER) if indicators else ft.Container(height=6)
-        
-        return ft.Container(
-            content=ft.Column([
-                ft.Text(str(day), size=12, weight=ft.FontWeight.BOLD if is_today else ft.FontWeight.NORMAL,
-                       color=ft.Colors.PURPLE_700 if is_today else ft.Colors.BLACK),
-                indicator_row
-            ], spacing=1, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-            expand=1, height=45,
-            bgcolor=ft.Colors.PURPLE_100 if is_today else None,
-            border=ft.border.all(1, ft.Colors.PURPLE_400) if is_today else None,
-            border_radius=8, alignment=ft.Alignment(0, 0), padding=ft.padding.only(top=2),
-            on_click=lambda e: self._show_details(date_str, summary), ink=True
-        )
+    def _on_day_click(self, e):
+        date_str = e.control.data
+        if date_str:
+            self._show_details(date_str, self.month_data.get(date_str, {}))
 
     def _show_details(self, date_str, summary):
         if self.page and self.details_dialog not in self.page.overlay:
@@ -205,7 +216,7 @@ class CalendarGridCard(ft.Container):
                                f"{summary.get('water_intake',0)}/{summary.get('water_goal',2000)} ml", ft.Colors.BLUE_50)
 
         self.details_dialog.open = True
-        self.page.update()
+        update_scheduler.request_update()
 
     def _add_detail_row(self, icon, icon_color, title_key, value_text, bg_color):
         self.details_content.controls.append(
@@ -222,4 +233,4 @@ class CalendarGridCard(ft.Container):
 
     def _close_dialog(self, e):
         self.details_dialog.open = False
-        self.page.update()
+        update_scheduler.request_update()
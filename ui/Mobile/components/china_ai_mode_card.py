@@ -1,8 +1,9 @@
 
 import flet as ft
-from ui.styles import CARD_STYLE
+from ui.styles import CARD_STYLE, theme_manager
 from core.i18n import i18n_manager, I18nText
 from data.storage import load_user_data
+from core import update_scheduler
 
 class ChinaAIModeCard(ft.Container):
     
@@ -10,6 +11,7 @@ class ChinaAIModeCard(ft.Container):
     def __init__(self):
         mobile_style = {**CARD_STYLE, "padding": 12}
         super().__init__(**mobile_style)
+        theme_manager.track_card(self)
         
         user_data = load_user_data()
         current_mode = user_data.get("china_ai_mode", False)
@@ -52,7 +54,7 @@ class ChinaAIModeCard(ft.Container):
                 text_col = row.controls[1]
                 if isinstance(text_col, ft.Column) and len(text_col.controls) > 1:
                     text_col.controls[1].value = f"({i18n_manager.t('china_ai_mode_note')})"
-        self.update()
+        update_scheduler.request_update(self)
 
     def get_selected_mode(self):
         return self.mode_switch.value
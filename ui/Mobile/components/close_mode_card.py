@@ -1,9 +1,10 @@
 
 import flet as ft
-from ui.styles import CARD_STYLE
+from ui.styles import CARD_STYLE, theme_manager
 from ui.Mobile.utils.selection_dialog import SelectionDialog, SelectionOption
 from core.i18n import i18n_manager, I18nText
 from data.storage import load_user_data
+from core import update_scheduler
 
 CLOSE_MODE_OPTIONS = ["ask", "minimize", "quit"]
 
@@ -13,6 +14,7 @@ class CloseModeCard(ft.Container):
     def __init__(self):
         mobile_style = {**CARD_STYLE, "padding": 12}
         super().__init__(**mobile_style)
+        theme_manager.track_card(self)
         
         user_data = load_user_data()
         self.selected_mode = user_data.get("close_mode", "ask")
@@ -60,7 +62,7 @@ class CloseModeCard(ft.Container):
     def update_ui(self):
         if not self.page: return
         self.mode_selector.set_selected(self.selected_mode)
-        self.update()
+        update_scheduler.request_update(self)
 
     def get_selected_mode(self):
         return self.selected_mode
@@ -1,6 +1,6 @@
 
 import flet as ft
-from ui.styles import AppColors, CARD_STYLE
+from ui.styles import AppColors, CARD_STYLE, theme_manager
 from ui.Mobile.utils.selection_dialog import SelectionDialog, SelectionOption
 from core.i18n import i18n_manager, I18nText
 
@@ -10,6 +10,7 @@ class LanguageSelectCard(ft.Container):
     def __init__(self):
         mobile_style = {**CARD_STYLE, "padding": 12}
         super().__init__(**mobile_style)
+        theme_manager.track_card(self)
         
         self.selected_code = i18n_manager.current_lang
         options = self._build_language_options()
@@ -50,14 +51,13 @@ class LanguageSelectCard(ft.Container):
             except ValueError: return 999
 
         sorted_codes = sorted(
-            i18n_manager.translations.keys(),
+            i18n_manager.available_languages(),
             key=lambda k: get_sort_index(k)
         )
         
         options = []
         for code in sorted_codes:
-            data = i18n_manager.translations.get(code, {})
-            name = data.get("language_name", code)
+            name = i18n_manager.language_name(code)
             if code == "zh_TW": name = "Traditional Chinese"
             
             options.append(SelectionOption(key=code, label=name))
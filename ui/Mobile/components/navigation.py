@@ -2,6 +2,7 @@
 import flet as ft
 from core.i18n import i18n_manager
 from ui.styles import theme_manager
+from core import update_scheduler
 
 class MobileNavigationBar(ft.Container):
     
@@ -42,8 +43,6 @@ class MobileNavigationBar(ft.Container):
     def update_theme(self):
         self.bgcolor = theme_manager.current_colors.CARD_BG
         self._update_selection_visuals()
-        if self.page:
-            self.update()
 
     def update_ui(self):
         for config in self.nav_configs:
@@ -51,8 +50,7 @@ class MobileNavigationBar(ft.Container):
             if idx in self.nav_buttons:
                 _, text_control, _ = self.nav_buttons[idx]
                 text_control.value = i18n_manager.t(config["key"])
-        if self.page:
-            self.update()
+        update_scheduler.request_update(self)
 
     def _build_nav_item(self, config):
         idx = config["index"]
@@ -128,8 +126,7 @@ class MobileNavigationBar(ft.Container):
             text_control.weight = ft.FontWeight.W_500 if is_selected else ft.FontWeight.NORMAL
             container.bgcolor = bgcolor
             
-            if self.page:
-                container.update()
+            update_scheduler.request_update(container)
 
     def set_selection(self, actual_index):
         
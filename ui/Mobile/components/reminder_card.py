@@ -1,30 +1,14 @@
 
 import flet as ft
 import datetime
-import asyncio
-from ui.styles import CARD_STYLE
+from ui.styles import CARD_STYLE, theme_manager
 from core import event_bus
+from core import update_scheduler
+from core.reminders import reminder_scheduler, reminder_state, next_half_hour, every_second, half_hour_period, WATER
 from ui.Mobile.utils.time_utils import get_timezone_str, get_current_time_str
-from data.storage import load_user_data, save_user_data
+from data.storage import save_user_data
 from core.i18n import i18n_manager, I18nText
 
-def get_half_hour_period_id(dt: datetime.datetime) -> int:
-    return dt.hour * 2 + (1 if dt.minute >= 30 else 0)
-
-def get_day_period_key(dt: datetime.datetime) -> tuple:
-    return (dt.date().isoformat(), get_half_hour_period_id(dt))
-
-def should_trigger_reminder(last_drink_time: datetime.datetime = None) -> bool:
-    now = datetime.datetime.now()
-    if last_drink_time is None:
-        return True
-    current_key = get_day_period_key(now)
-    last_drink_key = get_day_period_key(last_drink_time)
-    return current_key != last_drink_key
-
-def is_reminder_time(dt: datetime.datetime) -> bool:
-    return dt.minute in [0, 30]
-
 class ReminderCard(ft.Container):
     
     _last_notified_period = None
@@ -32,49 +16,42 @@ class ReminderCard(ft.Container):
     def __init__(self):
         mobile_style = {**CARD_STYLE, "padding": 12}
         super().__init__(**mobile_style)
+        theme_manager.track_card(self)
         
-        self.running = True
+        self.clock_job = None
         self.timezone_str = get_timezone_str()
-        self.last_checked_period = None
         
         self.is_warning = self._check_reminder_needed()
         self._init_components()
         self.content = self._build_content()
-        event_bus.subscribe(event_bus.WATER_ADDED, self._on_water_added)
 
     def did_mount(self):
-        self.running = True
+        event_bus.subscribe(event_bus.WATER_ADDED, self._on_water_added)
+        event_bus.subscribe(event_bus.REMINDER_DUE, self._on_reminder_due)
+        event_bus.subscribe(event_bus.BACKGROUND_CHANGED, self._on_background_changed)
         self.is_warning = self._check_reminder_needed()
         self.warning_container.visible = self.is_warning
         
         if self.is_warning:
             save_user_data({"reminder_active": True})
-            current_period = get_half_hour_period_id(datetime.datetime.now())
+            current_period = half_hour_period(datetime.datetime.now())
             if ReminderCard._last_notified_period != current_period:
                 ReminderCard._last_notified_period = current_period
                 self._show_system_notification()
         else:
             save_user_data({"reminder_active": False})
         
-        if self.page:
-            self.warning_container.update()
+        update_scheduler.request_update(self.warning_container)
         
-        asyncio.create_task(self.update_clock())
+        if not update_scheduler.is_suspended():
+            self._start_clock()
 
     def will_unmount(self):
-        self.running = False
-        event_bus.unsubscribe(event_bus.WATER_ADDED, self._on_water_added)
+        self._stop_clock()
+        event_bus.release(self)
 
     def _check_reminder_needed(self) -> bool:
-        user_data = load_user_data()
-        last_drink_str = user_data.get("last_drink_timestamp")
-        if not last_drink_str:
-            return True
-        try:
-            last_drink_time = datetime.datetime.fromisoformat(last_drink_str)
-            return should_trigger_reminder(last_drink_time)
-        except (ValueError, TypeError):
-            return True
+        return reminder_state.water_due(datetime.datetime.now())
 
     def _init_components(self):
         self.countdown_text = ft.Text(
@@ -130,51 +107,43 @@ class ReminderCard(ft.Container):
             )
         ], spacing=4)
 
-    async def update_clock(self):
-        while self.running:
-            try:
-                now = datetime.datetime.now()
-                current_period = get_half_hour_period_id(now)
-                
-                target_minute = 30 if now.minute < 30 else 0
-                target_hour = now.hour if now.minute < 30 else (now.hour + 1) % 24
-                target_time = now.replace(
-                    hour=target_hour, minute=target_minute, 
-                    second=0, microsecond=0
-                )
-                if target_hour < now.hour:
-                    target_time += datetime.timedelta(days=1)
-                
-                minutes, seconds = divmod(int((target_time - now).total_seconds()), 60)
-                
-                if self.last_checked_period != current_period:
-                    self.last_checked_period = current_period
-                    if not self.is_warning:
-                        need_reminder = self._check_reminder_needed()
-                        if need_reminder:
-                            self.is_warning = True
-                            self.warning_container.visible = True
-                            save_user_data({"reminder_active": True})
-                            if self.page:
-                                self.warning_container.update()
-                                self._show_system_notification()
-                
-                if self.page:
-                    self.countdown_text.value = f"{minutes:02d}:{seconds:02d}"
-                    self.time_text.value = f"{self.timezone_str} {i18n_manager.t('reminder_current_time')} {get_current_time_str()}"
-                    self.countdown_text.update()
-                    self.time_text.update()
+    def _start_clock(self):
+        if self.clock_job is None:
+            self.clock_job = reminder_scheduler.schedule("clock", every_second, self.update_clock)
+        self.update_clock(datetime.datetime.now())
+
+    def _stop_clock(self):
+        if self.clock_job is not None:
+            self.clock_job.cancel()
+            self.clock_job = None
+
+    def _on_background_changed(self, in_background, *args, **kwargs):
+        if in_background:
+            self._stop_clock()
+        else:
+            self._start_clock()
 
-            except Exception:
-                pass
-            await asyncio.sleep(1)
+    def update_clock(self, now):
+        minutes, seconds = divmod(int((next_half_hour(now) - now).total_seconds()), 60)
+        self.countdown_text.value = f"{minutes:02d}:{seconds:02d}"
+        self.time_text.value = f"{self.timezone_str} {i18n_manager.t('reminder_current_time')} {get_current_time_str()}"
+        update_scheduler.request_update(self.countdown_text, self.time_text)
+
+    def _on_reminder_due(self, kinds, *args, **kwargs):
+        if WATER not in kinds or self.is_warning:
+            return
+        self.is_warning = True
+        self.warning_container.visible = True
+        save_user_data({"reminder_active": True})
+        update_scheduler.request_update(self.warning_container)
+        ReminderCard._last_notified_period = half_hour_period(datetime.datetime.now())
+        self._show_snackbar()
 
     def _on_water_added(self, *args, **kwargs):
         self.is_warning = False
         self.warning_container.visible = False
         try:
-            if self.page:
-                self.warning_container.update()
+            update_scheduler.request_update(self.warning_container)
         except Exception:
             pass
 
@@ -184,6 +153,9 @@ class ReminderCard(ft.Container):
             send_notification()
         except Exception:
             pass
+        self._show_snackbar()
+
+    def _show_snackbar(self):
         try:
             if self.page:
                 self.page.snack_bar = ft.SnackBar(
@@ -192,6 +164,6 @@ class ReminderCard(ft.Container):
                     duration=5000
                 )
                 self.page.snack_bar.open = True
-                self.page.update()
+                update_scheduler.request_update()
         except Exception:
             pass
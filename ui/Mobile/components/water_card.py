@@ -1,12 +1,22 @@
 
 import flet as ft
 import datetime
-from ui.styles import AppColors, CARD_STYLE
+from ui.styles import AppColors, CARD_STYLE, theme_manager
 from core import event_bus
-from data.storage import load_user_data, save_user_data
+from core import update_scheduler
+from data.storage import load_user_data, save_user_data, user_data_from, PROFILE_KEYS
 from core.calculations import calculate_water_goal
 from ui.Mobile.utils.confirmation import create_confirmation_dialog
 from core.i18n import i18n_manager, I18nText
+from ui.keyed_list import KeyedList
+
+WATER_CUP_OPTIONS = [
+    ("100", "water_cup_small"),
+    ("150", "water_cup_half"),
+    ("200", "water_cup_single"),
+    ("250", "water_cup_large"),
+    ("300", "water_cup_mug"),
+]
 
 class WaterCard(ft.Container):
     
@@ -15,6 +25,7 @@ class WaterCard(ft.Container):
 
         mobile_style = {**CARD_STYLE, "padding": 12}
         super().__init__(**mobile_style)
+        theme_manager.track_card(self)
         self.water_intake = 0
         self.water_goal = 2000
         self.water_records = []
@@ -25,21 +36,26 @@ class WaterCard(ft.Container):
         self._init_components()
         self.content = self._build_content()
         self.update_ui(initial_load=True)
-        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_user_data_saved)
 
     def did_mount(self):
+        event_bus.subscribe(event_bus.USER_DATA_SAVED, self._on_user_data_saved, keys=PROFILE_KEYS)
+        theme_manager.subscribe(self._on_theme_changed)
         self._initialize_data()
         self.update_ui()
         self._update_records_ui()
 
         if self.page and self.confirmation_dialog not in self.page.overlay:
             self.page.overlay.append(self.confirmation_dialog)
-            self.page.update()
+            update_scheduler.request_update()
 
     def will_unmount(self):
         if self.page and self.confirmation_dialog in self.page.overlay:
             self.page.overlay.remove(self.confirmation_dialog)
-        event_bus.unsubscribe(event_bus.USER_DATA_SAVED, self._on_user_data_saved)
+        theme_manager.unsubscribe(self._on_theme_changed)
+        event_bus.release(self)
+
+    def _on_theme_changed(self):
+        self.update_ui(initial_load=True)
 
     def _init_components(self):
         initial_progress = min(self.water_intake / self.water_goal, 1.0) if self.water_goal > 0 else 0
@@ -48,6 +64,7 @@ class WaterCard(ft.Container):
             bgcolor=AppColors.WATER_BG, 
             value=initial_progress
         )
+        theme_manager.track(self.water_progress, bgcolor="WATER_BG")
         self.water_text = ft.Text(
             f"{self.water_intake} / {self.water_goal} ml", 
             size=18,
@@ -59,11 +76,8 @@ class WaterCard(ft.Container):
             label=i18n_manager.t("water_select_label"), 
             hint_text=i18n_manager.t("hint_pleaseselect"),
             options=[
-                ft.dropdown.Option(key="100", text=i18n_manager.t("water_cup_small")),
-                ft.dropdown.Option(key="150", text=i18n_manager.t("water_cup_half")),
-                ft.dropdown.Option(key="200", text=i18n_manager.t("water_cup_single")),
-                ft.dropdown.Option(key="250", text=i18n_manager.t("water_cup_large")),
-                ft.dropdown.Option(key="300", text=i18n_manager.t("water_cup_mug"))
+                i18n_manager.track(ft.dropdown.Option(key=key, text=i18n_manager.t(text_key)), text=text_key)
+                for key, text_key in WATER_CUP_OPTIONS
             ],
             expand=True,
             height=42, 
@@ -72,6 +86,7 @@ class WaterCard(ft.Container):
             border_radius=8, 
             bgcolor=ft.Colors.GREY_50,
         )
+        i18n_manager.track(self.cup_selector, label="water_select_label", hint_text="hint_pleaseselect")
         self.congrats_text = ft.Container(
             content=I18nText(
                 key="water_congrats", 
@@ -89,6 +104,11 @@ class WaterCard(ft.Container):
         
 
         self.records_list = ft.Column(spacing=6, scroll=ft.ScrollMode.AUTO, height=150)
+        self.records_view = KeyedList(
+            self.records_list, self._build_record_row,
+            key=lambda record: (record.get("timestamp"), record.get("amount")),
+            empty_builder=self._build_empty_row, page_size=8
+        )
 
         self.confirmation_dialog = create_confirmation_dialog(
             "", self._on_confirm_action, self._close_dialog
@@ -117,6 +137,9 @@ class WaterCard(ft.Container):
             on_click=self._handle_add_click, 
             tooltip=i18n_manager.t("water_add")
         )
+        i18n_manager.track(self.reset_button, tooltip="water_reset")
+        i18n_manager.track(self.subtract_button, tooltip="water_subtract")
+        i18n_manager.track(self.add_button, tooltip="water_add")
         
         return ft.Column([
 
@@ -201,8 +224,8 @@ class WaterCard(ft.Container):
                     "amount": self.water_intake
                 }]
 
-    def _on_user_data_saved(self, *args, **kwargs):
-        user_data = load_user_data()
+    def _on_user_data_saved(self, changes=None, *args, **kwargs):
+        user_data = user_data_from(changes)
         self.water_goal = calculate_water_goal(user_data)
         self.update_ui()
 
@@ -210,13 +233,11 @@ class WaterCard(ft.Container):
         self.confirmation_dialog.title.value = title
         self._action_to_confirm = action
         self.confirmation_dialog.open = True
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
 
     def _close_dialog(self, e=None):
         self.confirmation_dialog.open = False
-        if self.page:
-            self.page.update()
+        update_scheduler.request_update()
 
     def _on_confirm_action(self, e):
         if self._action_to_confirm:
@@ -226,7 +247,7 @@ class WaterCard(ft.Container):
     def _handle_add_click(self, e):
         if not self.cup_selector.value:
             self.cup_selector.error_text = i18n_manager.t("hint_pleaseselect")
-            self.cup_selector.update()
+            update_scheduler.request_update(self.cup_selector)
             return
         self._amount_to_change = int(self.cup_selector.value)
         self._open_dialog(i18n_manager.t("water_confirm_drink"), self._execute_add)
@@ -234,7 +255,7 @@ class WaterCard(ft.Container):
     def _handle_subtract_click(self, e):
         if not self.cup_selector.value:
             self.cup_selector.error_text = i18n_manager.t("hint_pleaseselect")
-            self.cup_selector.update()
+            update_scheduler.request_update(self.cup_selector)
             return
         self._amount_to_change = int(self.cup_selector.value)
         self._open_dialog(i18n_manager.t("water_confirm_subtract"), self._execute_subtract)
@@ -250,7 +271,7 @@ class WaterCard(ft.Container):
             "amount": self._amount_to_change
         })
         self.cup_selector.error_text = None
-        self.cup_selector.update()
+        update_scheduler.request_update(self.cup_selector)
         self._save_data()
         self._update_timestamp()
         self.update_ui()
@@ -267,7 +288,7 @@ class WaterCard(ft.Container):
         
         self.water_intake = max(0, self.water_intake - self._amount_to_change)
         self.cup_selector.error_text = None
-        self.cup_selector.update()
+        update_scheduler.request_update(self.cup_selector)
         self._save_data()
         self.update_ui()
         self._update_records_ui()
@@ -291,51 +312,43 @@ class WaterCard(ft.Container):
         })
 
     def _update_timestamp(self):
-        now = datetime.datetime.now()
-        self.timestamp_text.value = f"{i18n_manager.t('water_last_record')}: {now.strftime('%H:%M:%S')}"
-        if self.page:
-            self.timestamp_text.update()
+        time_str = datetime.datetime.now().strftime('%H:%M:%S')
+        self.timestamp_text.value = f"{i18n_manager.t('water_last_record')}: {time_str}"
+        i18n_manager.track(self.timestamp_text, value=lambda: f"{i18n_manager.t('water_last_record')}: {time_str}")
+        update_scheduler.request_update(self.timestamp_text)
     
+    def _build_empty_row(self):
+        return ft.Container(
+            content=I18nText(
+                key="water_no_records",
+                size=11,
+                color=ft.Colors.GREY_500,
+                text_align=ft.TextAlign.CENTER
+            ),
+            alignment=ft.Alignment(0, 0),
+            padding=8
+        )
+
+    def _build_record_row(self, record):
+        timestamp = datetime.datetime.fromisoformat(record["timestamp"])
+        time_str = timestamp.strftime("%H:%M")
+        amount = record["amount"]
+
+        record_item = ft.Container(
+            content=ft.Row([
+                ft.Icon(ft.Icons.WATER_DROP, color=ft.Colors.BLUE_400, size=14),
+                ft.Text(time_str, size=12, weight=ft.FontWeight.W_500),
+                ft.Container(expand=True),
+                ft.Text(f"{amount} ml", size=12, color=ft.Colors.BLUE_600, weight=ft.FontWeight.BOLD)
+            ]),
+            bgcolor=ft.Colors.BLUE_50,
+            padding=6,
+            border_radius=6
+        )
+        return record_item
+
     def _update_records_ui(self):
-        self.records_list.controls.clear()
-        
-        if not self.water_records:
-            self.records_list.controls.append(
-                ft.Container(
-                    content=ft.Text(
-                        i18n_manager.t("water_no_records"),
-                        size=11,
-                        color=ft.Colors.GREY_500,
-                        text_align=ft.TextAlign.CENTER
-                    ),
-                    alignment=ft.Alignment(0, 0),
-                    padding=8
-                )
-            )
-        else:
-            for record in reversed(self.water_records[-8:]):
-                try:
-                    timestamp = datetime.datetime.fromisoformat(record["timestamp"])
-                    time_str = timestamp.strftime("%H:%M")
-                    amount = record["amount"]
-                    
-                    record_item = ft.Container(
-                        content=ft.Row([
-                            ft.Icon(ft.Icons.WATER_DROP, color=ft.Colors.BLUE_400, size=14),
-                            ft.Text(time_str, size=12, weight=ft.FontWeight.W_500),
-                            ft.Container(expand=True),
-                            ft.Text(f"{amount} ml", size=12, color=ft.Colors.BLUE_600, weight=ft.FontWeight.BOLD)
-                        ]),
-                        bgcolor=ft.Colors.BLUE_50,
-                        padding=6,
-                        border_radius=6
-                    )
-                    self.records_list.controls.append(record_item)
-                except (ValueError, KeyError):
-                    continue
-        
-        if self.page:
-            self.records_list.update()
+        self.records_view.set_items(list(reversed(self.water_records)))
 
     def update_ui(self, initial_load=False):
         progress = min(self.water_intake / self.water_goal, 1.0) if self.water_goal > 0 else 0
@@ -348,5 +361,5 @@ class WaterCard(ft.Container):
         else:
             self.water_progress.color, self.water_text.color = AppColors.WATER_PROGRESS, AppColors.WATER_TEXT
 
-        if not initial_load and hasattr(self, '_page') and self._page is not None:
-            self.update()
+        if not initial_load:
+            update_scheduler.request_update(self)
@@ -1,5 +1,5 @@
 import flet as ft
-from core.i18n import i18n_manager
+from core.i18n import i18n_manager, I18nText
 
 def create_confirmation_dialog(title: str, on_confirm, on_cancel) -> ft.AlertDialog:
     
@@ -9,9 +9,9 @@ def create_confirmation_dialog(title: str, on_confirm, on_cancel) -> ft.AlertDia
         shape=ft.RoundedRectangleBorder(radius=15),
         actions=[
 
-            ft.Container(
+            i18n_manager.track(ft.Container(
                 content=ft.Row(
-                    [ft.Icon(ft.Icons.CHECK, color=ft.Colors.WHITE), ft.Text(i18n_manager.t("confirm_button"), color=ft.Colors.WHITE)],
+                    [ft.Icon(ft.Icons.CHECK, color=ft.Colors.WHITE), I18nText(key="confirm_button", color=ft.Colors.WHITE)],
                     tight=True
                 ),
                 bgcolor=ft.Colors.GREEN_500,
@@ -19,11 +19,11 @@ def create_confirmation_dialog(title: str, on_confirm, on_cancel) -> ft.AlertDia
                 border_radius=10,
                 on_click=on_confirm,
                 tooltip=i18n_manager.t("confirm_button")
-            ),
+            ), tooltip="confirm_button"),
 
-            ft.Container(
+            i18n_manager.track(ft.Container(
                 content=ft.Row(
-                    [ft.Icon(ft.Icons.CLOSE, color=ft.Colors.WHITE), ft.Text(i18n_manager.t("cancel_button"), color=ft.Colors.WHITE)],
+                    [ft.Icon(ft.Icons.CLOSE, color=ft.Colors.WHITE), I18nText(key="cancel_button", color=ft.Colors.WHITE)],
                     tight=True
                 ),
                 bgcolor=ft.Colors.RED_500,
@@ -31,7 +31,7 @@ def create_confirmation_dialog(title: str, on_confirm, on_cancel) -> ft.AlertDia
                 border_radius=10,
                 on_click=on_cancel,
                 tooltip=i18n_manager.t("cancel_button")
-            ),
+            ), tooltip="cancel_button"),
         ],
         actions_alignment=ft.MainAxisAlignment.SPACE_EVENLY,
         content_padding=25,
@@ -0,0 +1,62 @@
+import flet as ft
+import flet.canvas as cv
+from core import update_scheduler
+
+RESIZE_INTERVAL = 100
+
+class TrendChart(cv.Canvas):
+
+    def __init__(self, color, height: int, target: float = None, empty_color=ft.Colors.GREY_200,
+                 gap: float = 2, radius: float = 2):
+        super().__init__(height=height, expand=True, resize_interval=RESIZE_INTERVAL, on_resize=self._on_resize)
+        self.bar_color = color
+        self.empty_color = empty_color
+        self.chart_height = height
+        self.target = target
+        self.gap = gap
+        self.radius = radius
+        self.series = None
+        self.chart_width = 0
+
+    def set_series(self, series) -> bool:
+        if series == self.series:
+            return False
+        self.series = series
+        self._draw()
+        update_scheduler.request_update(self)
+        return True
+
+    def _on_resize(self, e):
+        if e.width == self.chart_width:
+            return
+        self.chart_width = e.width
+        self._draw()
+        update_scheduler.request_update(self)
+
+    def _draw(self):
+        if not self.series or not self.chart_width or not self.series.slots:
+            self.shapes = []
+            return
+
+        slot = self.chart_width / self.series.slots
+        width = max(slot - self.gap, 1)
+        fill = ft.Paint(color=self.bar_color)
+        empty = ft.Paint(color=self.empty_color)
+        shapes = []
+        for index, value in enumerate(self.series.values):
+            if value is None:
+                height, paint = self.chart_height, empty
+            else:
+                height, paint = max(min(value, 1.0) * self.chart_height, 2), fill
+            shapes.append(cv.Rect(
+                x=index * slot, y=self.chart_height - height, width=width, height=height,
+                border_radius=self.radius, paint=paint
+            ))
+
+        if self.target is not None:
+            line_y = self.chart_height - self.target * self.chart_height
+            shapes.append(cv.Line(
+                0, line_y, self.chart_width, line_y,
+                paint=ft.Paint(color=ft.Colors.with_opacity(0.5, ft.Colors.GREY_400), stroke_width=1)
+            ))
+        self.shapes = shapes
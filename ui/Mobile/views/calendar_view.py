@@ -2,6 +2,7 @@
 import flet as ft
 from ui.Mobile.components.calendar_grid_card import CalendarGridCard
 from ui.Mobile.components.calendar_chart_card import CalendarChartCard
+from ui.Mobile.components.year_heatmap_card import YearHeatmapCard
 
 class CalendarView(ft.Container):
     
@@ -12,12 +13,14 @@ class CalendarView(ft.Container):
         
         self.chart_card = CalendarChartCard()
         self.grid_card = CalendarGridCard(on_month_change=self.chart_card.update_month)
+        self.heatmap_card = YearHeatmapCard()
         
 
         self.content = ft.ListView(
             controls=[
                 self.grid_card,
-                self.chart_card
+                self.chart_card,
+                self.heatmap_card
             ],
             spacing=10,
             expand=True,
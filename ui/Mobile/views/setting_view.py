@@ -1,14 +1,15 @@
 
 import flet as ft
-import sys
-import os
-import subprocess
 from core.i18n import I18nText, i18n_manager
+from ui.styles import theme_manager
 from ui.Mobile.components.language_select_card import LanguageSelectCard
 from ui.Mobile.components.theme_select_card import ThemeSelectCard
 from ui.Mobile.components.close_mode_card import CloseModeCard
 from ui.Mobile.components.china_ai_mode_card import ChinaAIModeCard
+from ui.Mobile.components.reminder_kinds_card import ReminderKindsCard
+from ui.Mobile.components.event_bus_stats_card import EventBusStatsCard, DEV_TOOLS_ENABLED
 from data.storage import save_user_data, load_user_data
+from core import update_scheduler
 
 class SettingView(ft.Container):
     
@@ -22,6 +23,7 @@ class SettingView(ft.Container):
         self.theme_card = ThemeSelectCard()
         self.close_mode_card = CloseModeCard()
         self.china_ai_mode_card = ChinaAIModeCard()
+        self.reminder_kinds_card = ReminderKindsCard()
         
         self._load_initial_values()
         
@@ -45,14 +47,16 @@ class SettingView(ft.Container):
                 self.theme_card,
                 self.close_mode_card,
                 self.china_ai_mode_card,
+                self.reminder_kinds_card,
                 ft.Container(height=15),
                 self.apply_button,
             ],
             spacing=0,
             scroll=ft.ScrollMode.AUTO
         )
+        if DEV_TOOLS_ENABLED:
+            self.content.controls.append(EventBusStatsCard())
 
-        self.restart_dialog = None
         i18n_manager.subscribe(self.update_ui)
 
     def _load_initial_values(self):
@@ -61,110 +65,36 @@ class SettingView(ft.Container):
         self._initial_theme = user_data.get("theme_mode", "light")
         self._initial_close_mode = user_data.get("close_mode", "ask")
         self._initial_china_ai_mode = user_data.get("china_ai_mode", False)
-
-    def did_mount(self):
-        if self.page:
-            self.restart_dialog = self._create_restart_dialog()
-            if self.restart_dialog not in self.page.overlay:
-                self.page.overlay.append(self.restart_dialog)
-            self.page.update()
+        self._initial_reminder_kinds = user_data.get("reminder_kinds", ["water"])
 
     def will_unmount(self):
         i18n_manager.unsubscribe(self.update_ui)
-        if self.page and self.restart_dialog:
-            try:
-                self.page.overlay.remove(self.restart_dialog)
-            except ValueError:
-                pass
 
     def update_ui(self):
         if not self.page:
             return
-        if self.restart_dialog:
-            self._update_restart_dialog()
-        self.update()
-
-    def _create_restart_dialog(self):
-        self.dialog_title = ft.Text(
-            i18n_manager.t("restart_confirm_title"), 
-            text_align=ft.TextAlign.CENTER, 
-            size=18, 
-            weight=ft.FontWeight.W_600
-        )
-        self.dialog_content = ft.Text(
-            i18n_manager.t("restart_confirm_message"), 
-            size=14
-        )
-        self.confirm_button_text = ft.Text(
-            i18n_manager.t("confirm_button"), 
-            color=ft.Colors.WHITE,
-            weight=ft.FontWeight.W_500
-        )
-        self.cancel_button_text = ft.Text(
-            i18n_manager.t("cancel_button"), 
-            color=ft.Colors.WHITE,
-            weight=ft.FontWeight.W_500
-        )
-        
-        dialog = ft.AlertDialog(
-            modal=True,
-            title=self.dialog_title,
-            content=self.dialog_content,
-            shape=ft.RoundedRectangleBorder(radius=16),
-            actions=[
-                ft.Container(
-                    content=ft.Row(
-                        [ft.Icon(ft.Icons.CHECK_CIRCLE, color=ft.Colors.WHITE, size=18), self.confirm_button_text],
-                        tight=True,
-                        spacing=6
-                    ),
-                    bgcolor=ft.Colors.GREEN_600,
-                    padding=ft.padding.symmetric(vertical=10, horizontal=18),
-                    border_radius=10,
-                    on_click=self._confirm_restart,
-                ),
-                ft.Container(
-                    content=ft.Row(
-                        [ft.Icon(ft.Icons.CANCEL, color=ft.Colors.WHITE, size=18), self.cancel_button_text],
-                        tight=True,
-                        spacing=6
-                    ),
-                    bgcolor=ft.Colors.RED_600,
-                    padding=ft.padding.symmetric(vertical=10, horizontal=18),
-                    border_radius=10,
-                    on_click=self._cancel_restart,
-                ),
-            ],
-            actions_alignment=ft.MainAxisAlignment.SPACE_EVENLY,
-            content_padding=20,
-        )
-        return dialog
-
-    def _update_restart_dialog(self):
-        if self.restart_dialog:
-            self.dialog_title.value = i18n_manager.t("restart_confirm_title")
-            self.dialog_content.value = i18n_manager.t("restart_confirm_message")
-            self.confirm_button_text.value = i18n_manager.t("confirm_button")
-            self.cancel_button_text.value = i18n_manager.t("cancel_button")
+        update_scheduler.request_update(self)
 
     def _handle_apply(self, e):
         current_lang = self.language_card.get_selected_language()
         current_theme = self.theme_card.get_selected_theme()
         current_close_mode = self.close_mode_card.get_selected_mode()
         current_china_ai_mode = self.china_ai_mode_card.get_selected_mode()
+        current_reminder_kinds = self.reminder_kinds_card.get_selected_kinds()
         
         has_changes = (
             current_lang != self._initial_language or
             current_theme != self._initial_theme or
             current_close_mode != self._initial_close_mode or
-            current_china_ai_mode != self._initial_china_ai_mode
+            current_china_ai_mode != self._initial_china_ai_mode or
+            current_reminder_kinds != self._initial_reminder_kinds
         )
         
         if not has_changes:
             if self.page:
                 self.page.snack_bar = ft.SnackBar(content=ft.Text(i18n_manager.t("settings_no_changes")))
                 self.page.snack_bar.open = True
-                self.page.update()
+                update_scheduler.request_update()
             return
             
         if not current_lang or not current_theme or not current_close_mode:
@@ -177,38 +107,16 @@ class SettingView(ft.Container):
             "language": current_lang,
             "theme_mode": current_theme,
             "close_mode": current_close_mode,
-            "china_ai_mode": current_china_ai_mode
+            "china_ai_mode": current_china_ai_mode,
+            "reminder_kinds": current_reminder_kinds
         })
         
-        if not self.restart_dialog:
-            self.restart_dialog = self._create_restart_dialog()
-            if self.restart_dialog not in self.page.overlay:
-                self.page.overlay.append(self.restart_dialog)
-        
-        if self.restart_dialog:
-            self.restart_dialog.open = True
-            self.page.update()
+        if current_lang != self._initial_language:
+            i18n_manager.set_language(current_lang)
+        if current_theme != self._initial_theme:
+            theme_manager.set_theme(current_theme)
 
-    def _confirm_restart(self, e):
-        python_exe = sys.executable
-        
-        if getattr(sys, 'frozen', False):
-            pass
-        else:
-            script_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), 'main.py')
-            cmd = [python_exe, script_path]
-            cwd = os.path.dirname(script_path)
-            subprocess.Popen(cmd, cwd=cwd, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0)
-        
-        if self.page:
-            try:
-                self.page.window.destroy()
-            except:
-                pass
-        sys.exit(0)
-
-    def _cancel_restart(self, e):
-        if self.restart_dialog:
-            self.restart_dialog.open = False
-            if self.page:
-                self.page.update()
+        self._load_initial_values()
+        self.page.snack_bar = ft.SnackBar(content=ft.Text(i18n_manager.t("settings_applied")))
+        self.page.snack_bar.open = True
+        update_scheduler.request_update()
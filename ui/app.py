@@ -3,57 +3,94 @@ import asyncio
 from datetime import datetime
 import sys
 import os
-from ui.styles import AppColors, is_mobile
-from ui.Desktop.components.navigation import AppNavigationRail
-from ui.Mobile.components.navigation import MobileNavigationBar
-
-from ui.Desktop.components.water_card import WaterCard as DesktopWaterCard
-from ui.Mobile.components.water_card import WaterCard as MobileWaterCard
-from ui.Desktop.components.food_card import FoodCard
-from ui.Desktop.components.nutrition_goals_card import NutritionGoalsCard
-
-from ui.Desktop.views.home_view import HomeView
-from ui.Desktop.views.water_view import WaterView as DesktopWaterView
-from ui.Mobile.views.water_view import WaterView as MobileWaterView
-from ui.Desktop.views.food_view import FoodView
-from ui.Desktop.views.sleep_view import SleepView
-from ui.Desktop.views.exercise_view import ExerciseView
-from ui.Desktop.views.calendar_view import CalendarView as DesktopCalendarView
-from ui.Mobile.views.calendar_view import CalendarView as MobileCalendarView
-from ui.Desktop.views.setting_view import SettingView as DesktopSettingView
-from ui.Mobile.views.setting_view import SettingView as MobileSettingView
-
-from ui.Desktop.components.reminder_card import is_reminder_time, should_trigger_reminder
+from ui.styles import AppColors, theme_manager, is_mobile
 from core.i18n import i18n_manager
-from core.system_tray import SystemTray
-from core.notification import send_notification, flash_window
+from core import event_bus
+from core import update_scheduler
+from core.reminders import Reminders, MESSAGE_KEYS
 from data.database import init_db
+from core.startup_profiler import profiler
+from core.lazy_import import lazy_import
+
+AppNavigationRail = lazy_import("ui.Desktop.components.navigation", "AppNavigationRail")
+MobileNavigationBar = lazy_import("ui.Mobile.components.navigation", "MobileNavigationBar")
+
+DesktopWaterCard = lazy_import("ui.Desktop.components.water_card", "WaterCard")
+MobileWaterCard = lazy_import("ui.Mobile.components.water_card", "WaterCard")
+FoodCard = lazy_import("ui.Desktop.components.food_card", "FoodCard")
+NutritionGoalsCard = lazy_import("ui.Desktop.components.nutrition_goals_card", "NutritionGoalsCard")
+
+HomeView = lazy_import("ui.Desktop.views.home_view", "HomeView")
+DesktopWaterView = lazy_import("ui.Desktop.views.water_view", "WaterView")
+MobileWaterView = lazy_import("ui.Mobile.views.water_view", "WaterView")
+FoodView = lazy_import("ui.Desktop.views.food_view", "FoodView")
+SleepView = lazy_import("ui.Desktop.views.sleep_view", "SleepView")
+ExerciseView = lazy_import("ui.Desktop.views.exercise_view", "ExerciseView")
+DesktopCalendarView = lazy_import("ui.Desktop.views.calendar_view", "CalendarView")
+MobileCalendarView = lazy_import("ui.Mobile.views.calendar_view", "CalendarView")
+DesktopSettingView = lazy_import("ui.Desktop.views.setting_view", "SettingView")
+MobileSettingView = lazy_import("ui.Mobile.views.setting_view", "SettingView")
+
+SystemTray = lazy_import("core.system_tray", "SystemTray")
+send_notification, flash_window = lazy_import("core.notification", "send_notification", "flash_window")
+get_nutrient_matrix = lazy_import("core.food_similarity", "get_nutrient_matrix")
 
 class HealthApp:
+    PREWARM_VIEWS = True
+    PREWARM_DELAY = 1.0
+
     def __init__(self, page: ft.Page):
         self.page = page
         self.is_running = True
+        self.in_background = False
         self.loop = asyncio.get_running_loop()
-        self.last_reminder_minute = None
+        event_bus.bind_loop(self.loop)
+        event_bus.enable_batching(self.loop)
+        update_scheduler.bind(page, self.loop)
+        self.reminders = Reminders()
         self.system_tray = None
         
 
         self.is_mobile_layout = True
         self.main_layout = None 
         
-        init_db()
-        self._setup_page()
-        self._init_shared_components()
-        self._init_views()
-        self._setup_window_controls()
-        self._setup_close_handler()
-        self._build_ui()
-        self._setup_system_tray()
-        self.page.update()
+        profiler.mark("app_init")
+        with profiler.phase("init_db"):
+            init_db()
+        with profiler.phase("start_reminders"):
+            from data.storage import load_user_data
+            event_bus.subscribe(event_bus.REMINDER_DUE, self._on_reminder_due)
+            self.reminders.start(load_user_data())
+        with profiler.phase("setup_page"):
+            self._setup_page()
+        with profiler.phase("init_shared_components"):
+            self._init_shared_components()
+        with profiler.phase("init_views"):
+            self._init_views()
+        with profiler.phase("setup_window"):
+            self._setup_window_controls()
+            self._setup_close_handler()
+        with profiler.phase("build_ui"):
+            self._build_ui()
+        with profiler.phase("setup_system_tray"):
+            self._setup_system_tray()
+        with profiler.phase("first_update"):
+            self.page.update()
+        profiler.mark("first_frame")
+        self._finish_startup_profile()
         
-
+        if self.PREWARM_VIEWS:
+            self.prewarm_task = asyncio.create_task(self._prewarm_views())
         
-        self.reminder_task = asyncio.create_task(self._reminder_check_loop())
+        i18n_manager.subscribe(self._on_language_changed)
+        theme_manager.subscribe(self._on_theme_changed)
+
+    def _finish_startup_profile(self):
+        if not profiler.enabled:
+            return
+        within_budget = profiler.finish()
+        if profiler.exit_after_report:
+            profiler.exit(0 if within_budget else 1)
 
     def _setup_page(self):
         self.page.title = i18n_manager.t("app_title")
@@ -64,15 +101,8 @@ class HealthApp:
         }
         self.page.theme = ft.Theme(font_family="Microsoft YaHei")
         
-        from data.storage import load_user_data
-        user_data = load_user_data()
-        theme_mode = user_data.get("theme_mode", "system")
-        if theme_mode == "light":
-            self.page.theme_mode = ft.ThemeMode.LIGHT
-        elif theme_mode == "dark":
-            self.page.theme_mode = ft.ThemeMode.DARK
-        else:
-            self.page.theme_mode = ft.ThemeMode.SYSTEM
+        self._apply_theme_mode()
+        theme_manager.attach_page(self.page)
         
         if not self.page.web:
             project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -81,36 +111,101 @@ class HealthApp:
                 self.page.window.icon = icon_path
 
     def _init_shared_components(self):
-        if self.is_mobile_layout:
-            self.water_card = MobileWaterCard()
+        self.water_card = None
+        self.nutrition_goals_card = None
+        self.food_card = None
 
-        else:
-            self.water_card = DesktopWaterCard()
+    def _get_water_card(self):
+        if self.water_card is None:
+            self.water_card = MobileWaterCard() if self.is_mobile_layout else DesktopWaterCard()
+        return self.water_card
+
+    def _get_food_cards(self):
+        if self.food_card is None:
             self.nutrition_goals_card = NutritionGoalsCard(food_card_ref=None)
             self.food_card = FoodCard(nutrition_goals_card_ref=self.nutrition_goals_card)
             self.nutrition_goals_card.food_card_ref = self.food_card
+        return self.nutrition_goals_card, self.food_card
+
+    def _create_food_view(self):
+        nutrition_goals_card, food_card = self._get_food_cards()
+        return FoodView(nutrition_goals_card=nutrition_goals_card, food_card=food_card)
 
     def _init_views(self):
+        self.views = {}
         if self.is_mobile_layout:
 
-            self.views = {
-                1: MobileWaterView(water_card=self.water_card),
-                5: MobileCalendarView(),
-                6: MobileSettingView()
+            self.view_factories = {
+                1: lambda: MobileWaterView(water_card=self._get_water_card()),
+                5: MobileCalendarView,
+                6: MobileSettingView
             }
             self.current_view_index = 1
         else:
-            self.views = {
-                0: HomeView(),
-                1: DesktopWaterView(water_card=self.water_card),
-                2: FoodView(nutrition_goals_card=self.nutrition_goals_card, food_card=self.food_card),
-                3: SleepView(),
-                4: ExerciseView(),
-                5: DesktopCalendarView(),
-                6: DesktopSettingView()
+            self.view_factories = {
+                0: HomeView,
+                1: lambda: DesktopWaterView(water_card=self._get_water_card()),
+                2: self._create_food_view,
+                3: SleepView,
+                4: ExerciseView,
+                5: DesktopCalendarView,
+                6: DesktopSettingView
             }
             self.current_view_index = 0
 
+    def _get_view(self, index: int):
+        view = self.views.get(index)
+        if view is None and index in self.view_factories:
+            view = self.view_factories[index]()
+            self.views[index] = view
+        return view
+
+    async def _prewarm_views(self):
+        await asyncio.sleep(self.PREWARM_DELAY)
+        for index in self.view_factories:
+            if not self.is_running:
+                return
+            if index in self.views:
+                continue
+            try:
+                self._get_view(index)
+            except Exception as e:
+                print(f"Error prewarming view {index}: {e}")
+            await asyncio.sleep(0)
+
+        try:
+            await asyncio.to_thread(get_nutrient_matrix)
+        except Exception as e:
+            print(f"Error prewarming nutrient matrix: {e}")
+
+    def _on_language_changed(self):
+        self.page.title = i18n_manager.t("app_title")
+
+        was_open = self.exit_dialog.open
+        if self.exit_dialog in self.page.overlay:
+            self.page.overlay.remove(self.exit_dialog)
+        self._setup_close_handler()
+        if was_open:
+            self._show_exit_dialog()
+
+        update_scheduler.request_update()
+
+    def _apply_theme_mode(self):
+        theme_mode = theme_manager.theme_mode
+        if theme_mode == "light":
+            self.page.theme_mode = ft.ThemeMode.LIGHT
+        elif theme_mode == "dark":
+            self.page.theme_mode = ft.ThemeMode.DARK
+        else:
+            self.page.theme_mode = ft.ThemeMode.SYSTEM
+
+    def _on_theme_changed(self):
+        self._apply_theme_mode()
+        self.page.bgcolor = AppColors.BACKGROUND
+        if getattr(self, "content_area", None):
+            self.content_area.bgcolor = AppColors.BACKGROUND
+        update_scheduler.request_update()
+
     def _setup_window_controls(self):
         if not self.page.web:
             self.page.window.prevent_close = True
@@ -208,16 +303,34 @@ class HealthApp:
                 self._quit_app()
             else:
                 self._show_exit_dialog()
+        elif "MINIMIZE" in event_type_str.upper():
+            self._enter_background()
+        elif "RESTORE" in event_type_str.upper():
+            self._leave_background()
+
+    def _enter_background(self):
+        if self.in_background:
+            return
+        self.in_background = True
+        update_scheduler.suspend()
+        event_bus.publish(event_bus.BACKGROUND_CHANGED, True)
+
+    def _leave_background(self):
+        if not self.in_background:
+            return
+        self.in_background = False
+        update_scheduler.resume()
+        event_bus.publish(event_bus.BACKGROUND_CHANGED, False)
 
     def _show_exit_dialog(self):
         if self.exit_dialog not in self.page.overlay:
             self.page.overlay.append(self.exit_dialog)
         self.exit_dialog.open = True
-        self.page.update()
+        update_scheduler.request_update()
 
     def _close_exit_dialog(self, e=None):
         self.exit_dialog.open = False
-        self.page.update()
+        update_scheduler.request_update()
 
     def _minimize_to_tray(self, e=None):
 
@@ -227,11 +340,14 @@ class HealthApp:
         
         self.exit_dialog.open = False
         self.page.update()
-        
+        self._hide_window_to_tray()
+
+    def _hide_window_to_tray(self):
         if not self.page.web:
             self.page.window.visible = False
             self.page.window.skip_task_bar = True
             self.page.update()
+            self._enter_background()
 
     def _quit_app(self, e=None):
         try:
@@ -252,15 +368,14 @@ class HealthApp:
             self.page.window.visible = True
             self.page.window.skip_task_bar = False
             self.page.update()
+        self._leave_background()
             
     def _navigate_from_tray(self, index):
-        self._show_window_from_tray()
-        self.loop.call_soon_threadsafe(self._on_nav_change, index)
+        event_bus.call_in_loop(self._show_window_from_tray)
+        event_bus.call_in_loop(self._on_nav_change, index)
             
     def _quit_from_tray(self):
-        if self.loop and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self._quit_app)
-        else:
+        if not event_bus.call_in_loop(self._quit_app):
             os._exit(0)
 
     def _setup_system_tray(self):
@@ -269,43 +384,20 @@ class HealthApp:
         
         self.system_tray = SystemTray(
             page=self.page,
-            on_show_window=self._show_window_from_tray,
+            on_show_window=lambda: event_bus.call_in_loop(self._show_window_from_tray),
+            on_hide_window=lambda: event_bus.call_in_loop(self._hide_window_to_tray),
             on_quit=self._quit_from_tray,
             on_navigate=self._navigate_from_tray
         )
         self.system_tray.start()
 
-    async def _reminder_check_loop(self):
-        while self.is_running:
-            try:
-                now = datetime.now()
-                current_minute = now.minute
-                
-                if is_reminder_time(now) and current_minute != self.last_reminder_minute:
-                    self.last_reminder_minute = current_minute
-                    
-                    from data.storage import load_user_data
-                    user_data = load_user_data()
-                    last_drink_str = user_data.get("last_drink_timestamp")
-                    last_drink = None
-                    if last_drink_str:
-                        try:
-                            last_drink = datetime.fromisoformat(last_drink_str)
-                        except (ValueError, TypeError):
-                            pass
-                            
-                    if should_trigger_reminder(last_drink):
-                        self._send_notification()
-                
-                await asyncio.sleep(1)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                await asyncio.sleep(1)
+    def _on_reminder_due(self, kinds, *args, **kwargs):
+        for kind in kinds:
+            self._send_notification(MESSAGE_KEYS.get(kind, "reminder_warning"))
 
-    def _send_notification(self):
+    def _send_notification(self, message_key: str = "reminder_warning"):
         try:
-            send_notification()
+            send_notification(message_key=message_key)
             
             if not self.page.web and self.page.window.visible:
                 flash_window(self.page.title)
@@ -314,11 +406,11 @@ class HealthApp:
 
     def _build_ui(self):
 
-        if self.current_view_index not in self.views:
+        if self.current_view_index not in self.view_factories:
              self.current_view_index = 1 if self.is_mobile_layout else 0
         
         self.content_area = ft.Container(
-            content=self.views[self.current_view_index],
+            content=self._get_view(self.current_view_index),
             expand=True,
             bgcolor=AppColors.BACKGROUND
         )
@@ -375,6 +467,12 @@ class HealthApp:
             if hasattr(self, 'navigation_rail') and self.navigation_rail:
                 self.navigation_rail.set_selection(index)
 
+        cached_view = self.views.get(index)
+        if cached_view is not None:
+            self.content_area.content = cached_view
+            update_scheduler.request_update()
+            return
+
         loading_indicator = ft.Container(
             content=ft.Column(
                 [
@@ -389,13 +487,16 @@ class HealthApp:
             alignment=ft.Alignment(0, 0)
         )
         self.content_area.content = loading_indicator
-        self.page.update()
+        update_scheduler.request_update()
         
 
         async def load_view():
             await asyncio.sleep(0.01)
-            if index in self.views:
-                self.content_area.content = self.views[index]
-                self.page.update()
+            view = self._get_view(index)
+            if index != self.current_view_index:
+                return
+            if view is not None:
+                self.content_area.content = view
+                update_scheduler.request_update()
         
         asyncio.create_task(load_view())
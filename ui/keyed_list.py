@@ -0,0 +1,115 @@
+import json
+import flet as ft
+from core.i18n import i18n_manager
+from core import update_scheduler
+
+DEFAULT_PAGE_SIZE = 50
+
+def item_signature(item):
+    try:
+        return json.dumps(item, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return repr(item)
+
+class KeyedList:
+
+    def __init__(self, container, build_row, key=lambda item: item["id"], signature=item_signature,
+                 empty_builder=None, page_size: int = DEFAULT_PAGE_SIZE):
+        self.container = container
+        self.build_row = build_row
+        self.key = key
+        self.signature = signature
+        self.empty_builder = empty_builder
+        self.page_size = page_size
+        self.limit = page_size
+        self.items = []
+        self._rows = {}
+        self._empty_control = None
+        self._more_text = ft.Text(size=12, color=ft.Colors.BLUE_600)
+        self._more_control = ft.Container(
+            content=ft.Row([ft.Icon(ft.Icons.EXPAND_MORE, size=16, color=ft.Colors.BLUE_600), self._more_text],
+                           alignment=ft.MainAxisAlignment.CENTER, spacing=4),
+            padding=8,
+            on_click=self._show_more
+        )
+
+    def _row_for(self, item):
+        row_key = self.key(item)
+        signature = self.signature(item)
+        cached = self._rows.get(row_key)
+        if cached is not None and cached[0] == signature:
+            return row_key, cached
+        return row_key, (signature, self.build_row(item))
+
+    def _target_controls(self) -> list:
+        if not self.items:
+            if self.empty_builder is None:
+                return []
+            if self._empty_control is None:
+                self._empty_control = self.empty_builder()
+            return [self._empty_control]
+
+        rows = {}
+        controls = []
+        for item in self.items[:self.limit]:
+            try:
+                row_key, row = self._row_for(item)
+            except (ValueError, KeyError, TypeError):
+                continue
+            if row_key in rows:
+                continue
+            rows[row_key] = row
+            controls.append(row[1])
+        self._rows = rows
+
+        hidden = len(self.items) - self.limit
+        if hidden > 0:
+            self._more_text.value = i18n_manager.t("list_show_more", count=min(hidden, self.page_size), total=hidden)
+            controls.append(self._more_control)
+        return controls
+
+    def _reconcile(self, target: list) -> bool:
+        current = self.container.controls
+        target_ids = {id(control) for control in target}
+        changed = False
+
+        for i in range(len(current) - 1, -1, -1):
+            if id(current[i]) not in target_ids:
+                del current[i]
+                changed = True
+
+        for i, control in enumerate(target):
+            if i < len(current) and current[i] is control:
+                continue
+            for j in range(i + 1, len(current)):
+                if current[j] is control:
+                    del current[j]
+                    break
+            current.insert(i, control)
+            changed = True
+
+        if len(current) > len(target):
+            del current[len(target):]
+            changed = True
+        return changed
+
+    def set_items(self, items, update: bool = True):
+        self.items = list(items)
+        if len(self.items) <= self.page_size:
+            self.limit = self.page_size
+        changed = self._reconcile(self._target_controls())
+        if update and changed:
+            self._update()
+
+    def refresh(self, update: bool = True):
+        self._rows = {}
+        self._empty_control = None
+        self.set_items(self.items, update)
+
+    def _show_more(self, e=None):
+        self.limit += self.page_size
+        if self._reconcile(self._target_controls()):
+            self._update()
+
+    def _update(self):
+        update_scheduler.request_update(self.container)
@@ -1,7 +1,12 @@
 import flet as ft
 import os
 import platform
+import threading
+import weakref
+from collections.abc import Mapping
 from data.storage import load_user_data, save_user_data
+from core import event_bus
+from core import update_scheduler
 
 FONT_NAME = "Microsoft YaHei"
 
@@ -43,6 +48,41 @@ class DarkColors:
     CARD_BG = ft.Colors.GREY_700
     CARD_SHADOW = ft.Colors.BLACK26
 
+SYSTEM_THEME_KEY = "system_theme_dark"
+SYSTEM_THEME_TIMEOUT = 2
+
+def _detect_system_dark() -> bool:
+    
+    system = platform.system()
+    
+    try:
+        if system == "Windows":
+            import winreg
+            registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
+            key = winreg.OpenKey(registry, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
+            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+            winreg.CloseKey(key)
+            return value != 1
+            
+        elif system == "Darwin":
+            import subprocess
+            result = subprocess.run(
+                ['defaults', 'read', '-g', 'AppleInterfaceStyle'],
+                capture_output=True, text=True, timeout=SYSTEM_THEME_TIMEOUT
+            )
+            return "Dark" in result.stdout
+            
+        else:
+            import subprocess
+            result = subprocess.run(
+                ['gsettings', 'get', 'org.gnome.desktop.interface', 'color-scheme'],
+                capture_output=True, text=True, timeout=SYSTEM_THEME_TIMEOUT
+            )
+            return "dark" in result.stdout.lower()
+                
+    except Exception:
+        return False
+
 class ThemeManager:
     _instance = None
     
@@ -55,12 +95,20 @@ class ThemeManager:
         if hasattr(self, '_initialized'):
             return
         self._initialized = True
-        self._subscribers = set()
+        self._subscribers = event_bus.WeakCallbackSet()
+        self._tracked = weakref.WeakKeyDictionary()
+        self._page = None
+        self._refreshing = False
+        self._detected_dark = None
+        self._lock = threading.Lock()
+        event_bus.register_debug_source("theme", self._subscribers.__len__)
         self._load_theme_preference()
+        self.refresh_system_theme()
     
     def _load_theme_preference(self):
         user_data = load_user_data()
         self.theme_mode = user_data.get("theme_mode", "system")
+        self._system_dark = bool(user_data.get(SYSTEM_THEME_KEY, False))
         self._update_colors()
     
     def _update_colors(self):
@@ -72,46 +120,67 @@ class ThemeManager:
             self.current_colors = self._get_system_theme_colors()
     
     def _get_system_theme_colors(self):
-        
-        system = platform.system()
-        
+        return DarkColors if self._system_dark else LightColors
+
+    def refresh_system_theme(self):
+        if self._refreshing:
+            return
+        self._refreshing = True
+        threading.Thread(target=self._refresh_system_theme, daemon=True).start()
+
+    def _refresh_system_theme(self):
         try:
-            if system == "Windows":
-                import winreg
-                registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-                key = winreg.OpenKey(registry, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
-                value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-                winreg.CloseKey(key)
-                return LightColors if value == 1 else DarkColors
-                
-            elif system == "Darwin":
-                import subprocess
-                result = subprocess.run(
-                    ['defaults', 'read', '-g', 'AppleInterfaceStyle'],
-                    capture_output=True, text=True
-                )
-                return DarkColors if "Dark" in result.stdout else LightColors
-                
-            else:
-                import subprocess
-                try:
-                    result = subprocess.run(
-                        ['gsettings', 'get', 'org.gnome.desktop.interface', 'color-scheme'],
-                        capture_output=True, text=True
-                    )
-                    return DarkColors if "dark" in result.stdout.lower() else LightColors
-                except Exception:
-                    return LightColors
-                    
-        except Exception:
-            return LightColors
+            dark = _detect_system_dark()
+        finally:
+            self._refreshing = False
+        with self._lock:
+            if self._page is None:
+                self._detected_dark = dark
+                return
+        event_bus.call_in_loop(self._on_system_theme_detected, dark)
+
+    def _on_system_theme_detected(self, dark: bool):
+        if dark == self._system_dark:
+            return
+        self._system_dark = dark
+        save_user_data({SYSTEM_THEME_KEY: dark})
+        if self.theme_mode == "system":
+            self._update_colors()
+            self._notify_subscribers()
     
     def set_theme(self, mode: str):
-        if mode in ["system", "light", "dark"]:
+        if mode in ["system", "light", "dark"] and mode != self.theme_mode:
             self.theme_mode = mode
             save_user_data({"theme_mode": mode})
             self._update_colors()
             self._notify_subscribers()
+            if mode == "system":
+                self.refresh_system_theme()
+
+    def attach_page(self, page):
+        with self._lock:
+            self._page = page
+            dark, self._detected_dark = self._detected_dark, None
+        if dark is not None:
+            self._on_system_theme_detected(dark)
+
+    def track(self, control, **bindings):
+        self._tracked[control] = bindings
+        return control
+
+    def track_card(self, control):
+        return self.track(control, bgcolor="CARD_BG", shadow="CARD_SHADOW")
+
+    def _restyle_tracked(self):
+        colors = self.current_colors
+        for control, bindings in list(self._tracked.items()):
+            for attr, color_key in bindings.items():
+                value = getattr(colors, color_key)
+                if attr == "shadow":
+                    control.shadow = ft.BoxShadow(blur_radius=10, color=value)
+                else:
+                    setattr(control, attr, value)
+        return list(self._tracked)
     
     def subscribe(self, callback):
         self._subscribers.add(callback)
@@ -120,21 +189,40 @@ class ThemeManager:
         self._subscribers.discard(callback)
     
     def _notify_subscribers(self):
-        for callback in self._subscribers:
+        restyled = self._restyle_tracked()
+        for callback in list(self._subscribers):
             try:
                 callback()
-            except Exception:
-                pass
+            except Exception as e:
+                print(f"Error in theme subscriber: {e}")
+        if self._page is not None and restyled:
+            update_scheduler.request_update(*restyled)
+
+class _LiveColors:
+
+    def __getattr__(self, name):
+        return getattr(theme_manager.current_colors, name)
+
+class _CardStyle(Mapping):
+
+    def _values(self) -> dict:
+        return get_card_style()
+
+    def __getitem__(self, key):
+        return self._values()[key]
+
+    def __iter__(self):
+        return iter(self._values())
+
+    def __len__(self):
+        return len(self._values())
+
+    def copy(self) -> dict:
+        return self._values()
 
 theme_manager = ThemeManager()
-AppColors = theme_manager.current_colors
-
-CARD_STYLE = {
-    "padding": 20,
-    "bgcolor": AppColors.CARD_BG,
-    "border_radius": 15,
-    "shadow": ft.BoxShadow(blur_radius=10, color=AppColors.CARD_SHADOW)
-}
+AppColors = _LiveColors()
+CARD_STYLE = _CardStyle()
 
 def get_card_style():
     return {